@@ -173,14 +173,14 @@ def main():
     if all_tasks:
         task_to_complete = all_tasks[0]
         print(f"🔄 Marquage de '{task_to_complete.title}' comme terminée...")
-        task_to_complete.mark_completed()
+        manager.update_task(task_to_complete.id, status=Status.COMPLETED)
         print("✅ Tâche marquée comme terminée!")
     
     # Changer la priorité d'une tâche
     if len(all_tasks) > 1:
         task_to_update = all_tasks[1]
         print(f"🔄 Changement de priorité pour '{task_to_update.title}'...")
-        task_to_update.update_priority(Priority.URGENT)
+        manager.update_task(task_to_update.id, priority=Priority.URGENT)
         print("✅ Priorité mise à jour!")
     
     # 5. Filtrage des tâches
@@ -6,6 +6,12 @@ Ce package contient les classes principales pour la gestion des tâches.
 
 from .task import Task, Priority, Status
 from .manager import TaskManager
+from .query import Q
+from .pagination import TaskPage
+from .events import ChangeEvent
+from .async_manager import AsyncTaskManager
+from .sharding import ShardedTaskManager
 from .services import EmailService, ReportService
 
-__all__ = ['Task', 'Priority', 'Status', 'TaskManager', 'EmailService', 'ReportService'] 
\ No newline at end of file
+__all__ = ['Task', 'Priority', 'Status', 'TaskManager', 'Q', 'TaskPage', 'ChangeEvent', 'AsyncTaskManager',
+           'ShardedTaskManager', 'EmailService', 'ReportService'] 
\ No newline at end of file
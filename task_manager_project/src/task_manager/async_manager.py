@@ -0,0 +1,174 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .task import Task, Priority, Status
+from .manager import TaskManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTaskManager:
+    """
+    Façade asyncio du gestionnaire de tâches
+
+    Toutes les opérations s'exécutent dans un exécuteur, hors de la boucle
+    d'événements. Les mutations sont appliquées en mémoire sans sauvegarde
+    immédiate ; la persistance est regroupée en une seule écriture pour
+    toutes les mutations survenues pendant flush_delay secondes.
+    """
+
+    def __init__(self, manager: TaskManager, flush_delay: float = 0.05,
+                 executor: Optional[Executor] = None):
+        """
+        Enveloppe un gestionnaire existant
+
+        Args:
+            manager: Gestionnaire à envelopper (sa sauvegarde automatique est
+                désactivée au profit des écritures regroupées)
+            flush_delay: Délai (en secondes) de regroupement des écritures
+            executor: Exécuteur utilisé (celui de la boucle par défaut si None)
+        """
+        manager.autosave = False
+        self.manager = manager
+        self.flush_delay = flush_delay
+        self._executor = executor
+        self._flush_future: Optional[asyncio.Future] = None
+
+    @classmethod
+    async def open(cls, storage_file: str = "tasks.json", flush_delay: float = 0.05,
+                   executor: Optional[Executor] = None, **options: Any) -> 'AsyncTaskManager':
+        """
+        Crée un gestionnaire en chargeant le stockage hors de la boucle
+
+        Args:
+            storage_file: Chemin vers le fichier de stockage
+            flush_delay: Délai (en secondes) de regroupement des écritures
+            executor: Exécuteur utilisé (celui de la boucle par défaut si None)
+            **options: Options transmises à TaskManager
+
+        Returns:
+            Gestionnaire asynchrone prêt à l'emploi
+        """
+        loop = asyncio.get_running_loop()
+        manager = await loop.run_in_executor(
+            executor, functools.partial(TaskManager, storage_file, autosave=False, **options)
+        )
+        return cls(manager, flush_delay=flush_delay, executor=executor)
+
+    async def _run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Exécute un appel bloquant dans l'exécuteur"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _mutate(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Exécute une mutation puis planifie une écriture regroupée"""
+        result = await self._run(func, *args, **kwargs)
+        self._schedule_flush()
+        return result
+
+    def _schedule_flush(self) -> None:
+        """Planifie une écriture si aucune n'est déjà prévue"""
+        if self._flush_future is None or self._flush_future.done():
+            self._flush_future = asyncio.ensure_future(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        """Attend le délai de regroupement puis persiste"""
+        await asyncio.sleep(self.flush_delay)
+        try:
+            await self._run(self.manager.flush)
+        except Exception:
+            # Les mutations restent en attente : la prochaine écriture réessaiera
+            logger.exception("Erreur lors de la sauvegarde des tâches")
+
+    async def add_task(self, task: Task) -> str:
+        """
+        Ajoute une tâche au gestionnaire
+
+        Raises:
+            ValueError: Si la tâche a déjà un ID existant
+        """
+        return await self._mutate(self.manager.add_task, task)
+
+    async def add_tasks(self, tasks: Iterable[Task]) -> List[str]:
+        """Ajoute plusieurs tâches (voir TaskManager.add_tasks)"""
+        return await self._mutate(self.manager.add_tasks, list(tasks))
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """Récupère une tâche par son ID"""
+        return await self._run(self.manager.get_task, task_id)
+
+    async def update_task(self, task_id: str, **kwargs: Any) -> bool:
+        """Met à jour une tâche existante"""
+        return await self._mutate(self.manager.update_task, task_id, **kwargs)
+
+    async def update_tasks(self, updates: Any) -> List[bool]:
+        """Met à jour plusieurs tâches (voir TaskManager.update_tasks)"""
+        return await self._mutate(self.manager.update_tasks, updates)
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Supprime une tâche par son ID"""
+        return await self._mutate(self.manager.delete_task, task_id)
+
+    async def delete_tasks(self, task_ids: Iterable[str]) -> List[bool]:
+        """Supprime plusieurs tâches (voir TaskManager.delete_tasks)"""
+        return await self._mutate(self.manager.delete_tasks, list(task_ids))
+
+    async def get_all_tasks(self) -> List[Task]:
+        """Récupère toutes les tâches"""
+        return await self._run(self.manager.get_all_tasks)
+
+    async def get_tasks_by_status(self, status: Status) -> List[Task]:
+        """Récupère toutes les tâches avec un statut donné"""
+        return await self._run(self.manager.get_tasks_by_status, status)
+
+    async def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
+        """Récupère toutes les tâches avec une priorité donnée"""
+        return await self._run(self.manager.get_tasks_by_priority, priority)
+
+    async def get_tasks_by_project(self, project: str) -> List[Task]:
+        """Récupère toutes les tâches d'un projet"""
+        return await self._run(self.manager.get_tasks_by_project, project)
+
+    async def get_tasks_by_assignee(self, assignee: str) -> List[Task]:
+        """Récupère toutes les tâches assignées à une personne"""
+        return await self._run(self.manager.get_tasks_by_assignee, assignee)
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Calcule les statistiques des tâches"""
+        return await self._run(self.manager.get_statistics)
+
+    async def flush(self) -> None:
+        """
+        Persiste immédiatement les mutations en attente
+
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        if self._flush_future is not None and not self._flush_future.done():
+            self._flush_future.cancel()
+        await self._run(self.manager.flush)
+
+    async def close(self) -> None:
+        """
+        Persiste les mutations en attente et ferme le gestionnaire
+
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        if self._flush_future is not None and not self._flush_future.done():
+            self._flush_future.cancel()
+        await self._run(self.manager.close)
+
+    async def __aenter__(self) -> 'AsyncTaskManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        """Retourne le nombre de tâches"""
+        return len(self.manager)
@@ -0,0 +1,98 @@
+import os
+import stat
+import uuid
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Tuple
+
+
+# Politiques de synchronisation disque (fsync) :
+# - 'always' : chaque écriture est synchronisée, ainsi que le dossier après renommage
+# - 'batch'  : une synchronisation par opération de persistance (sauvegarde, lot, flush)
+# - 'never'  : aucune synchronisation (le remplacement reste atomique)
+FSYNC_POLICIES = ('always', 'batch', 'never')
+
+
+def _create_temp(path: str) -> Tuple[int, str]:
+    """
+    Crée un fichier temporaire exclusif à côté d'un fichier cible
+
+    Contrairement à tempfile.mkstemp (droits 0600), le fichier est créé
+    avec les droits d'un open() ordinaire (0666 filtrés par le umask du
+    processus, appliqué par le système) : le umask n'est jamais modifié.
+
+    Args:
+        path: Fichier cible
+
+    Returns:
+        Descripteur ouvert en écriture et chemin du fichier temporaire
+    """
+    dirname, basename = os.path.split(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        tmp_path = os.path.join(dirname, f".{basename}.{uuid.uuid4().hex[:12]}.tmp")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def fsync_directory(dirname: str) -> None:
+    """
+    Synchronise un dossier pour rendre durable un renommage qu'il contient
+
+    Args:
+        dirname: Dossier à synchroniser
+    """
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Non supporté (Windows) : le renommage reste atomique
+    fd = os.open(dirname, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w', encoding: Optional[str] = 'utf-8',
+                 fsync: bool = True, fsync_dir: bool = False) -> Iterator[IO]:
+    """
+    Écrit un fichier de façon atomique (fichier temporaire puis renommage)
+
+    Le contenu est écrit dans un fichier temporaire du même dossier, qui
+    remplace la cible uniquement si l'écriture s'est terminée sans erreur :
+    un crash ne laisse jamais un fichier tronqué.
+
+    Args:
+        path: Fichier à écrire
+        mode: Mode d'ouverture ('w' ou 'wb')
+        encoding: Encodage en mode texte
+        fsync: Si True, synchronise le contenu sur disque avant le renommage
+        fsync_dir: Si True, synchronise aussi le dossier après le renommage
+
+    Returns:
+        Fichier temporaire ouvert en écriture
+    """
+    dirname = os.path.dirname(path) or '.'
+    fd, tmp_path = _create_temp(os.path.join(dirname, os.path.basename(path)))
+    try:
+        # Un fichier remplacé garde ses droits
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync_dir:
+        fsync_directory(dirname)
@@ -0,0 +1,277 @@
+import logging
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .task import Task
+
+
+logger = logging.getLogger(__name__)
+
+CREATED = 'created'
+UPDATED = 'updated'
+DELETED = 'deleted'
+EVENT_KINDS = (CREATED, UPDATED, DELETED)
+
+
+class ChangeEvent:
+    """
+    Changement d'une tâche
+
+    Attributes:
+        sequence: Numéro d'ordre croissant dans le flux ; un numéro sauté
+            signale un rechargement sans événements (voir ChangeFeed.reset)
+        kind: 'created', 'updated' ou 'deleted'
+        task_id: ID de la tâche
+        task: Copie de la tâche après le changement (avant la suppression
+            pour 'deleted'), figée au moment de l'événement
+        changes: Pour 'updated', champ -> (ancienne valeur, nouvelle valeur)
+            des champs modifiés
+        timestamp: Date du changement (ISO 8601)
+    """
+
+    __slots__ = ('sequence', 'kind', 'task_id', 'task', 'changes', 'timestamp')
+
+    def __init__(self, sequence: int, kind: str, task_id: str, task: Optional[Task],
+                 changes: Optional[Dict[str, Tuple[Any, Any]]] = None):
+        self.sequence = sequence
+        self.kind = kind
+        self.task_id = task_id
+        self.task = task
+        self.changes = changes or {}
+        self.timestamp = datetime.now().isoformat()
+
+    def __repr__(self) -> str:
+        return f"ChangeEvent(#{self.sequence} {self.kind} {self.task_id}, changes={sorted(self.changes)})"
+
+
+def _check_kinds(kinds: Optional[Iterable[str]]) -> Optional[frozenset]:
+    """Valide un filtre de types d'événements"""
+    if kinds is None:
+        return None
+    kinds = frozenset(kinds)
+    unknown = kinds.difference(EVENT_KINDS)
+    if unknown:
+        raise ValueError(f"Types d'événements inconnus : {', '.join(sorted(unknown))}")
+    return kinds
+
+
+class Subscription:
+    """Abonnement synchrone : la fonction est appelée à chaque changement"""
+
+    def __init__(self, feed: 'ChangeFeed', callback: Optional[Callable[[ChangeEvent], None]],
+                 kinds: Optional[Iterable[str]] = None):
+        self._feed = feed
+        self._callback = callback
+        self.kinds = _check_kinds(kinds)
+
+    def deliver(self, event: ChangeEvent) -> None:
+        """Transmet un événement à l'abonné"""
+        self._callback(event)
+
+    def unsubscribe(self) -> None:
+        """Met fin à l'abonnement"""
+        self._feed.unsubscribe(self)
+
+    def __enter__(self) -> 'Subscription':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unsubscribe()
+
+
+class QueueSubscription(Subscription):
+    """
+    Abonnement par file bornée, consommée par un autre thread
+
+    L'écrivain n'attend jamais : si la file est pleine, l'événement est
+    abandonné et compté dans dropped. L'abonné peut alors se resynchroniser
+    avec changes_since() à partir du dernier numéro de séquence consommé.
+    """
+
+    def __init__(self, feed: 'ChangeFeed', maxsize: int = 1000, kinds: Optional[Iterable[str]] = None):
+        if maxsize <= 0:
+            raise ValueError("La taille de la file doit être positive")
+        super().__init__(feed, None, kinds)
+        self._queue: 'queue.Queue[ChangeEvent]' = queue.Queue(maxsize)
+        self.dropped = 0
+
+    def deliver(self, event: ChangeEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ChangeEvent]:
+        """
+        Attend le prochain événement
+
+        Args:
+            timeout: Attente maximale en secondes (indéfinie si None)
+
+        Returns:
+            Événement, ou None si le délai est écoulé
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def drain(self) -> List[ChangeEvent]:
+        """
+        Récupère sans attendre tous les événements en file
+
+        Returns:
+            Événements, dans l'ordre
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+
+class ChangeFeed:
+    """
+    Flux des changements d'un TaskManager
+
+    Chaque changement reçoit un numéro de séquence, est transmis aux
+    abonnés puis conservé dans un historique borné, pour que les structures
+    dérivées (caches, index, rappels) se mettent à jour incrémentalement
+    avec changes_since() au lieu de tout recalculer.
+    """
+
+    def __init__(self, history: int = 10000):
+        """
+        Initialise un flux vide
+
+        Args:
+            history: Nombre d'événements conservés pour changes_since()
+        """
+        if history < 0:
+            raise ValueError("La taille de l'historique doit être positive")
+        self._history: deque = deque(maxlen=history)
+        self._sequence = 0
+        # Séquence en deçà de laquelle l'historique est incomplet (voir reset())
+        self._floor = 0
+        # Remplacé (jamais modifié) pour être parcouru sans verrou
+        self._subscribers: Tuple[Subscription, ...] = ()
+        self._subscribers_lock = threading.Lock()
+
+    @property
+    def sequence(self) -> int:
+        """Numéro de séquence du dernier événement (0 si aucun)"""
+        return self._sequence
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None],
+                  kinds: Optional[Iterable[str]] = None) -> Subscription:
+        """
+        Abonne une fonction, appelée de façon synchrone à chaque changement
+
+        Args:
+            callback: Fonction recevant un ChangeEvent ; ses exceptions sont
+                consignées sans interrompre l'écriture
+            kinds: Types d'événements à recevoir (tous si None)
+
+        Returns:
+            Abonnement (unsubscribe() y met fin)
+
+        Raises:
+            ValueError: Si un type d'événement est inconnu
+        """
+        return self._add(Subscription(self, callback, kinds))
+
+    def subscribe_queue(self, maxsize: int = 1000, kinds: Optional[Iterable[str]] = None) -> QueueSubscription:
+        """
+        Abonne une file bornée (voir QueueSubscription)
+
+        Args:
+            maxsize: Capacité de la file
+            kinds: Types d'événements à recevoir (tous si None)
+
+        Returns:
+            Abonnement, dont get() et drain() lisent les événements
+
+        Raises:
+            ValueError: Si la capacité ou un type d'événement est invalide
+        """
+        return self._add(QueueSubscription(self, maxsize, kinds))
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        with self._subscribers_lock:
+            self._subscribers = self._subscribers + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Met fin à un abonnement
+
+        Args:
+            subscription: Abonnement retourné par subscribe()
+        """
+        with self._subscribers_lock:
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscription)
+
+    def publish(self, kind: str, task_id: str, task: Optional[Task],
+                changes: Optional[Dict[str, Tuple[Any, Any]]] = None) -> ChangeEvent:
+        """
+        Numérote, conserve et transmet un changement
+
+        Args:
+            kind: Type d'événement (voir EVENT_KINDS)
+            task_id: ID de la tâche
+            task: Tâche concernée
+            changes: Champs modifiés (mises à jour)
+
+        Returns:
+            Événement publié
+        """
+        self._sequence += 1
+        event = ChangeEvent(self._sequence, kind, task_id, task, changes)
+        self._history.append(event)
+        for subscription in self._subscribers:
+            if subscription.kinds is not None and kind not in subscription.kinds:
+                continue
+            try:
+                subscription.deliver(event)
+            except Exception:
+                logger.exception("Erreur d'un abonné au flux de changements (événement #%d)", event.sequence)
+        return event
+
+    def changes_since(self, sequence: int) -> List[ChangeEvent]:
+        """
+        Récupère les changements postérieurs à un numéro de séquence
+
+        Args:
+            sequence: Dernier numéro de séquence déjà traité (0 : depuis le début)
+
+        Returns:
+            Événements de numéro supérieur, dans l'ordre
+
+        Raises:
+            ValueError: Si une partie de ces changements n'est plus conservée :
+                l'appelant doit alors se resynchroniser entièrement (par
+                exemple depuis un instantané)
+        """
+        if sequence >= self._sequence:
+            return []
+        first = self._history[0].sequence if self._history else self._sequence + 1
+        if sequence < self._floor or sequence + 1 < first:
+            raise ValueError(f"Les changements postérieurs à la séquence {sequence} ne sont plus tous conservés")
+        return list(islice(self._history, sequence + 1 - first, None))
+
+    def reset(self) -> None:
+        """
+        Marque l'historique comme incomplet
+
+        Appelé quand les tâches changent sans événement (rechargement
+        complet) : la séquence avance d'un cran et changes_since() refuse
+        ensuite toute séquence antérieure.
+        """
+        self._history.clear()
+        self._sequence += 1
+        self._floor = self._sequence
@@ -0,0 +1,208 @@
+import gzip
+import io
+import json
+import lzma
+import marshal
+import struct
+import zlib
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional
+
+from .streaming import iter_json_array
+
+
+# Formats de fichier : JSON indenté (historique), JSON compact, binaire
+FILE_FORMATS = ('json', 'json-min', 'binary')
+COMPRESSIONS = (None, 'gzip', 'zlib', 'lzma')
+
+# Format binaire : en-tête, puis pour chaque tâche une longueur (4 octets,
+# big-endian) suivie du tuple des champs sérialisé avec marshal
+BINARY_MAGIC = b'TMB1'
+BINARY_FIELDS = ('id', 'title', 'description', 'priority', 'status', 'project',
+                 'assignee', 'due_date', 'created_at', 'updated_at')
+_LENGTH = struct.Struct('>I')
+_MARSHAL_VERSION = 4
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_LZMA_MAGIC = b'\xfd7zXZ\x00'
+
+
+class _ZlibWriter(io.RawIOBase):
+    """Flux d'écriture compressant avec zlib vers un fichier"""
+
+    def __init__(self, f: BinaryIO, level: int = 9):
+        self._f = f
+        self._compressor = zlib.compressobj(level)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._f.write(self._compressor.compress(bytes(data)))
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._f.write(self._compressor.flush())
+        super().close()
+
+
+class _ZlibReader(io.RawIOBase):
+    """Flux de lecture décompressant un fichier zlib"""
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self._decompressor = zlib.decompressobj()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = len(buffer)
+        while True:
+            if self._decompressor.unconsumed_tail:
+                data = self._decompressor.decompress(self._decompressor.unconsumed_tail, size)
+            elif self._decompressor.eof:
+                return 0
+            else:
+                chunk = self._f.read(65536)
+                if not chunk:
+                    raise zlib.error("Flux zlib tronqué")
+                data = self._decompressor.decompress(chunk, size)
+            if data:
+                buffer[:len(data)] = data
+                return len(data)
+
+
+def _compressing_stream(f: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    """Enveloppe un fichier dans un flux compressant (sans le fermer à la fin)"""
+    if compression is None:
+        return f
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=f, mode='wb')
+    if compression == 'lzma':
+        return lzma.LZMAFile(f, mode='wb')
+    if compression == 'zlib':
+        return io.BufferedWriter(_ZlibWriter(f))
+    raise ValueError(f"Compression inconnue : {compression}")
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """
+    Détecte la compression d'un fichier à partir de ses premiers octets
+
+    Args:
+        head: Premiers octets du fichier (au moins 6)
+
+    Returns:
+        'gzip', 'lzma', 'zlib' ou None si le fichier n'est pas compressé
+    """
+    if head.startswith(_GZIP_MAGIC):
+        return 'gzip'
+    if head.startswith(_LZMA_MAGIC):
+        return 'lzma'
+    # En-tête zlib : méthode deflate (0x78) et somme de contrôle multiple de 31
+    if len(head) >= 2 and head[0] == 0x78 and (head[0] * 256 + head[1]) % 31 == 0:
+        return 'zlib'
+    return None
+
+
+def _decompressing_stream(f: BinaryIO, compression: Optional[str]) -> BinaryIO:
+    """Enveloppe un fichier dans un flux décompressant offrant peek()"""
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=f, mode='rb')
+    if compression == 'lzma':
+        return lzma.LZMAFile(f, mode='rb')
+    if compression == 'zlib':
+        return io.BufferedReader(_ZlibReader(f))
+    return f
+
+
+def dump_tasks(records: Iterable[Dict[str, Any]], f: BinaryIO, file_format: str = 'json',
+               compression: Optional[str] = None) -> None:
+    """
+    Écrit des tâches sérialisées (to_dict) dans un fichier binaire ouvert
+
+    Args:
+        records: Dictionnaires des tâches
+        f: Fichier ouvert en écriture binaire (il n'est pas fermé)
+        file_format: 'json' (indenté), 'json-min' (compact) ou 'binary'
+        compression: None, 'gzip', 'zlib' ou 'lzma'
+
+    Raises:
+        ValueError: Si le format ou la compression est inconnu
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Format de fichier inconnu : {file_format}")
+
+    stream = _compressing_stream(f, compression)
+    if file_format == 'binary':
+        stream.write(BINARY_MAGIC)
+        for record in records:
+            payload = marshal.dumps(tuple(record[field] for field in BINARY_FIELDS), _MARSHAL_VERSION)
+            stream.write(_LENGTH.pack(len(payload)))
+            stream.write(payload)
+    else:
+        text = io.TextIOWrapper(stream, encoding='utf-8')
+        if file_format == 'json':
+            json.dump(list(records), text, indent=2, ensure_ascii=False)
+        else:
+            json.dump(list(records), text, separators=(',', ':'), ensure_ascii=False)
+        text.flush()
+        text.detach()
+
+    if stream is not f:
+        stream.close()
+
+
+def _iter_binary_records(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Itère sur les enregistrements du format binaire"""
+    if stream.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError("En-tête du format binaire invalide")
+    while True:
+        header = stream.read(_LENGTH.size)
+        if not header:
+            return
+        if len(header) < _LENGTH.size:
+            raise ValueError("Enregistrement binaire tronqué")
+        (length,) = _LENGTH.unpack(header)
+        payload = stream.read(length)
+        if len(payload) < length:
+            raise ValueError("Enregistrement binaire tronqué")
+        try:
+            fields = marshal.loads(payload)
+        except (EOFError, TypeError) as e:
+            raise ValueError(f"Enregistrement binaire invalide : {e}")
+        if not isinstance(fields, tuple) or len(fields) != len(BINARY_FIELDS):
+            # Laissé à Task.from_dict, qui le signalera comme tâche invalide
+            yield {'invalid_record': fields}
+            continue
+        yield dict(zip(BINARY_FIELDS, fields))
+
+
+def iter_task_records(path: str) -> Iterator[Any]:
+    """
+    Itère en flux sur les enregistrements de tâches d'un fichier
+
+    Le format (JSON ou binaire) et la compression sont détectés
+    automatiquement.
+
+    Args:
+        path: Fichier à lire
+
+    Returns:
+        Itérateur sur les enregistrements (dictionnaires pour un fichier valide)
+
+    Raises:
+        json.JSONDecodeError: Si le fichier JSON est invalide
+        ValueError: Si le fichier binaire ou compressé est invalide
+    """
+    with open(path, 'rb') as f:
+        compression = detect_compression(f.peek(8)[:8])
+        try:
+            stream = _decompressing_stream(f, compression)
+            if stream.peek(len(BINARY_MAGIC))[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+                yield from _iter_binary_records(stream)
+            else:
+                yield from iter_json_array(io.TextIOWrapper(stream, encoding='utf-8'))
+        except (OSError, EOFError, lzma.LZMAError, zlib.error) as e:
+            raise ValueError(f"Fichier compressé ({compression}) invalide : {e}")
@@ -0,0 +1,428 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, KeysView, List, Optional, Tuple
+
+from .task import Task
+from .search import SearchIndex
+from .pagination import order_key
+
+
+INDEXED_FIELDS = ('status', 'priority', 'project', 'assignee')
+
+
+def due_key(value: Any) -> Optional[datetime]:
+    """
+    Convertit une échéance en date comparable
+
+    Les chaînes ISO 8601 et les dates sont acceptées ; une échéance avec
+    fuseau horaire est convertie en heure locale, pour être comparable à
+    datetime.now().
+
+    Args:
+        value: Échéance (chaîne ISO, datetime, date ou None)
+
+    Returns:
+        Date locale sans fuseau, ou None si l'échéance est absente ou illisible
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        if not isinstance(value, date):
+            return None
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
+class DueDateIndex:
+    """
+    Index trié des tâches par échéance
+
+    Les échéances sont gardées triées (bisect) : une recherche par intervalle
+    coûte O(log n + k) pour k résultats. Les tâches sans échéance ou dont
+    l'échéance est illisible ne sont pas indexées.
+    """
+
+    def __init__(self):
+        """Initialise un index vide"""
+        # Listes parallèles triées par échéance
+        self._dates: List[datetime] = []
+        self._ids: List[str] = []
+        self._keys: Dict[str, datetime] = {}
+
+    def add(self, task_id: str, due_date: Any) -> None:
+        """
+        Indexe l'échéance d'une tâche (la désindexe d'abord si elle l'était)
+
+        Args:
+            task_id: ID de la tâche
+            due_date: Échéance (voir due_key)
+        """
+        self.remove(task_id)
+        key = due_key(due_date)
+        if key is None:
+            return
+        position = bisect_right(self._dates, key)
+        self._dates.insert(position, key)
+        self._ids.insert(position, task_id)
+        self._keys[task_id] = key
+
+    def remove(self, task_id: str) -> None:
+        """
+        Retire une tâche de l'index
+
+        Args:
+            task_id: ID de la tâche
+        """
+        key = self._keys.pop(task_id, None)
+        if key is None:
+            return
+        position = bisect_left(self._dates, key)
+        position = self._ids.index(task_id, position, bisect_right(self._dates, key))
+        del self._dates[position]
+        del self._ids[position]
+
+    def rebuild(self, entries: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Reconstruit l'index en un seul tri
+
+        Args:
+            entries: Couples (ID de tâche, échéance)
+        """
+        keyed = []
+        for task_id, due_date in entries:
+            key = due_key(due_date)
+            if key is not None:
+                keyed.append((key, task_id))
+        keyed.sort(key=lambda entry: entry[0])
+        self._dates = [key for key, _ in keyed]
+        self._ids = [task_id for _, task_id in keyed]
+        self._keys = {task_id: key for key, task_id in keyed}
+
+    def _bounds(self, start: Any, end: Any, include_end: bool) -> Tuple[int, int]:
+        """Positions délimitant les échéances de l'intervalle"""
+        start_key, end_key = due_key(start), due_key(end)
+        low = bisect_left(self._dates, start_key) if start_key is not None else 0
+        if end_key is None:
+            high = len(self._dates)
+        elif include_end:
+            high = bisect_right(self._dates, end_key)
+        else:
+            high = bisect_left(self._dates, end_key)
+        return low, max(low, high)
+
+    def range(self, start: Any = None, end: Any = None, include_end: bool = False) -> Iterator[str]:
+        """
+        Itère sur les IDs des tâches dont l'échéance est dans l'intervalle
+
+        Args:
+            start: Borne inférieure incluse (None : pas de borne)
+            end: Borne supérieure (None : pas de borne)
+            include_end: Si True, la borne supérieure est incluse
+
+        Returns:
+            Itérateur sur les IDs, par échéance croissante
+        """
+        low, high = self._bounds(start, end, include_end)
+        return iter(self._ids[low:high])
+
+    def count(self, start: Any = None, end: Any = None, include_end: bool = False) -> int:
+        """
+        Compte les tâches dont l'échéance est dans l'intervalle, en O(log n)
+
+        Args:
+            start: Borne inférieure incluse (None : pas de borne)
+            end: Borne supérieure (None : pas de borne)
+            include_end: Si True, la borne supérieure est incluse
+
+        Returns:
+            Nombre de tâches
+        """
+        low, high = self._bounds(start, end, include_end)
+        return high - low
+
+    def clear(self) -> None:
+        """Vide l'index"""
+        self._dates.clear()
+        self._ids.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        """Retourne le nombre de tâches indexées"""
+        return len(self._ids)
+
+
+class OrderIndex:
+    """
+    Index trié des tâches selon un ordre de pagination (voir order_key)
+
+    Une page se retrouve par bisection à partir de la clé de la dernière
+    tâche lue : O(log n + k) pour k tâches, quelle que soit la profondeur.
+    Les tâches créées en dernier s'ajoutent en fin de liste sans décalage.
+    """
+
+    def __init__(self, order_by: str):
+        """
+        Initialise un index vide
+
+        Args:
+            order_by: Ordre de pagination ('created_at' ou 'id')
+        """
+        self.order_by = order_by
+        self._entries: List[Tuple[str, str]] = []
+        self._keys: Dict[str, Tuple[str, str]] = {}
+
+    def add(self, task: Task) -> None:
+        """
+        Indexe une tâche (la désindexe d'abord si elle l'était)
+
+        Args:
+            task: Tâche à indexer
+        """
+        key = order_key(task, self.order_by)
+        if self._keys.get(task.id) == key:
+            return
+        self.remove(task.id)
+        insort(self._entries, key)
+        self._keys[task.id] = key
+
+    def remove(self, task_id: str) -> None:
+        """
+        Retire une tâche de l'index
+
+        Args:
+            task_id: ID de la tâche
+        """
+        key = self._keys.pop(task_id, None)
+        if key is not None:
+            del self._entries[bisect_left(self._entries, key)]
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """
+        Reconstruit l'index en un seul tri
+
+        Args:
+            tasks: Ensemble des tâches à indexer
+        """
+        self._keys = {task.id: order_key(task, self.order_by) for task in tasks}
+        self._entries = sorted(self._keys.values())
+
+    def after(self, key: Optional[Tuple[str, str]] = None, descending: bool = False) -> Iterator[str]:
+        """
+        Itère sur les IDs qui suivent une clé dans l'ordre de parcours
+
+        L'itérateur doit être consommé sans mutation concurrente de l'index.
+
+        Args:
+            key: Clé de la dernière tâche déjà lue (None : depuis le début)
+            descending: Si True, parcours dans l'ordre décroissant
+
+        Returns:
+            Itérateur sur les IDs
+        """
+        entries = self._entries
+        if descending:
+            position = len(entries) if key is None else bisect_left(entries, key)
+            return (entries[i][1] for i in range(position - 1, -1, -1))
+        position = 0 if key is None else bisect_right(entries, key)
+        return (entries[i][1] for i in range(position, len(entries)))
+
+    def clear(self) -> None:
+        """Vide l'index"""
+        self._entries.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        """Retourne le nombre de tâches indexées"""
+        return len(self._entries)
+
+
+class TaskIndex:
+    """Index secondaires (valeur -> IDs de tâches) sur les champs filtrables"""
+
+    def __init__(self, fields: Tuple[str, ...] = INDEXED_FIELDS):
+        """
+        Initialise des index vides
+
+        Args:
+            fields: Noms des attributs de Task à indexer
+        """
+        self.fields = fields
+        # Pour chaque champ : valeur -> ensemble ordonné d'IDs (dict à valeurs None)
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {field: {} for field in fields}
+        # Valeurs indexées pour chaque tâche, pour pouvoir la désindexer
+        # même si l'objet a été modifié entre-temps
+        self._keys: Dict[str, Tuple[Any, ...]] = {}
+        self.due_dates = DueDateIndex()
+        # Index plein texte, construit à la première recherche
+        self.text: Optional[SearchIndex] = None
+        # Index de pagination, construits à la première page demandée
+        self.orders: Dict[str, OrderIndex] = {}
+
+    def add(self, task: Task) -> None:
+        """
+        Indexe une tâche (la désindexe d'abord si elle l'était déjà)
+
+        Args:
+            task: Tâche à indexer
+        """
+        if task.id in self._keys:
+            self.remove(task.id)
+
+        self._add_fields(task)
+        self.due_dates.add(task.id, task.due_date)
+        if self.text is not None:
+            self.text.add(task)
+        for order in self.orders.values():
+            order.add(task)
+
+    def _add_fields(self, task: Task) -> None:
+        """Indexe les champs à valeurs discrètes d'une tâche non indexée"""
+        keys = tuple(getattr(task, field) for field in self.fields)
+        for field, value in zip(self.fields, keys):
+            self._indexes[field].setdefault(value, {})[task.id] = None
+        self._keys[task.id] = keys
+
+    def remove(self, task_id: str) -> None:
+        """
+        Retire une tâche des index
+
+        Args:
+            task_id: ID de la tâche à désindexer
+        """
+        self.due_dates.remove(task_id)
+        if self.text is not None:
+            self.text.remove(task_id)
+        for order in self.orders.values():
+            order.remove(task_id)
+        keys = self._keys.pop(task_id, None)
+        if keys is None:
+            return
+
+        for field, value in zip(self.fields, keys):
+            bucket = self._indexes[field].get(value)
+            if bucket is None:
+                continue
+            bucket.pop(task_id, None)
+            if not bucket:
+                del self._indexes[field][value]
+
+    def lookup(self, field: str, value: Any) -> KeysView:
+        """
+        Récupère les IDs des tâches dont le champ vaut la valeur donnée
+
+        Args:
+            field: Champ indexé
+            value: Valeur recherchée
+
+        Returns:
+            Vue (en ordre d'indexation) sur les IDs correspondants
+        """
+        return self._indexes[field].get(value, {}).keys()
+
+    def counts(self, field: str) -> Dict[Any, int]:
+        """
+        Compte les tâches par valeur d'un champ indexé
+
+        Args:
+            field: Champ indexé
+
+        Returns:
+            Dictionnaire valeur -> nombre de tâches (valeurs présentes uniquement)
+        """
+        return {value: len(bucket) for value, bucket in self._indexes[field].items()}
+
+    def clear(self) -> None:
+        """Vide tous les index"""
+        for index in self._indexes.values():
+            index.clear()
+        self._keys.clear()
+        self.due_dates.clear()
+        if self.text is not None:
+            self.text.clear()
+        for order in self.orders.values():
+            order.clear()
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """
+        Reconstruit entièrement les index
+
+        Args:
+            tasks: Ensemble des tâches à indexer
+        """
+        self.clear()
+        due_dates = []
+        indexed = []
+        for task in tasks:
+            self._add_fields(task)
+            due_dates.append((task.id, task.due_date))
+            if self.text is not None:
+                self.text.add(task)
+            if self.orders:
+                indexed.append(task)
+        self.due_dates.rebuild(due_dates)
+        for order in self.orders.values():
+            order.rebuild(indexed)
+
+    def enable_full_text(self, tasks: Iterable[Task]) -> None:
+        """
+        Construit l'index plein texte, tenu à jour ensuite par add/remove
+
+        Args:
+            tasks: Ensemble des tâches à indexer
+        """
+        self.text = SearchIndex()
+        for task in tasks:
+            self.text.add(task)
+
+    def enable_order(self, order_by: str, tasks: Iterable[Task]) -> OrderIndex:
+        """
+        Construit un index de pagination, tenu à jour ensuite par add/remove
+
+        Args:
+            order_by: Ordre de pagination ('created_at' ou 'id')
+            tasks: Ensemble des tâches à indexer
+
+        Returns:
+            Index construit
+        """
+        order = OrderIndex(order_by)
+        order.rebuild(tasks)
+        self.orders[order_by] = order
+        return order
+
+    def disable_full_text(self) -> None:
+        """Abandonne l'index plein texte (reconstruit à la prochaine recherche)"""
+        self.text = None
+
+    def __len__(self) -> int:
+        """Retourne le nombre de tâches indexées"""
+        return len(self._keys)
+
+
+class NullTaskIndex(TaskIndex):
+    """
+    Index inactif, pour les backends qui exécutent eux-mêmes les filtres
+
+    Seul l'index plein texte, une fois construit, est tenu à jour.
+    """
+
+    def __init__(self):
+        super().__init__(fields=())
+
+    def add(self, task: Task) -> None:
+        if self.text is not None:
+            self.text.add(task)
+
+    def remove(self, task_id: str) -> None:
+        if self.text is not None:
+            self.text.remove(task_id)
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        pass
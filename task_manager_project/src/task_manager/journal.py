@@ -0,0 +1,116 @@
+import json
+import os
+from typing import Dict, Any, Iterable, Iterator
+
+
+class TaskJournal:
+    """Journal d'écriture anticipée (append-only) des mutations de tâches"""
+
+    def __init__(self, journal_file: str):
+        """
+        Initialise le journal
+
+        Args:
+            journal_file: Chemin vers le fichier journal (une entrée JSON par ligne)
+        """
+        self.journal_file = journal_file
+        self.entries_count = 0
+        # Position (en octets) de la fin des entrées écrites ou relues
+        self.offset = 0
+
+    def append(self, record: Dict[str, Any], sync: bool = False) -> None:
+        """
+        Ajoute une entrée compacte à la fin du journal
+
+        Args:
+            record: Entrée à journaliser (ex: {'op': 'put', 'task': {...}})
+            sync: Si True, synchronise le journal sur disque (fsync)
+
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        self.append_many([record], sync)
+
+    def append_many(self, records: Iterable[Dict[str, Any]], sync: bool = False) -> None:
+        """
+        Ajoute plusieurs entrées en une seule écriture
+
+        Args:
+            records: Entrées à journaliser
+            sync: Si True, synchronise le journal sur disque une fois à la fin
+
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        try:
+            dirname = os.path.dirname(self.journal_file)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+
+            lines = [(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+                     for record in records]
+            with open(self.journal_file, 'ab') as f:
+                f.writelines(lines)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.offset = f.tell()
+            self.entries_count += len(lines)
+
+        except Exception as e:
+            raise IOError(f"Erreur lors de l'écriture dans le journal {self.journal_file}: {str(e)}")
+
+    def replay(self, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Relit les entrées du journal dans l'ordre d'écriture
+
+        Une dernière ligne tronquée (écriture interrompue par un crash) est ignorée.
+
+        Args:
+            start: Position (en octets) à partir de laquelle relire, pour ne
+                rejouer que les entrées ajoutées depuis un précédent rejeu
+
+        Returns:
+            Itérateur sur les entrées du journal
+        """
+        if start == 0:
+            self.entries_count = 0
+        self.offset = start
+        if not os.path.exists(self.journal_file):
+            self.offset = 0
+            return
+
+        with open(self.journal_file, 'rb') as f:
+            f.seek(start)
+            for line in f:
+                # Une ligne sans fin de ligne peut encore être complétée : elle
+                # sera relue au prochain rejeu
+                if line.endswith(b'\n'):
+                    self.offset += len(line)
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                self.entries_count += 1
+                yield record
+
+    def size(self) -> int:
+        """Retourne la taille actuelle du fichier journal (en octets)"""
+        try:
+            return os.path.getsize(self.journal_file)
+        except FileNotFoundError:
+            return 0
+
+    def reset(self) -> None:
+        """Vide le journal (après compaction dans un snapshot)"""
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self.entries_count = 0
+        self.offset = 0
+
+    def __len__(self) -> int:
+        """Retourne le nombre d'entrées depuis la dernière compaction"""
+        return self.entries_count
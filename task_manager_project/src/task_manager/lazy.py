@@ -0,0 +1,225 @@
+import json
+import os
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .task import Task
+from .streaming import iter_json_array_spans
+
+
+class LazyTaskStore(MutableMapping):
+    """
+    Dictionnaire ID -> Task dont les tâches sont lues à la demande
+
+    Au chargement, seul un index ID -> position (en octets) de chaque
+    enregistrement dans le fichier JSON est construit. Une tâche est
+    reconstruite et validée à son premier accès puis conservée dans un
+    cache LRU borné à max_resident tâches ; un enregistrement invalide est
+    alors signalé et retiré du store. Les tâches ajoutées ou modifiées (affectées via
+    store[task_id] = task) ne sont pas encore dans le fichier : elles restent
+    en mémoire jusqu'à ce que le fichier soit réécrit puis rechargé.
+    """
+
+    def __init__(self, max_resident: int = 10000, on_read: Optional[Callable[[Task], None]] = None):
+        """
+        Initialise un store vide
+
+        Args:
+            max_resident: Nombre maximal de tâches non modifiées gardées en mémoire
+            on_read: Fonction appelée avec chaque tâche reconstruite depuis le fichier
+        """
+        self.max_resident = max_resident
+        self._on_read = on_read
+        self.path: Optional[str] = None
+        # Ordre d'insertion des IDs et position de l'enregistrement (None si absent du fichier)
+        self._spans: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._on_error: Optional[Callable[[str], None]] = None
+        # IDs dont l'enregistrement du fichier ne fait plus foi (tâches
+        # ajoutées, modifiées, supprimées ou invalides, IDs en double)
+        self._overridden: Set[str] = set()
+        self._resident: 'OrderedDict[str, Task]' = OrderedDict()
+        self._pinned: Dict[str, Task] = {}
+
+    def load(self, path: str, on_error: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Indexe les enregistrements d'un fichier JSON sans construire les tâches
+
+        Seul l'ID de chaque enregistrement est lu ; ceux sans ID sont
+        ignorés. Les autres champs ne sont validés qu'au premier accès à la
+        tâche.
+
+        Args:
+            path: Fichier JSON (tableau de tâches) à indexer
+            on_error: Fonction appelée avec un message pour chaque tâche
+                invalide, au chargement ou au premier accès
+
+        Raises:
+            json.JSONDecodeError: Si le fichier n'est pas un tableau JSON valide
+        """
+        spans: Dict[str, Optional[Tuple[int, int]]] = {}
+        overridden: Set[str] = set()
+        # En latin-1, chaque octet est un caractère : les positions sont des octets
+        with open(path, 'r', encoding='latin-1') as f:
+            for task_data, start, end in iter_json_array_spans(f):
+                task_id = task_data.get('id') if isinstance(task_data, dict) else None
+                if not isinstance(task_id, str):
+                    if on_error:
+                        on_error(f"Erreur lors du chargement d'une tâche: ID manquant ou invalide ({task_id!r})")
+                    continue
+                task_id = task_id.encode('latin-1').decode('utf-8')
+                if task_id in spans:
+                    # Le dernier enregistrement l'emporte : ne plus lire l'ID par plages
+                    overridden.add(task_id)
+                spans[task_id] = (start, end)
+
+        self.path = path
+        self._on_error = on_error
+        self._spans = spans
+        self._overridden = overridden
+        self._resident.clear()
+        self._pinned.clear()
+
+    def _read(self, task_id: str, f: Optional[BinaryIO] = None) -> Task:
+        """
+        Relit une tâche depuis le fichier (éventuellement déjà ouvert)
+
+        Raises:
+            KeyError: Si l'enregistrement est invalide ; il est alors
+                signalé et retiré du store
+        """
+        start, end = self._spans[task_id]
+        if f is None:
+            with open(self.path, 'rb') as f:
+                return self._read(task_id, f)
+        f.seek(start)
+        raw = f.read(end - start)
+        try:
+            task = Task.from_dict(json.loads(raw.decode('utf-8')))
+        except (KeyError, ValueError, TypeError) as e:
+            del self._spans[task_id]
+            self._overridden.add(task_id)
+            if self._on_error:
+                self._on_error(f"Erreur lors du chargement d'une tâche: {e!r}")
+            raise KeyError(task_id) from e
+        if self._on_read is not None:
+            self._on_read(task)
+        return task
+
+    def __getitem__(self, task_id: str) -> Task:
+        task = self._pinned.get(task_id)
+        if task is not None:
+            return task
+        task = self._resident.get(task_id)
+        if task is not None:
+            self._resident.move_to_end(task_id)
+            return task
+
+        task = self._read(task_id)
+        self._resident[task_id] = task
+        if len(self._resident) > self.max_resident:
+            self._resident.popitem(last=False)
+        return task
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        if task_id not in self._spans:
+            self._spans[task_id] = None
+        self._resident.pop(task_id, None)
+        self._pinned[task_id] = task
+        self._overridden.add(task_id)
+
+    def __delitem__(self, task_id: str) -> None:
+        del self._spans[task_id]
+        self._resident.pop(task_id, None)
+        self._pinned.pop(task_id, None)
+        self._overridden.add(task_id)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def values(self) -> Iterator[Task]:
+        """
+        Itère sur toutes les tâches sans remplir le cache
+
+        Returns:
+            Itérateur sur les tâches, dans l'ordre d'insertion
+        """
+        if self.path is None or not os.path.exists(self.path):
+            yield from list(self._pinned.values())
+            return
+        with open(self.path, 'rb') as f:
+            for task_id in list(self._spans):
+                task = self._pinned.get(task_id) or self._resident.get(task_id)
+                if task is None:
+                    try:
+                        task = self._read(task_id, f)
+                    except KeyError:
+                        continue  # Enregistrement invalide, déjà signalé
+                yield task
+
+    def items(self) -> Iterator[Tuple[str, Task]]:
+        """
+        Itère sur les couples (ID, tâche) sans remplir le cache
+
+        Returns:
+            Itérateur sur les couples, dans l'ordre d'insertion
+        """
+        for task in self.values():
+            yield task.id, task
+
+    def clear(self) -> None:
+        """Vide le store (le fichier n'est pas modifié)"""
+        self._spans.clear()
+        self._resident.clear()
+        self._pinned.clear()
+        self._overridden.clear()
+
+    def file_ranges(self, parts: int, chunk_size: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Découpe les enregistrements du fichier en plages d'octets contiguës
+
+        Chaque plage va du début d'un enregistrement à la fin d'un autre ;
+        elle peut contenir des enregistrements qui ne font plus foi (voir
+        overridden_ids), à ignorer par le lecteur.
+
+        Args:
+            parts: Nombre de plages souhaité
+            chunk_size: Nombre d'enregistrements par plage (prioritaire sur parts)
+
+        Returns:
+            Plages (début, fin), dans l'ordre du fichier
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return []
+        spans = [span for span in self._spans.values() if span is not None]
+        size = chunk_size or -(-len(spans) // max(parts, 1))
+        return [(spans[i][0], spans[min(i + size, len(spans)) - 1][1]) for i in range(0, len(spans), size)]
+
+    def overridden_ids(self) -> Set[str]:
+        """IDs dont l'enregistrement dans le fichier ne doit pas être lu directement"""
+        return self._overridden
+
+    def overridden_tasks(self) -> Iterator[Task]:
+        """
+        Itère sur les tâches existantes dont l'enregistrement du fichier ne
+        fait pas foi (voir overridden_ids)
+
+        Returns:
+            Itérateur sur ces tâches
+        """
+        for task_id in list(self._overridden):
+            if task_id in self._spans:
+                task = self.get(task_id)
+                if task is not None:
+                    yield task
+
+    @property
+    def resident_count(self) -> int:
+        """Nombre de tâches actuellement en mémoire"""
+        return len(self._resident) + len(self._pinned)
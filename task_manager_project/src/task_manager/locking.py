@@ -0,0 +1,272 @@
+import functools
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, IO, Iterator, Optional, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou consultatif, un seul processus
+    fcntl = None
+
+
+F = TypeVar('F', bound=Callable)
+
+
+class ReadWriteLock:
+    """
+    Verrou lecteurs-rédacteur réentrant
+
+    Plusieurs threads peuvent lire en parallèle ; un rédacteur a un accès
+    exclusif. Les rédacteurs en attente sont prioritaires sur les nouveaux
+    lecteurs pour ne pas être affamés. Un thread qui écrit peut relire ou
+    réécrire sans se bloquer ; un thread qui lit ne peut pas passer en
+    écriture (l'attente serait un interblocage).
+    """
+
+    def __init__(self, exclusive_reads: bool = False):
+        """
+        Initialise le verrou
+
+        Args:
+            exclusive_reads: Si True, les lectures sont aussi exclusives (pour
+                les structures qui se modifient à la lecture, comme un cache)
+        """
+        self.exclusive_reads = exclusive_reads
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def acquire_read(self) -> None:
+        """Acquiert le verrou en lecture"""
+        if self.exclusive_reads:
+            self.acquire_write()
+            return
+
+        local = self._local
+        if self._writer == threading.get_ident():
+            local.nested = getattr(local, 'nested', 0) + 1
+            return
+        if getattr(local, 'reads', 0):
+            local.reads += 1
+            return
+
+        with self._cond:
+            while self._writer is not None or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        local.reads = 1
+
+    def release_read(self) -> None:
+        """Libère le verrou en lecture"""
+        if self.exclusive_reads:
+            self.release_write()
+            return
+
+        local = self._local
+        if getattr(local, 'nested', 0):
+            local.nested -= 1
+            return
+
+        local.reads -= 1
+        if local.reads == 0:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Acquiert le verrou en écriture
+
+        Raises:
+            RuntimeError: Si le thread détient déjà le verrou en lecture
+        """
+        me = threading.get_ident()
+        if self._writer == me:
+            self._writer_depth += 1
+            return
+        if getattr(self._local, 'reads', 0):
+            raise RuntimeError("Impossible de passer d'un verrou en lecture à un verrou en écriture")
+
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """Libère le verrou en écriture"""
+        self._writer_depth -= 1
+        if self._writer_depth == 0:
+            with self._cond:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def reading(self) -> Iterator[None]:
+        """Contexte détenant le verrou en lecture"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """Contexte détenant le verrou en écriture"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class InterProcessLock:
+    """
+    Verrou consultatif (fcntl.flock) partagé entre processus
+
+    Le verrou porte sur un fichier dédié, ouvert une fois et gardé ouvert.
+    Il n'est pas réentrant : la réentrance et l'exclusion entre threads d'un
+    même processus sont assurées par ProcessSharedLock. Sans fcntl
+    (Windows), acquire et release sont sans effet.
+    """
+
+    def __init__(self, lock_file: str):
+        """
+        Initialise le verrou (le fichier est créé à la première acquisition)
+
+        Args:
+            lock_file: Chemin du fichier de verrou
+        """
+        self.lock_file = lock_file
+        self.exclusive = False
+        self._file: Optional[IO] = None
+
+    def acquire(self, exclusive: bool = True) -> None:
+        """
+        Acquiert le verrou, en attendant que les autres processus le libèrent
+
+        Args:
+            exclusive: True pour un verrou exclusif (écriture), False pour un
+                verrou partagé (lecture)
+        """
+        if fcntl is None:
+            return
+        if self._file is None:
+            dirname = os.path.dirname(self.lock_file)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            self._file = open(self.lock_file, 'a')
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        self.exclusive = exclusive
+
+    def release(self) -> None:
+        """Libère le verrou"""
+        self.exclusive = False
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Ferme le fichier de verrou (ce qui libère le verrou)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.exclusive = False
+
+
+class ProcessSharedLock(ReadWriteLock):
+    """
+    Verrou lecteurs-rédacteur doublé d'un verrou inter-processus
+
+    Dans le processus, toutes les acquisitions sont exclusives : à la
+    première acquisition (non imbriquée), le verrou du fichier est pris
+    (partagé en lecture, exclusif en écriture) puis on_acquire est appelé
+    pour resynchroniser l'état en mémoire avec le stockage, ce qui modifie
+    la mémoire même pour une lecture. on_release est appelé avant de rendre
+    un verrou exclusif.
+    """
+
+    def __init__(self, lock_file: str, on_acquire: Optional[Callable[[], None]] = None,
+                 on_release: Optional[Callable[[], None]] = None):
+        """
+        Initialise le verrou
+
+        Args:
+            lock_file: Chemin du fichier de verrou inter-processus
+            on_acquire: Fonction appelée après chaque acquisition non imbriquée
+            on_release: Fonction appelée avant la libération d'un verrou exclusif
+        """
+        super().__init__(exclusive_reads=True)
+        self.file_lock = InterProcessLock(lock_file)
+        self._on_acquire = on_acquire
+        self._on_release = on_release
+
+    def acquire_read(self) -> None:
+        """Acquiert le verrou en lecture (verrou de fichier partagé)"""
+        self._acquire(exclusive=False)
+
+    def acquire_write(self) -> None:
+        """
+        Acquiert le verrou en écriture (verrou de fichier exclusif)
+
+        Raises:
+            RuntimeError: Si le thread détient déjà le verrou en lecture
+        """
+        self._acquire(exclusive=True)
+
+    def _acquire(self, exclusive: bool) -> None:
+        """Acquiert le verrou du processus puis, au premier niveau, celui du fichier"""
+        if self._writer == threading.get_ident():
+            if exclusive and not self.file_lock.exclusive and fcntl is not None:
+                raise RuntimeError("Impossible de passer d'un verrou en lecture à un verrou en écriture")
+            super().acquire_write()
+            return
+
+        super().acquire_write()
+        try:
+            self.file_lock.acquire(exclusive)
+            try:
+                if self._on_acquire is not None:
+                    self._on_acquire()
+            except BaseException:
+                self.file_lock.release()
+                raise
+        except BaseException:
+            super().release_write()
+            raise
+
+    def release_write(self) -> None:
+        """Libère le verrou (et celui du fichier au dernier niveau)"""
+        if self._writer_depth == 1:
+            try:
+                if self.file_lock.exclusive and self._on_release is not None:
+                    self._on_release()
+            finally:
+                self.file_lock.release()
+        super().release_write()
+
+
+def read_locked(method: F) -> F:
+    """Décore une méthode pour l'exécuter sous self._lock en lecture"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.reading():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def write_locked(method: F) -> F:
+    """Décore une méthode pour l'exécuter sous self._lock en écriture"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock.writing():
+            return method(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,284 @@
+import logging
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.message import EmailMessage
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    """
+    Ensemble borné de connexions SMTP ouvertes et réutilisées
+
+    Une connexion (EHLO, STARTTLS et authentification compris) sert à
+    envoyer autant de messages que possible ; elle n'est refermée que si
+    elle a échoué ou à la fermeture du pool.
+    """
+
+    def __init__(self, host: str, port: int, size: int = 4, timeout: float = 10.0,
+                 starttls: bool = False, username: Optional[str] = None, password: Optional[str] = None,
+                 factory: Callable[..., smtplib.SMTP] = smtplib.SMTP):
+        """
+        Initialise un pool vide (les connexions sont ouvertes à la demande)
+
+        Args:
+            host: Serveur SMTP
+            port: Port du serveur
+            size: Nombre maximal de connexions simultanées
+            timeout: Délai des opérations réseau, en secondes
+            starttls: Si True, chiffre chaque connexion avec STARTTLS
+            username: Identifiant (pas d'authentification si None)
+            password: Mot de passe
+            factory: Classe de connexion (smtplib.SMTP ou SMTP_SSL)
+
+        Raises:
+            ValueError: Si la taille est invalide
+        """
+        if size <= 0:
+            raise ValueError("La taille du pool SMTP doit être positive")
+        self.host = host
+        self.port = port
+        self.size = size
+        self.timeout = timeout
+        self.starttls = starttls
+        self.username = username
+        self.password = password
+        self._factory = factory
+        self._idle: 'queue.LifoQueue[smtplib.SMTP]' = queue.LifoQueue()
+        self._open = 0
+        self._lock = threading.Lock()
+        # Nombre de connexions ouvertes depuis la création du pool
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        """Ouvre et prépare une nouvelle connexion"""
+        connection = self._factory(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.ehlo()
+            if self.starttls:
+                connection.starttls()
+                connection.ehlo()
+            if self.username is not None:
+                connection.login(self.username, self.password or "")
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def acquire(self) -> smtplib.SMTP:
+        """
+        Récupère une connexion libre, en ouvre une si le pool n'est pas
+        plein, sinon attend qu'une connexion soit rendue
+
+        Returns:
+            Connexion SMTP prête à envoyer
+
+        Raises:
+            OSError: Si la connexion échoue (smtplib.SMTPException comprise)
+        """
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                if self._open < self.size:
+                    self._open += 1
+                    break
+            # Pool plein : attendre une connexion rendue ou une place libérée
+            try:
+                return self._idle.get(timeout=0.05)
+            except queue.Empty:
+                continue
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._lock:
+                self._open -= 1
+            raise
+        with self._lock:
+            self.connections_opened += 1
+        return connection
+
+    def release(self, connection: smtplib.SMTP, broken: bool = False) -> None:
+        """
+        Rend une connexion au pool
+
+        Args:
+            connection: Connexion obtenue par acquire()
+            broken: Si True, la connexion est refermée au lieu d'être réutilisée
+        """
+        if not broken:
+            self._idle.put(connection)
+            return
+        try:
+            connection.close()
+        finally:
+            with self._lock:
+                self._open -= 1
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """Contexte prêtant une connexion, refermée si une erreur survient"""
+        connection = self.acquire()
+        try:
+            yield connection
+        except BaseException:
+            self.release(connection, broken=True)
+            raise
+        self.release(connection)
+
+    def close(self) -> None:
+        """Termine proprement (QUIT) toutes les connexions libres"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                connection.quit()
+            except (smtplib.SMTPException, OSError):
+                connection.close()
+            with self._lock:
+                self._open -= 1
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Indique si une erreur d'envoi mérite une nouvelle tentative
+
+    Les réponses 4xx, les déconnexions et les erreurs réseau sont
+    temporaires ; les réponses 5xx (destinataire inconnu, message refusé)
+    sont définitives.
+
+    Args:
+        error: Exception levée par l'envoi
+
+    Returns:
+        True si l'envoi peut être retenté
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPException):
+        return False
+    return isinstance(error, OSError)
+
+
+class BatchResult:
+    """
+    Bilan d'un envoi groupé
+
+    Attributes:
+        sent: Destinataires des messages envoyés
+        failed: Destinataire -> raison de l'échec
+        retries: Nombre total de nouvelles tentatives
+    """
+
+    def __init__(self):
+        self.sent: List[str] = []
+        self.failed: Dict[str, str] = {}
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record(self, recipient: str, error: Optional[Exception], retries: int = 0) -> None:
+        """Consigne le sort du message d'un destinataire (error : None si envoyé)"""
+        with self._lock:
+            self.retries += retries
+            if error is None:
+                self.sent.append(recipient)
+            else:
+                self.failed[recipient] = str(error) or type(error).__name__
+
+    @property
+    def ok(self) -> bool:
+        """True si tous les messages ont été envoyés"""
+        return not self.failed
+
+    def __repr__(self) -> str:
+        return f"BatchResult(sent={len(self.sent)}, failed={len(self.failed)}, retries={self.retries})"
+
+
+def send_messages(pool: SMTPConnectionPool, messages: Sequence[EmailMessage], max_retries: int = 3,
+                  backoff: float = 0.5, result: Optional[BatchResult] = None) -> BatchResult:
+    """
+    Envoie des messages sur les connexions d'un pool
+
+    Chaque connexion du pool est tenue par un fil d'envoi qui enchaîne les
+    messages sans la rouvrir ; les fils envoient en parallèle. Un échec
+    temporaire est retenté sur une connexion neuve après une attente
+    croissante (backoff, 2 × backoff, 4 × backoff...) ; un échec définitif
+    est consigné sans bloquer les autres messages.
+
+    Args:
+        pool: Pool de connexions
+        messages: Messages (en-têtes From et To renseignés)
+        max_retries: Nombre maximal de nouvelles tentatives par message
+        backoff: Attente initiale entre deux tentatives, en secondes
+        result: Bilan à compléter (un nouveau si None)
+
+    Returns:
+        Bilan de l'envoi
+    """
+    result = result if result is not None else BatchResult()
+    pending: 'queue.Queue[EmailMessage]' = queue.Queue()
+    for message in messages:
+        pending.put(message)
+
+    def worker() -> None:
+        connection: Optional[smtplib.SMTP] = None
+        try:
+            while True:
+                try:
+                    message = pending.get_nowait()
+                except queue.Empty:
+                    return
+                attempt = 0
+                while True:
+                    try:
+                        if connection is None:
+                            connection = pool.acquire()
+                        connection.send_message(message)
+                        error = None
+                    except Exception as e:
+                        error = e
+                        transient = is_transient(e)
+                        if connection is not None:
+                            # Une erreur définitive laisse la connexion utilisable
+                            if transient or not _reset(connection):
+                                pool.release(connection, broken=True)
+                                connection = None
+                        if transient and attempt < max_retries:
+                            time.sleep(backoff * 2 ** attempt)
+                            attempt += 1
+                            continue
+                        logger.warning("Échec de l'envoi à %s : %s", message['To'], e)
+                    result.record(message['To'], error, attempt)
+                    break
+        finally:
+            if connection is not None:
+                pool.release(connection)
+
+    workers = min(pool.size, pending.qsize())
+    if workers:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(worker) for _ in range(workers)]:
+                future.result()
+    return result
+
+
+def _reset(connection: smtplib.SMTP) -> bool:
+    """Annule la transaction en cours (RSET) ; False si la connexion est perdue"""
+    try:
+        return connection.rset()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
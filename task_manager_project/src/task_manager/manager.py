@@ -1,24 +1,190 @@
+import copy
 import json
+import logging
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import threading
+import weakref
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, List, Dict, Any, Optional, Iterable, Iterator, Mapping, Tuple, Union
+from datetime import datetime, timedelta
 from .task import Task, Priority, Status
+from .journal import TaskJournal
+from .indexes import TaskIndex, NullTaskIndex, due_key
+from .lazy import LazyTaskStore
+from .storage import TaskStore, SQLiteTaskStore
+from .locking import ReadWriteLock, ProcessSharedLock, read_locked, write_locked
+from .persister import BackgroundPersister
+from .atomic import FSYNC_POLICIES, atomic_write
+from .formats import FILE_FORMATS, COMPRESSIONS, dump_tasks, iter_task_records
+from .parallel import ParallelScanner
+from .query import Condition, Q, plan_query, paginate
+from .snapshot import TaskSnapshot
+from .events import CREATED, UPDATED, DELETED, ChangeEvent, ChangeFeed, Subscription
+from .pagination import TaskPage, check_page_args, decode_cursor, encode_cursor, order_key
+
+
+logger = logging.getLogger(__name__)
+
+# Équivalent SQLite de chaque politique fsync
+_SQLITE_SYNCHRONOUS = {'always': 'FULL', 'batch': 'NORMAL', 'never': 'OFF'}
+
+# Statuts des tâches terminées, jamais en retard ni à rappeler
+_FINISHED_STATUSES = (Status.COMPLETED, Status.CANCELLED)
 
 
 class TaskManager:
-    """Gestionnaire de tâches avec stockage persistant"""
+    """
+    Gestionnaire de tâches avec stockage persistant
+    
+    Une instance peut être partagée entre threads : les lectures s'exécutent
+    en parallèle et les mutations sont sérialisées par un verrou
+    lecteurs-rédacteur. En mode partagé, plusieurs processus peuvent ouvrir
+    le même fichier de stockage.
+    """
     
-    def __init__(self, storage_file: str = "tasks.json"):
+    def __init__(self, storage_file: str = "tasks.json", journal: bool = False,
+                 compact_threshold: int = 1000, lazy: bool = False,
+                 max_resident: int = 10000, backend: str = "json",
+                 autosave: bool = True, flush_interval: Optional[float] = None,
+                 flush_after: int = 1000, fsync: str = "batch",
+                 file_format: str = "json", compression: Optional[str] = None,
+                 shared: bool = False, scan_workers: Optional[int] = None,
+                 parallel_threshold: int = 50000, change_history: int = 10000):
         """
         Initialise le gestionnaire de tâches
         
         Args:
             storage_file: Chemin vers le fichier de stockage JSON
+            journal: Si True, chaque mutation est ajoutée à un journal
+                (storage_file + '.journal') au lieu de réécrire tout le fichier
+            compact_threshold: Nombre d'entrées du journal au-delà duquel il est
+                compacté dans le fichier de stockage
+            lazy: Si True, seul un index ID -> position dans le fichier est
+                construit au chargement ; les tâches sont lues à la demande
+            max_resident: En mode lazy, nombre maximal de tâches non modifiées
+                gardées en mémoire
+            backend: "json" (fichier JSON chargé en mémoire) ou "sqlite" (base
+                SQLite : écritures ligne par ligne, filtres et statistiques
+                exécutés en SQL)
+            autosave: Si False, les mutations ne sont pas persistées
+                immédiatement mais seulement lors d'un appel à flush()
+            flush_interval: Si défini, désactive la sauvegarde automatique et
+                démarre un thread qui persiste les mutations en attente au
+                plus toutes les flush_interval secondes
+            flush_after: Avec flush_interval, nombre de mutations en attente
+                déclenchant une écriture anticipée
+            fsync: Politique de synchronisation disque : "always" (chaque
+                écriture), "batch" (une par sauvegarde, lot ou flush) ou
+                "never". Les sauvegardes complètes sont toujours atomiques.
+            file_format: Format du fichier de stockage : "json" (indenté),
+                "json-min" (compact) ou "binary" (enregistrements marshal)
+            compression: None, "gzip", "zlib" ou "lzma". Au chargement, le
+                format et la compression sont détectés automatiquement.
+            shared: Si True, le fichier de stockage peut être partagé entre
+                processus : chaque opération prend un verrou de fichier
+                (storage_file + '.lock') et recharge d'abord les changements
+                des autres processus, seulement si le fichier ou le journal a
+                changé. Les mutations locales en attente priment sur celles
+                des autres processus.
+            scan_workers: En mode lazy, nombre de processus lisant le
+                fichier lors des parcours complets (find_tasks,
+                count_tasks) ; nombre de cœurs si None
+            parallel_threshold: En mode lazy, nombre de tâches à partir
+                duquel ces parcours sont répartis sur un pool de processus ;
+                en dessous, et hors mode lazy, ils s'exécutent dans le
+                processus courant
+            change_history: Nombre de changements conservés pour
+                changes_since()
+            
+        Raises:
+            ValueError: Si le backend est inconnu ou incompatible avec les options
         """
+        if backend not in ("json", "sqlite"):
+            raise ValueError(f"Backend de stockage inconnu : {backend}")
+        if backend == "sqlite" and (journal or lazy or shared):
+            raise ValueError("Les modes journal, lazy et shared ne s'appliquent qu'au backend json")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Politique fsync inconnue : {fsync}")
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Format de fichier inconnu : {file_format}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Compression inconnue : {compression}")
+        if lazy and (file_format == "binary" or compression is not None):
+            raise ValueError("Le mode lazy nécessite un fichier JSON non compressé")
+        
         self.storage_file = storage_file
-        self.tasks: Dict[str, Task] = {}
-        self._load_from_file()
+        self._lazy = lazy
+        # Référence confiée aux tâches détenues, pour leurs mutateurs (voir _update_owned)
+        self._owner_ref = weakref.ref(self)
+        # Lectures parallèles, écritures exclusives. Le cache du mode lazy et
+        # la connexion SQLite se modifient à la lecture : lectures exclusives.
+        self._lock = ReadWriteLock(exclusive_reads=lazy or backend == "sqlite")
+        self._shared = shared
+        # Signature du fichier de stockage lors du dernier chargement ou de la
+        # dernière écriture (mode partagé)
+        self._generation: Optional[Tuple[int, int, int]] = None
+        if shared:
+            self._lock = ProcessSharedLock(storage_file + '.lock', on_acquire=self._refresh,
+                                           on_release=self._record_generation)
+        self.fsync = fsync
+        self.file_format = file_format
+        self.compression = compression
+        self._store: Optional[TaskStore] = (
+            SQLiteTaskStore(storage_file, synchronous=_SQLITE_SYNCHRONOUS[fsync], on_read=self._adopt)
+            if backend == "sqlite" else None
+        )
+        self.tasks: Dict[str, Task] = (
+            self._store if self._store is not None
+            else LazyTaskStore(max_resident, self._adopt) if lazy else {}
+        )
+        # Erreurs rencontrées sur des tâches invalides lors du dernier chargement
+        self.load_errors: List[str] = []
+        self._scanner = ParallelScanner(scan_workers, parallel_threshold)
+        self._index = TaskIndex() if self._store is None else NullTaskIndex()
+        # En mode lazy, les index ne sont construits qu'au premier filtrage
+        self._index_ready = True
+        self.compact_threshold = compact_threshold
+        self._journal: Optional[TaskJournal] = TaskJournal(storage_file + '.journal') if journal else None
+        self.autosave = autosave and flush_interval is None
+        # Mutations pas encore persistées (ID -> 'put' ou 'delete'), en lot
+        # ou sans sauvegarde automatique
+        self._pending: Dict[str, str] = {}
+        self._pending_clear = False
+        # Le fichier de stockage (et son journal) ne reflète plus les tâches
+        # en mémoire, remplacées par load_from_file() : la prochaine
+        # persistance doit être un snapshot complet
+        self._snapshot_stale = False
+        # État d'un lot de mutations en cours (voir batch())
+        self._batch_depth = 0
+        self._batch_undo: Dict[str, Tuple[Optional[Task], Optional[Task]]] = {}
+        # Événements d'un lot, publiés seulement s'il aboutit
+        self._batch_events: List[Tuple[str, str, Optional[Task], Optional[Dict[str, Tuple[Any, Any]]]]] = []
+        self._changes = ChangeFeed(change_history)
+        # Instantanés encore référencés, qui partagent les tâches du
+        # gestionnaire : une tâche est copiée pour eux à sa première
+        # modification en place depuis le dernier instantané (voir snapshot())
+        self._snapshots: 'weakref.WeakSet[TaskSnapshot]' = weakref.WeakSet()
+        # Coordonne ces copies avec celles faites à la lecture des instantanés
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_generation = 0
+        # ID -> génération d'instantané pour laquelle la tâche a déjà été copiée
+        self._copied_at: Dict[str, int] = {}
+        if shared:
+            self._lock.file_lock.acquire(exclusive=False)
+            try:
+                self._load_from_file()
+            finally:
+                self._lock.file_lock.release()
+        else:
+            self._load_from_file()
+        
+        self._persister: Optional[BackgroundPersister] = None
+        if flush_interval is not None:
+            self._persister = BackgroundPersister(self, flush_interval, flush_after)
+            self._persister.start()
     
+    @write_locked
     def add_task(self, task: Task) -> str:
         """
         Ajoute une tâche au gestionnaire
@@ -35,10 +201,15 @@ class TaskManager:
         if task.id in self.tasks:
             raise ValueError(f"Une tâche avec l'ID {task.id} existe déjà")
         
+        self._remember(task.id)
+        self._adopt(task)
         self.tasks[task.id] = task
-        self._save_to_file()
+        self._index.add(task)
+        self._persist_put(task)
+        self._emit(CREATED, task.id, task)
         return task.id
     
+    @read_locked
     def get_task(self, task_id: str) -> Optional[Task]:
         """
         Récupère une tâche par son ID
@@ -51,6 +222,7 @@ class TaskManager:
         """
         return self.tasks.get(task_id)
     
+    @read_locked
     def get_tasks_by_status(self, status: Status) -> List[Task]:
         """
         Récupère toutes les tâches avec un statut donné
@@ -61,8 +233,9 @@ class TaskManager:
         Returns:
             Liste des tâches avec le statut spécifié
         """
-        return [task for task in self.tasks.values() if task.status == status]
+        return self._select('status', status)
     
+    @read_locked
     def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
         """
         Récupère toutes les tâches avec une priorité donnée
@@ -73,8 +246,9 @@ class TaskManager:
         Returns:
             Liste des tâches avec la priorité spécifiée
         """
-        return [task for task in self.tasks.values() if task.priority == priority]
+        return self._select('priority', priority)
     
+    @write_locked
     def delete_task(self, task_id: str) -> bool:
         """
         Supprime une tâche par son ID
@@ -85,16 +259,25 @@ class TaskManager:
         Returns:
             True si la tâche a été supprimée, False sinon
         """
-        if task_id in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is not None:
+            self._remember(task_id)
             del self.tasks[task_id]
-            self._save_to_file()
+            self._index.remove(task_id)
+            self._persist_delete(task_id)
+            self._emit(DELETED, task_id, task)
             return True
         return False
     
+    @write_locked
     def update_task(self, task_id: str, **kwargs) -> bool:
         """
         Met à jour une tâche existante
         
+        Les index de filtrage ne suivent que les modifications faites via cette
+        méthode, directement ou par les mutateurs d'une tâche détenue
+        (Task.mark_completed...), pas les affectations directes d'attributs.
+        
         Args:
             task_id: ID de la tâche à mettre à jour
             **kwargs: Attributs à mettre à jour
@@ -106,14 +289,87 @@ class TaskManager:
         if not task:
             return False
         
-        for attr, value in kwargs.items():
-            if hasattr(task, attr):
-                setattr(task, attr, value)
+        self._remember(task_id)
+        self._preserve(task)
+        previous = {attr: getattr(task, attr) for attr in kwargs if hasattr(task, attr)}
+        for attr in previous:
+            setattr(task, attr, kwargs[attr])
         
         task.updated_at = datetime.now().isoformat()
-        self._save_to_file()
+        # Réaffecter la tâche pour qu'un store lazy la garde en mémoire
+        self.tasks[task_id] = task
+        self._index.add(task)
+        self._persist_put(task)
+        changes = {attr: (value, getattr(task, attr)) for attr, value in previous.items()
+                   if value != getattr(task, attr)}
+        self._emit(UPDATED, task_id, task, changes)
         return True
     
+    @write_locked
+    def add_tasks(self, tasks: Iterable[Task]) -> List[str]:
+        """
+        Ajoute plusieurs tâches en une seule opération persistée
+        
+        Les doublons (avec le gestionnaire ou au sein du lot) sont détectés
+        en une passe avant toute modification : soit toutes les tâches sont
+        ajoutées, soit aucune.
+        
+        Args:
+            tasks: Tâches à ajouter
+            
+        Returns:
+            IDs des tâches ajoutées, dans l'ordre
+            
+        Raises:
+            ValueError: Si des IDs existent déjà ou sont dupliqués
+        """
+        tasks = list(tasks)
+        seen = set()
+        duplicates = []
+        for task in tasks:
+            if task.id in self.tasks or task.id in seen:
+                duplicates.append(task.id)
+            seen.add(task.id)
+        if duplicates:
+            raise ValueError(f"Des tâches avec les IDs {', '.join(duplicates)} existent déjà")
+        
+        with self.batch():
+            return [self.add_task(task) for task in tasks]
+    
+    @write_locked
+    def update_tasks(self, updates: Union[Mapping[str, Dict[str, Any]],
+                                          Iterable[Tuple[str, Dict[str, Any]]]]) -> List[bool]:
+        """
+        Met à jour plusieurs tâches en une seule opération persistée
+        
+        Args:
+            updates: Correspondance ID -> attributs à mettre à jour, ou
+                itérable de couples (ID, attributs)
+            
+        Returns:
+            Pour chaque mise à jour, True si la tâche a été mise à jour, False sinon
+        """
+        if isinstance(updates, Mapping):
+            updates = updates.items()
+        
+        with self.batch():
+            return [self.update_task(task_id, **fields) for task_id, fields in updates]
+    
+    @write_locked
+    def delete_tasks(self, task_ids: Iterable[str]) -> List[bool]:
+        """
+        Supprime plusieurs tâches en une seule opération persistée
+        
+        Args:
+            task_ids: IDs des tâches à supprimer
+            
+        Returns:
+            Pour chaque ID, True si la tâche a été supprimée, False sinon
+        """
+        with self.batch():
+            return [self.delete_task(task_id) for task_id in task_ids]
+    
+    @read_locked
     def get_all_tasks(self) -> List[Task]:
         """
         Récupère toutes les tâches
@@ -123,6 +379,136 @@ class TaskManager:
         """
         return list(self.tasks.values())
     
+    @read_locked
+    def snapshot(self) -> TaskSnapshot:
+        """
+        Prend un instantané cohérent des tâches, pour les lectures longues
+        
+        Seule la table ID -> tâche est copiée, pas les tâches : le verrou
+        n'est tenu que pendant cette copie. Une tâche partagée avec un
+        instantané est copiée au plus une fois, avant sa première
+        modification en place qui le suit (copie sur écriture) ou à sa
+        première lecture depuis l'instantané. Un rapport ou un export lu
+        ensuite depuis l'instantané ne bloque pas les écritures et n'en voit
+        aucune. En modes lazy et sqlite, les tâches sont lues depuis le
+        stockage.
+        
+        Returns:
+            Instantané des tâches
+        """
+        tasks = self.tasks.copy() if isinstance(self.tasks, dict) else dict(self.tasks.items())
+        if self._store is not None:
+            # Les tâches lues depuis la base sont propres à l'instantané
+            return TaskSnapshot(tasks, self._changes.sequence)
+        snapshot = TaskSnapshot(tasks, self._changes.sequence, self._snapshot_lock)
+        with self._snapshot_lock:
+            self._snapshot_generation += 1
+            self._snapshots.add(snapshot)
+        return snapshot
+    
+    def get_tasks_page(self, limit: int = 50, cursor: Optional[str] = None, order_by: str = "created_at",
+                       descending: bool = False, **filters: Any) -> TaskPage:
+        """
+        Récupère une page de tâches à partir d'un curseur
+        
+        La pagination est stable : une page reprend juste après la dernière
+        tâche de la précédente, même si des tâches ont été ajoutées ou
+        supprimées entre-temps. Seule la page demandée est matérialisée ; un
+        index trié (construit à la première page puis tenu à jour) permet de
+        la retrouver en O(log n), quelle que soit sa profondeur.
+        
+        Args:
+            limit: Nombre maximal de tâches de la page
+            cursor: Curseur retourné avec la page précédente (None : première page)
+            order_by: Ordre de parcours, 'created_at' ou 'id' (l'ID départage
+                les dates de création égales)
+            descending: Si True, parcours dans l'ordre décroissant
+            **filters: Conditions à satisfaire (mêmes formes que query())
+            
+        Returns:
+            Page de tâches et curseur de la page suivante (None si c'est la dernière)
+            
+        Raises:
+            ValueError: Si l'ordre, la taille de page, un filtre ou le curseur
+                est invalide
+        """
+        check_page_args(order_by, limit)
+        after = None if cursor is None else decode_cursor(cursor, order_by, descending)
+        condition = Q(**filters) if filters else None
+        
+        with self._lock.reading():
+            self._ensure_index()
+            if self._store is not None:
+                # Avec un filtre, des lignes écartées s'intercalent : lectures plus larges
+                chunk_size = limit + 1 if condition is None else max(limit + 1, 500)
+                candidates = self._store.iter_ordered(order_by, after, descending, chunk_size)
+                return self._page(candidates, condition, limit, order_by, descending)
+            order = self._index.orders.get(order_by)
+            if order is not None:
+                return self._page((self.tasks[task_id] for task_id in order.after(after, descending)),
+                                  condition, limit, order_by, descending)
+        with self._lock.writing():
+            self._ensure_index()
+            order = self._index.orders.get(order_by)
+            if order is None:
+                order = self._index.enable_order(order_by, self.tasks.values())
+            return self._page((self.tasks[task_id] for task_id in order.after(after, descending)),
+                              condition, limit, order_by, descending)
+    
+    def _page(self, candidates: Iterable[Task], condition: Optional[Condition], limit: int,
+              order_by: str, descending: bool) -> TaskPage:
+        """
+        Découpe une page dans un flux ordonné de tâches
+        
+        Une tâche de plus que la page est lue pour savoir s'il en reste.
+        """
+        if condition is not None:
+            candidates = (task for task in candidates if condition.matches(task))
+        tasks = list(islice(candidates, limit + 1))
+        if len(tasks) <= limit:
+            return TaskPage(tasks)
+        del tasks[limit:]
+        return TaskPage(tasks, encode_cursor(order_by, descending, order_key(tasks[-1], order_by)))
+    
+    def iter_tasks(self, order_by: str = "created_at", descending: bool = False, batch_size: int = 500,
+                   **filters: Any) -> Iterator[Task]:
+        """
+        Itère sur les tâches sans construire la liste complète
+        
+        Équivalent paresseux de get_all_tasks() et des get_tasks_by_*()
+        (par exemple iter_tasks(status=Status.TODO)) : les tâches sont lues
+        par pages de batch_size au fil de la consommation, chaque page sous
+        le verrou de lecture. Les écritures restent possibles entre deux
+        pages ; aucune tâche n'est alors retournée deux fois.
+        
+        Args:
+            order_by: Ordre de parcours, 'created_at' ou 'id'
+            descending: Si True, parcours dans l'ordre décroissant
+            batch_size: Nombre de tâches lues par page
+            **filters: Conditions à satisfaire (mêmes formes que query())
+            
+        Returns:
+            Itérateur sur les tâches
+            
+        Raises:
+            ValueError: Si l'ordre, la taille de page ou un filtre est invalide
+        """
+        check_page_args(order_by, batch_size)
+        Q(**filters)  # Valide les filtres dès l'appel
+        return self._iter_pages(order_by, descending, batch_size, filters)
+    
+    def _iter_pages(self, order_by: str, descending: bool, batch_size: int,
+                    filters: Dict[str, Any]) -> Iterator[Task]:
+        """Générateur parcourant les pages successives de get_tasks_page()"""
+        cursor = None
+        while True:
+            page = self.get_tasks_page(batch_size, cursor, order_by, descending, **filters)
+            yield from page.tasks
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+    
+    @read_locked
     def get_tasks_by_project(self, project: str) -> List[Task]:
         """
         Récupère toutes les tâches d'un projet
@@ -133,8 +519,9 @@ class TaskManager:
         Returns:
             Liste des tâches du projet
         """
-        return [task for task in self.tasks.values() if task.project == project]
+        return self._select('project', project)
     
+    @read_locked
     def get_tasks_by_assignee(self, assignee: str) -> List[Task]:
         """
         Récupère toutes les tâches assignées à une personne
@@ -145,8 +532,84 @@ class TaskManager:
         Returns:
             Liste des tâches assignées
         """
-        return [task for task in self.tasks.values() if task.assignee == assignee]
+        return self._select('assignee', assignee)
     
+    @read_locked
+    def get_tasks_due_between(self, start: Any = None, end: Any = None) -> List[Task]:
+        """
+        Récupère les tâches dont l'échéance est dans un intervalle
+        
+        Les échéances sont tenues dans un index trié : la recherche coûte
+        O(log n + k) pour k résultats.
+        
+        Args:
+            start: Début inclus (datetime, date ou chaîne ISO ; None : pas de borne)
+            end: Fin exclue (datetime, date ou chaîne ISO ; None : pas de borne)
+            
+        Returns:
+            Liste des tâches, par échéance croissante
+        """
+        return self._due_between(start, end)
+    
+    @read_locked
+    def get_overdue_tasks(self, now: Optional[datetime] = None) -> List[Task]:
+        """
+        Récupère les tâches non terminées dont l'échéance est dépassée
+        
+        Args:
+            now: Instant de référence (maintenant si None)
+            
+        Returns:
+            Liste des tâches en retard, de la plus ancienne échéance à la plus récente
+        """
+        now = now or datetime.now()
+        return [task for task in self._due_between(None, now) if task.status not in _FINISHED_STATUSES]
+    
+    @read_locked
+    def get_tasks_due_soon(self, hours: float = 24, now: Optional[datetime] = None) -> List[Task]:
+        """
+        Récupère les tâches non terminées arrivant à échéance prochainement
+        
+        Args:
+            hours: Horizon (en heures) à partir de now
+            now: Instant de référence (maintenant si None)
+            
+        Returns:
+            Liste des tâches dont l'échéance est dans [now, now + hours[, par
+            échéance croissante
+        """
+        now = now or datetime.now()
+        return [task for task in self._due_between(now, now + timedelta(hours=hours))
+                if task.status not in _FINISHED_STATUSES]
+    
+    def _due_between(self, start: Any, end: Any) -> List[Task]:
+        """
+        Récupère les tâches dont l'échéance est dans [start, end[
+        
+        Args:
+            start: Début inclus (None : pas de borne)
+            end: Fin exclue (None : pas de borne)
+            
+        Returns:
+            Liste des tâches, par échéance croissante
+        """
+        if self._store is None:
+            self._ensure_index()
+            return [self.tasks[task_id] for task_id in self._index.due_dates.range(start, end)]
+        
+        # Backend sans index en mémoire : parcours puis tri
+        start_key, end_key = due_key(start), due_key(end)
+        matching = []
+        for task in self.tasks.values():
+            key = due_key(task.due_date)
+            if key is None or (start_key is not None and key < start_key) \
+                    or (end_key is not None and key >= end_key):
+                continue
+            matching.append((key, task))
+        matching.sort(key=lambda entry: entry[0])
+        return [task for _, task in matching]
+    
+    @read_locked
     def get_statistics(self) -> Dict[str, Any]:
         """
         Calcule les statistiques des tâches
@@ -156,27 +619,16 @@ class TaskManager:
         """
         total_tasks = len(self.tasks)
         
-        # Statistiques par statut
-        status_stats = {}
-        for status in Status:
-            status_stats[status.value] = len(self.get_tasks_by_status(status))
+        # Les compteurs proviennent des index, tenus à jour à chaque mutation,
+        # ou du backend : aucun parcours des tâches n'est nécessaire
+        status_counts = self._counts('status')
+        status_stats = {status.value: status_counts.get(status, 0) for status in Status}
         
-        # Statistiques par priorité
-        priority_stats = {}
-        for priority in Priority:
-            priority_stats[priority.value] = len(self.get_tasks_by_priority(priority))
+        priority_counts = self._counts('priority')
+        priority_stats = {priority.value: priority_counts.get(priority, 0) for priority in Priority}
         
-        # Statistiques par projet
-        project_stats = {}
-        for task in self.tasks.values():
-            if task.project:
-                project_stats[task.project] = project_stats.get(task.project, 0) + 1
-        
-        # Statistiques par assigné
-        assignee_stats = {}
-        for task in self.tasks.values():
-            if task.assignee:
-                assignee_stats[task.assignee] = assignee_stats.get(task.assignee, 0) + 1
+        project_stats = {project: count for project, count in self._counts('project').items() if project}
+        assignee_stats = {assignee: count for assignee, count in self._counts('assignee').items() if assignee}
         
         return {
             'total_tasks': total_tasks,
@@ -186,78 +638,744 @@ class TaskManager:
             'by_assignee': assignee_stats
         }
     
-    def _save_to_file(self) -> None:
+    @read_locked
+    def query(self, where: Optional[Condition] = None, order_by: Union[str, List[str], None] = None,
+              limit: Optional[int] = None, offset: int = 0, **filters: Any) -> List[Task]:
         """
-        Sauvegarde les tâches dans le fichier JSON
+        Recherche les tâches satisfaisant une combinaison de conditions
+        
+        Les conditions s'expriment en arguments nommés (champ=valeur ou
+        champ__opérateur=valeur, opérateurs ne, in, lt, lte, gt, gte) ou
+        via des objets Q combinés avec & et |, par exemple
+        query(Q(status=Status.TODO) | Q(priority__gte=Priority.HIGH),
+        project="Alpha", due_date__lt="2024-07-01", order_by="-priority", limit=20).
+        
+        L'index le plus sélectif fournit les candidats, filtrés par les
+        autres index avant toute lecture de tâche ; seule la page demandée
+        est matérialisée (tas borné en cas de tri).
+        
+        Args:
+            where: Condition (Q, ou combinaison de Q avec & et |)
+            order_by: Champ(s) de tri, préfixe '-' pour un tri décroissant ;
+                sans tri, l'ordre des résultats n'est pas garanti
+            limit: Nombre maximal de tâches retournées
+            offset: Nombre de tâches à sauter
+            **filters: Conditions supplémentaires (en conjonction avec where)
+            
+        Returns:
+            Liste des tâches de la page demandée
+            
+        Raises:
+            ValueError: Si un champ, un opérateur ou une valeur est invalide
+            TypeError: Si la valeur d'un critère __in n'est pas une collection
+        """
+        condition: Condition = Q(**filters)
+        if where is not None:
+            condition = where & condition if filters else where
+        
+        if self._store is None:
+            self._ensure_index()
+            plan = plan_query(condition, self._index)
+        else:
+            plan = plan_query(condition, None)
+        candidates = (self.tasks.values() if plan.ids is None
+                      else (self.tasks[task_id] for task_id in plan.candidate_ids()))
+        return paginate((task for task in candidates if condition.matches(task)), order_by, limit, offset)
+    
+    @read_locked
+    def find_tasks(self, **criteria: Any) -> List[Task]:
+        """
+        Récupère les tâches dont chaque champ donné vaut la valeur donnée
+        
+        Contrairement aux filtres indexés (get_tasks_by_*), tout champ peut
+        être utilisé (due_date, title...). Les tâches en mémoire sont
+        parcourues directement ; en mode lazy, le fichier est lu par plages,
+        en parallèle pour les grands volumes, et seules les tâches retenues
+        sont construites.
+        
+        Args:
+            **criteria: Champ -> valeur attendue (énumérations acceptées)
+            
+        Returns:
+            Liste des tâches correspondantes
+            
+        Raises:
+            ValueError: Si un champ est inconnu
+        """
+        if self._lazy:
+            return self._scanner.filter_store(self.tasks, **criteria)
+        return self._scanner.filter(self.tasks.values(), **criteria)
+    
+    @read_locked
+    def count_tasks(self, field: str, **criteria: Any) -> Dict[Any, int]:
+        """
+        Compte les tâches par valeur d'un champ quelconque
+        
+        Args:
+            field: Champ à compter (les énumérations sont comptées par valeur)
+            **criteria: Filtre optionnel (champ -> valeur attendue)
+            
+        Returns:
+            Dictionnaire valeur -> nombre de tâches
+            
+        Raises:
+            ValueError: Si un champ est inconnu
+        """
+        if self._lazy:
+            return self._scanner.count_store(self.tasks, field, **criteria)
+        return self._scanner.count_by(self.tasks.values(), field, **criteria)
+    
+    @read_locked
+    def daily_report(self, date_: str) -> Dict[str, Any]:
+        """
+        Calcule le rapport quotidien (voir ReportService.generate_daily_report)
+        
+        Le rapport est cohérent : les écritures attendent la fin du calcul.
+        En mode lazy, le fichier est lu par plages, en parallèle pour les
+        grands volumes, et les comptes partiels sont additionnés.
+        
+        Args:
+            date_: Date (AAAA-MM-JJ) des créations ou modifications retenues
+            
+        Returns:
+            Statistiques du rapport
+        """
+        if self._lazy:
+            return self._scanner.daily_report_store(self.tasks, date_)
+        return self._scanner.daily_report(self.tasks.values(), date_)
+    
+    def search(self, text: str, limit: Optional[int] = 20) -> List[Task]:
+        """
+        Recherche plein texte dans les titres et descriptions
+        
+        Les tâches retournées contiennent tous les mots de la requête, sans
+        tenir compte des accents ni de la casse ; un mot terminé par * est
+        un préfixe et des mots entre guillemets forment une phrase, par
+        exemple search('revis* "documentation api"'). Les résultats sont
+        classés par pertinence (BM25, mots du titre favorisés).
+        
+        L'index inversé est construit à la première recherche puis tenu à
+        jour à chaque ajout, modification ou suppression.
+        
+        Args:
+            text: Requête
+            limit: Nombre maximal de tâches retournées (toutes si None)
+            
+        Returns:
+            Liste des tâches, de la plus pertinente à la moins pertinente
+        """
+        with self._lock.reading():
+            self._ensure_index()
+            if self._index.text is not None:
+                return self._search(text, limit)
+        with self._lock.writing():
+            self._ensure_index()
+            if self._index.text is None:
+                self._index.enable_full_text(self.tasks.values())
+            return self._search(text, limit)
+    
+    def _search(self, text: str, limit: Optional[int]) -> List[Task]:
+        """Exécute une recherche sur l'index plein texte construit"""
+        return [self.tasks[task_id] for task_id, _ in self._index.text.search(text, limit)]
+    
+    def _select(self, field: str, value: Any) -> List[Task]:
+        """
+        Récupère les tâches dont un champ indexé vaut la valeur donnée
+        
+        Args:
+            field: Champ indexé
+            value: Valeur recherchée
+            
+        Returns:
+            Liste des tâches correspondantes
+        """
+        if self._store is not None:
+            return self._store.select(field, value)
+        self._ensure_index()
+        return [self.tasks[task_id] for task_id in self._index.lookup(field, value)]
+    
+    def _counts(self, field: str) -> Dict[Any, int]:
+        """
+        Compte les tâches par valeur d'un champ indexé
+        
+        Args:
+            field: Champ indexé
+            
+        Returns:
+            Dictionnaire valeur -> nombre de tâches
+        """
+        if self._store is not None:
+            return self._store.counts(field)
+        self._ensure_index()
+        return self._index.counts(field)
+    
+    @contextmanager
+    def batch(self) -> Iterator['TaskManager']:
+        """
+        Regroupe plusieurs mutations en un lot persisté une seule fois
+        
+        Dans le bloc, add_task, update_task, delete_task et clear_all_tasks
+        ne sauvegardent rien ; la persistance a lieu une seule fois à la
+        sortie. Si le bloc lève une exception, toutes les mutations du lot
+        sont annulées en mémoire et rien n'est écrit. Les blocs imbriqués
+        rejoignent le lot englobant. Le verrou en écriture est détenu pendant
+        tout le bloc. Sans sauvegarde automatique, les mutations du lot
+        restent en attente du prochain flush().
+        
+        Returns:
+            Le gestionnaire lui-même
+        
+        Raises:
+            IOError: En cas d'erreur d'écriture lors de la sauvegarde finale
+        """
+        with self._lock.writing():
+            if self._batch_depth == 0 and self._store is not None:
+                # Isoler le lot des écritures en attente, que rollback() annulerait
+                self._store.commit()
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._rollback_batch()
+                raise
+            
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self.autosave:
+                    try:
+                        self._flush_pending()
+                    except Exception:
+                        self._rollback_batch()
+                        raise
+                for event in self._batch_events:
+                    self._changes.publish(*event)
+                self._end_batch()
+    
+    def _remember(self, task_id: str) -> None:
+        """
+        Mémorise l'état d'une tâche avant sa première modification dans un lot
+        
+        Args:
+            task_id: ID de la tâche sur le point d'être modifiée
+        """
+        if not self._batch_depth or task_id in self._batch_undo:
+            return
+        task = self.tasks.get(task_id)
+        self._batch_undo[task_id] = (task, copy.copy(task) if task else None)
+    
+    def _adopt(self, task: Task) -> None:
+        """
+        Rattache une tâche au gestionnaire : ses mutateurs passeront par update_task
+        
+        Args:
+            task: Tâche ajoutée, chargée ou lue depuis le stockage
+        """
+        task._owner = self._owner_ref
+    
+    @write_locked
+    def _update_owned(self, task: Task, fields: Dict[str, Any]) -> bool:
+        """
+        Applique via update_task la modification demandée par un mutateur
+        d'une tâche rattachée (Task.mark_completed...)
+        
+        Args:
+            task: Tâche dont un mutateur a été appelé
+            fields: Attributs à modifier
+            
+        Returns:
+            False si la tâche n'est plus détenue par le gestionnaire (supprimée,
+            ou remplacée par un rechargement) : elle est alors modifiée seule
+        """
+        current = self.tasks.get(task.id)
+        # En modes lazy et sqlite, une même tâche peut avoir été lue plusieurs fois
+        rereads = self._lazy or self._store is not None
+        if current is None or (current is not task and not rereads):
+            return False
+        self.update_task(task.id, **fields)
+        if current is not task:
+            updated = self.tasks[task.id]
+            for attr in fields:
+                setattr(task, attr, getattr(updated, attr))
+            task.updated_at = updated.updated_at
+        return True
+    
+    def _preserve(self, task: Task) -> None:
+        """
+        Copie une tâche pour les instantanés qui la partagent, avant sa
+        première modification en place depuis le dernier instantané
+        
+        Args:
+            task: Tâche sur le point d'être modifiée en place
+        """
+        if not self._snapshots:
+            self._copied_at.clear()
+            return
+        if self._copied_at.get(task.id) == self._snapshot_generation:
+            return  # Déjà copiée : les instantanés vivants ne la partagent plus
+        with self._snapshot_lock:
+            previous = None
+            for snapshot in list(self._snapshots):
+                if snapshot._shares(task):
+                    previous = previous or copy.copy(task)
+                    snapshot._detach(task, previous)
+            self._copied_at[task.id] = self._snapshot_generation
+    
+    def _flush_pending(self) -> None:
+        """Persiste en une fois les mutations en attente"""
+        if not self._pending and not self._pending_clear:
+            return
+        
+        journal_fits = (self._journal is not None and not self._pending_clear and not self._snapshot_stale
+                        and len(self._journal) + len(self._pending) < self.compact_threshold)
+        if not journal_fits:
+            self.compact()
+            return
+        
+        records = []
+        for task_id, op in self._pending.items():
+            task = self.tasks.get(task_id) if op == 'put' else None
+            if task is not None:
+                records.append({'op': 'put', 'task': task.to_dict()})
+            else:
+                records.append({'op': 'delete', 'id': task_id})
+        if self.fsync == 'always':
+            for record in records:
+                self._journal.append(record, sync=True)
+        else:
+            self._journal.append_many(records, sync=self.fsync == 'batch')
+        self._pending = {}
+    
+    @write_locked
+    def flush(self) -> None:
+        """
+        Persiste les mutations en attente (sans effet dans un lot en cours)
+        
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        if not self._batch_depth:
+            self._flush_pending()
+    
+    @property
+    def pending_changes(self) -> int:
+        """Nombre de mutations en attente de persistance"""
+        return len(self._pending) + (1 if self._pending_clear else 0)
+    
+    def _rollback_batch(self) -> None:
+        """Restaure en mémoire l'état antérieur au lot"""
+        for task_id, (task, previous) in self._batch_undo.items():
+            self._index.remove(task_id)
+            if task is None:
+                self.tasks.pop(task_id, None)
+                continue
+            self._preserve(task)
+            for attr in previous.to_dict():
+                setattr(task, attr, getattr(previous, attr))
+            self.tasks[task_id] = task
+            self._index.add(task)
+        if self._store is not None:
+            # Les restaurations ci-dessus sont annulées avec le reste du lot
+            self._store.rollback()
+        if self.autosave:
+            # Rien n'a été écrit : l'état restauré est celui du stockage
+            self._pending = {}
+            self._pending_clear = False
+        self._end_batch()
+    
+    def _emit(self, kind: str, task_id: str, task: Optional[Task],
+              changes: Optional[Dict[str, Tuple[Any, Any]]] = None) -> None:
+        """Publie un changement, ou le diffère jusqu'à la fin du lot en cours"""
+        # Les tâches sont modifiées sur place : l'événement garde l'état à cet
+        # instant, sans lien avec le gestionnaire (lu par d'autres threads)
+        task = copy.copy(task) if task is not None else None
+        if self._batch_depth:
+            self._batch_events.append((kind, task_id, task, changes))
+        else:
+            self._changes.publish(kind, task_id, task, changes)
+    
+    def subscribe(self, callback: Optional[Callable[[ChangeEvent], None]] = None,
+                  kinds: Optional[Iterable[str]] = None, maxsize: int = 1000) -> Subscription:
+        """
+        Abonne un consommateur aux changements des tâches
+        
+        Chaque ajout ('created'), mise à jour ('updated', avec les champs
+        modifiés) ou suppression ('deleted') produit un ChangeEvent numéroté.
+        Les changements d'un lot ne sont publiés qu'à sa validation. Avec
+        callback, la fonction est appelée de façon synchrone dans le thread
+        qui écrit, sous le verrou en écriture : elle doit être rapide et peut
+        relire le gestionnaire. Sans callback, les événements sont déposés
+        dans une file bornée à consommer depuis un autre thread.
+        
+        Args:
+            callback: Fonction recevant chaque ChangeEvent (None : file)
+            kinds: Types d'événements à recevoir (tous si None)
+            maxsize: Capacité de la file (sans callback)
+            
+        Returns:
+            Abonnement (unsubscribe() y met fin ; get() et drain() lisent la file)
+            
+        Raises:
+            ValueError: Si un type d'événement ou la capacité est invalide
+        """
+        if callback is None:
+            return self._changes.subscribe_queue(maxsize, kinds)
+        return self._changes.subscribe(callback, kinds)
+    
+    @read_locked
+    def changes_since(self, sequence: int) -> List[ChangeEvent]:
+        """
+        Récupère les changements postérieurs à un numéro de séquence
+        
+        Une structure dérivée se construit depuis un instantané (dont
+        l'attribut sequence donne le point de départ), puis applique les
+        changements suivants au lieu de tout recalculer.
+        
+        Args:
+            sequence: Dernier numéro de séquence déjà traité
+            
+        Returns:
+            Événements postérieurs, dans l'ordre
+            
+        Raises:
+            ValueError: Si une partie de ces changements n'est plus conservée
+                (historique dépassé ou rechargement complet) : l'appelant doit
+                repartir d'un nouvel instantané
+        """
+        return self._changes.changes_since(sequence)
+    
+    @property
+    def change_sequence(self) -> int:
+        """Numéro de séquence du dernier changement publié"""
+        return self._changes.sequence
+    
+    def _end_batch(self) -> None:
+        """Réinitialise l'état du lot"""
+        self._batch_undo = {}
+        self._batch_events = []
+    
+    def _persist_put(self, task: Task) -> None:
+        """
+        Persiste l'ajout ou la modification d'une tâche
+        
+        Args:
+            task: Tâche ajoutée ou modifiée
+        """
+        if self._batch_depth or not self.autosave:
+            self._pending[task.id] = 'put'
+            self._notify_pending()
+            return
+        if self._journal is None or self._snapshot_stale:
+            self.compact()
+            return
+        self._journal.append({'op': 'put', 'task': task.to_dict()}, sync=self.fsync != 'never')
+        self._maybe_compact()
+    
+    def _persist_delete(self, task_id: str) -> None:
+        """
+        Persiste la suppression d'une tâche
+        
+        Args:
+            task_id: ID de la tâche supprimée
+        """
+        if self._batch_depth or not self.autosave:
+            self._pending[task_id] = 'delete'
+            self._notify_pending()
+            return
+        if self._journal is None or self._snapshot_stale:
+            self.compact()
+            return
+        self._journal.append({'op': 'delete', 'id': task_id}, sync=self.fsync != 'never')
+        self._maybe_compact()
+    
+    def _notify_pending(self) -> None:
+        """Signale une mutation en attente au thread de persistance éventuel"""
+        if self._persister is not None:
+            self._persister.notify()
+    
+    def _maybe_compact(self) -> None:
+        """Compacte le journal s'il a dépassé le seuil configuré"""
+        if len(self._journal) >= self.compact_threshold:
+            self.compact()
+    
+    @write_locked
+    def compact(self) -> None:
+        """
+        Écrit un snapshot complet des tâches puis vide le journal
+        
+        Sans journal, équivaut à une sauvegarde complète. Avec un backend
+        transactionnel, valide simplement les écritures en cours.
+        
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        if self._store is not None:
+            self._store.commit()
+        else:
+            self._save_to_file()
+            if self._journal is not None:
+                self._journal.reset()
+            self._snapshot_stale = False
+        if not self._batch_depth:
+            self._pending = {}
+            self._pending_clear = False
+    
+    def _save_to_file(self, filename: Optional[str] = None, file_format: Optional[str] = None,
+                      compression: Optional[str] = None) -> None:
+        """
+        Sauvegarde les tâches dans le fichier de stockage (remplacement atomique)
+        
+        Args:
+            filename: Fichier de destination (utilise self.storage_file si None)
+            file_format: Format d'écriture (utilise self.file_format si None)
+            compression: Compression (utilise self.compression si le format
+                n'est pas non plus précisé)
         
         Raises:
             IOError: En cas d'erreur d'écriture
         """
+        path = filename or self.storage_file
         try:
             tasks_data = [task.to_dict() for task in self.tasks.values()]
             
             # Créer le dossier parent si nécessaire (seulement si le chemin contient des dossiers)
-            dirname = os.path.dirname(self.storage_file)
+            dirname = os.path.dirname(path)
             if dirname:
                 os.makedirs(dirname, exist_ok=True)
             
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(tasks_data, f, indent=2, ensure_ascii=False)
+            if file_format is None and compression is None:
+                file_format, compression = self.file_format, self.compression
+            elif file_format is None:
+                file_format = self.file_format
+            
+            # Écriture dans un fichier temporaire puis renommage : un crash
+            # ne laisse jamais le fichier de stockage tronqué
+            with atomic_write(path, mode='wb', fsync=self.fsync != 'never',
+                              fsync_dir=self.fsync == 'always') as f:
+                dump_tasks(tasks_data, f, file_format, compression)
+            
+            # Le fichier a changé : réindexer les positions des enregistrements
+            if self._lazy and filename is None:
+                self.tasks.load(path, self._report_load_error)
                 
         except Exception as e:
-            raise IOError(f"Erreur lors de la sauvegarde dans {self.storage_file}: {str(e)}")
+            raise IOError(f"Erreur lors de la sauvegarde dans {path}: {str(e)}")
     
-    def _load_from_file(self) -> None:
+    def _load_from_file(self, filename: Optional[str] = None) -> None:
         """
-        Charge les tâches depuis le fichier JSON
+        Charge les tâches depuis le fichier de stockage
+        
+        Lors du chargement du fichier de stockage principal, le journal
+        éventuel est rejoué par-dessus le snapshot.
+        
+        Args:
+            filename: Fichier source (utilise self.storage_file si None)
         
         Raises:
             IOError: En cas d'erreur de lecture
             ValueError: En cas d'erreur de format JSON
         """
-        if not os.path.exists(self.storage_file):
-            return  # Fichier n'existe pas encore, pas d'erreur
+        path = filename or self.storage_file
+        self.load_errors = []
+        if self._store is not None and filename is None:
+            return  # La base est elle-même la source des tâches
+        if os.path.exists(path):
+            self._load_snapshot(path)
+        
+        if filename is None:
+            if self._journal is not None:
+                self._replay_journal()
+            self._snapshot_stale = False
+        
+        if self._lazy:
+            self._index.clear()
+            self._index_ready = False
+        elif self._store is None:
+            self._index.rebuild(self.tasks.values())
+        else:
+            self._index.disable_full_text()
+        
+        if filename is None and self._shared:
+            self._record_generation()
+    
+    def _snapshot_signature(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Calcule la signature (inode, date de modification, taille) du fichier
+        de stockage ; une réécriture atomique change au moins l'inode
         
+        Returns:
+            Signature du fichier, ou None s'il n'existe pas
+        """
         try:
-            with open(self.storage_file, 'r', encoding='utf-8') as f:
-                tasks_data = json.load(f)
-            
+            st = os.stat(self.storage_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _record_generation(self) -> None:
+        """Mémorise l'état du fichier de stockage reflété en mémoire"""
+        self._generation = self._snapshot_signature()
+    
+    def _refresh(self) -> None:
+        """
+        Intègre les changements faits par d'autres processus (mode partagé)
+        
+        Appelé sous le verrou de fichier. Si le fichier de stockage a été
+        réécrit, tout est rechargé ; si seul le journal a grandi, seules les
+        nouvelles entrées sont rejouées ; sinon rien n'est relu. Les
+        mutations locales en attente sont réappliquées par-dessus.
+        """
+        reload = self._snapshot_signature() != self._generation
+        replay = False
+        if not reload and self._journal is not None:
+            size = self._journal.size()
+            # Journal raccourci : compacté par un autre processus
+            reload = size < self._journal.offset
+            replay = size > self._journal.offset
+        if not reload and not replay:
+            return
+        
+        local = {task_id: self.tasks.get(task_id) for task_id in self._pending}
+        # Changements d'autres processus, sans événements locaux
+        self._changes.reset()
+        if reload:
+            self._load_from_file()
+        else:
+            self._replay_journal(self._journal.offset)
+        
+        if self._pending_clear:
             self.tasks.clear()
-            for task_data in tasks_data:
+            self._index.clear()
+        for task_id, task in local.items():
+            if task is not None:
+                self.tasks[task_id] = task
+                self._index.add(task)
+            elif self.tasks.pop(task_id, None) is not None:
+                self._index.remove(task_id)
+    
+    def _ensure_index(self) -> None:
+        """Construit les index s'ils ne l'ont pas encore été (mode lazy)"""
+        if not self._index_ready:
+            self._index.rebuild(self.tasks.values())
+            self._index_ready = True
+    
+    def _load_snapshot(self, path: str) -> None:
+        """
+        Charge un snapshot complet des tâches
+        
+        Le format (JSON ou binaire) et la compression sont détectés
+        automatiquement. Le fichier est analysé en flux : chaque tâche est construite dès que
+        son enregistrement est lu, sans matérialiser la liste complète des
+        dictionnaires. Les tâches invalides sont ignorées et consignées dans
+        self.load_errors. En cas d'erreur, les tâches en mémoire sont conservées.
+        
+        Args:
+            path: Chemin du fichier à charger
+        
+        Raises:
+            IOError: En cas d'erreur de lecture
+            ValueError: En cas d'erreur de format (JSON, binaire ou compression)
+        """
+        try:
+            if self._lazy:
+                store = LazyTaskStore(self.tasks.max_resident, self._adopt)
+                store.load(path, self._report_load_error)
+                self.tasks = store
+                return
+            
+            loaded: Dict[str, Task] = {}
+            for task_data in iter_task_records(path):
                 try:
                     task = Task.from_dict(task_data)
-                    self.tasks[task.id] = task
-                except (KeyError, ValueError) as e:
-                    print(f"Erreur lors du chargement d'une tâche: {e}")
+                except (KeyError, ValueError, TypeError) as e:
+                    self._report_load_error(f"Erreur lors du chargement d'une tâche: {e!r}")
                     continue
-                    
+                self._adopt(task)
+                loaded[task.id] = task
+            
+            if self._store is not None:
+                self._store.replace(loaded.values())
+                self._store.commit()
+            else:
+                self.tasks = loaded
+            
         except json.JSONDecodeError as e:
-            raise ValueError(f"Format JSON invalide dans {self.storage_file}: {str(e)}")
+            raise ValueError(f"Format JSON invalide dans {path}: {str(e)}")
+        except ValueError as e:
+            raise ValueError(f"Format invalide dans {path}: {str(e)}")
         except Exception as e:
-            raise IOError(f"Erreur lors du chargement depuis {self.storage_file}: {str(e)}")
+            raise IOError(f"Erreur lors du chargement depuis {path}: {str(e)}")
     
-    def save_to_file(self, filename: Optional[str] = None) -> None:
+    def _replay_journal(self, start: int = 0) -> None:
+        """
+        Rejoue les mutations du journal sur les tâches chargées
+        
+        Args:
+            start: Position (en octets) des premières entrées à rejouer
+        """
+        for record in self._journal.replay(start):
+            op = record.get('op')
+            if op == 'put':
+                try:
+                    task = Task.from_dict(record['task'])
+                except (KeyError, ValueError, TypeError) as e:
+                    self._report_load_error(f"Erreur lors du rejeu d'une entrée du journal: {e!r}")
+                    continue
+                self._adopt(task)
+                self.tasks[task.id] = task
+                self._index.add(task)
+            elif op == 'delete':
+                task_id = record.get('id')
+                if self.tasks.pop(task_id, None) is not None:
+                    self._index.remove(task_id)
+    
+    def _report_load_error(self, message: str) -> None:
+        """
+        Consigne une tâche ignorée lors du chargement
+        
+        Args:
+            message: Description de l'erreur
+        """
+        self.load_errors.append(message)
+        logger.warning(message)
+    
+    @write_locked
+    def save_to_file(self, filename: Optional[str] = None, file_format: Optional[str] = None,
+                     compression: Optional[str] = None) -> None:
         """
         Sauvegarde les tâches dans un fichier spécifique
         
         Args:
             filename: Nom du fichier (utilise self.storage_file si None)
+            file_format: Format de la copie ("json", "json-min" ou "binary") ;
+                ceux du gestionnaire si None
+            compression: Compression de la copie (None, "gzip", "zlib" ou "lzma")
             
         Raises:
             IOError: En cas d'erreur d'écriture
+            ValueError: Si un format est demandé pour le fichier de stockage
         """
+        if file_format is not None and file_format not in FILE_FORMATS:
+            raise ValueError(f"Format de fichier inconnu : {file_format}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Compression inconnue : {compression}")
         if filename:
-            original_file = self.storage_file
-            self.storage_file = filename
-            self._save_to_file()
-            self.storage_file = original_file
+            self._save_to_file(filename, file_format, compression)
+        elif file_format is not None or compression is not None:
+            raise ValueError("Le format du fichier de stockage est fixé à la création du gestionnaire")
         else:
-            self._save_to_file()
+            self.compact()
     
+    @write_locked
     def load_from_file(self, filename: str) -> None:
         """
         Charge les tâches depuis un fichier spécifique
         
+        Les tâches chargées remplacent celles en mémoire ; elles sont
+        persistées par un snapshot complet lors de la prochaine écriture
+        (jamais par le journal, qui s'appliquerait à l'ancien fichier).
+        
         Args:
             filename: Nom du fichier à charger
             
@@ -265,16 +1383,49 @@ class TaskManager:
             IOError: En cas d'erreur de lecture
             ValueError: En cas d'erreur de format JSON
         """
-        original_file = self.storage_file
-        self.storage_file = filename
-        self._load_from_file()
-        self.storage_file = original_file
+        self._load_from_file(filename)
+        self._snapshot_stale = self._store is None
+        # Remplacement complet, sans événements : les abonnés se resynchronisent
+        self._changes.reset()
     
+    @write_locked
     def clear_all_tasks(self) -> None:
         """Supprime toutes les tâches"""
+        if self._batch_depth:
+            for task_id in self.tasks:
+                self._remember(task_id)
+        removed = list(self.tasks.values())
         self.tasks.clear()
-        self._save_to_file()
+        self._index.clear()
+        for task in removed:
+            self._emit(DELETED, task.id, task)
+        if self._batch_depth or not self.autosave:
+            self._pending.clear()
+            self._pending_clear = True
+            return
+        self.compact()
+    
+    def close(self) -> None:
+        """
+        Persiste les mutations en attente puis libère les ressources (thread
+        de persistance, connexion SQLite, verrou de fichier, pool de processus)
+        
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        # Arrêter le thread avant de prendre le verrou qu'il peut attendre
+        if self._persister is not None:
+            self._persister.stop(flush=False)
+        with self._lock.writing():
+            if not self._batch_depth:
+                self._flush_pending()
+            if self._store is not None:
+                self._store.close()
+        if self._shared:
+            self._lock.file_lock.close()
+        self._scanner.close()
     
+    @read_locked
     def __len__(self) -> int:
         """Retourne le nombre de tâches"""
         return len(self.tasks)
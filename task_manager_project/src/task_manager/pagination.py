@@ -0,0 +1,107 @@
+import base64
+import binascii
+import json
+from typing import Iterator, List, Optional, Tuple
+
+from .task import Task
+
+
+# Ordres de pagination stables : l'ID départage les dates de création égales
+PAGE_ORDERS = ('created_at', 'id')
+
+
+def order_key(task: Task, order_by: str) -> Tuple[str, str]:
+    """
+    Calcule la clé de tri d'une tâche pour un ordre de pagination
+
+    Args:
+        task: Tâche
+        order_by: Ordre de pagination (voir PAGE_ORDERS)
+
+    Returns:
+        Couple (valeur du champ, ID), unique pour chaque tâche
+    """
+    return (getattr(task, order_by) or '', task.id)
+
+
+def encode_cursor(order_by: str, descending: bool, key: Tuple[str, str]) -> str:
+    """
+    Encode la position d'une page dans un curseur opaque
+
+    Args:
+        order_by: Ordre de pagination
+        descending: Sens de parcours
+        key: Clé de la dernière tâche de la page (voir order_key)
+
+    Returns:
+        Curseur utilisable dans une URL
+    """
+    payload = json.dumps([order_by, descending, key[0], key[1]], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str, order_by: str, descending: bool) -> Tuple[str, str]:
+    """
+    Décode un curseur produit par encode_cursor
+
+    Args:
+        cursor: Curseur
+        order_by: Ordre de pagination attendu
+        descending: Sens de parcours attendu
+
+    Returns:
+        Clé de la dernière tâche déjà retournée
+
+    Raises:
+        ValueError: Si le curseur est illisible, mal formé (ordre inconnu,
+            sens non booléen, valeur ou ID non textuels) ou a été produit
+            pour un autre ordre de pagination
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValueError(f"Curseur invalide : {e}")
+    if not isinstance(payload, list) or len(payload) != 4:
+        raise ValueError("Curseur invalide : contenu mal formé")
+    cursor_order, cursor_descending, value, task_id = payload
+    if cursor_order not in PAGE_ORDERS or not isinstance(cursor_descending, bool):
+        raise ValueError("Curseur invalide : ordre de pagination mal formé")
+    if not isinstance(value, str) or not isinstance(task_id, str):
+        raise ValueError("Curseur invalide : position mal formée")
+    if cursor_order != order_by or cursor_descending != descending:
+        raise ValueError("Curseur invalide : produit pour un autre ordre de pagination")
+    return (value, task_id)
+
+
+class TaskPage:
+    """Page de tâches et curseur de la page suivante (None s'il n'y en a pas)"""
+
+    def __init__(self, tasks: List[Task], next_cursor: Optional[str] = None):
+        self.tasks = tasks
+        self.next_cursor = next_cursor
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self.tasks)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __repr__(self) -> str:
+        return f"TaskPage({len(self.tasks)} tâches, next_cursor={self.next_cursor!r})"
+
+
+def check_page_args(order_by: str, limit: int) -> None:
+    """
+    Valide les paramètres d'une demande de page
+
+    Args:
+        order_by: Ordre de pagination
+        limit: Taille de page
+
+    Raises:
+        ValueError: Si l'ordre est inconnu ou la taille de page non positive
+    """
+    if order_by not in PAGE_ORDERS:
+        raise ValueError(f"Ordre de pagination inconnu : {order_by} (attendu : {', '.join(PAGE_ORDERS)})")
+    if limit <= 0:
+        raise ValueError("La taille de page doit être positive")
@@ -0,0 +1,348 @@
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .task import Task, Priority, Status
+
+
+# Champs d'une tâche utilisables dans les filtres et comptages
+SCAN_FIELDS = ('id', 'title', 'description', 'priority', 'status', 'project',
+               'assignee', 'due_date', 'created_at', 'updated_at')
+_ENUMS = {'priority': Priority, 'status': Status}
+# Champs sans lesquels un enregistrement est invalide (voir Task.from_dict)
+_REQUIRED = ('id', 'title', 'priority', 'status', 'created_at', 'updated_at')
+_VALID_VALUES = {field: frozenset(member.value for member in enum_cls) for field, enum_cls in _ENUMS.items()}
+
+Conditions = Tuple[Tuple[str, Any], ...]
+
+
+def _check_field(field: str, usage: str) -> None:
+    """
+    Vérifie qu'un champ peut être parcouru
+
+    Raises:
+        ValueError: Si le champ est inconnu
+    """
+    if field not in SCAN_FIELDS:
+        raise ValueError(f"Champ de {usage} inconnu : {field}")
+
+
+def _task_conditions(criteria: Dict[str, Any]) -> Conditions:
+    """
+    Convertit des critères en couples (champ, valeur) comparables aux
+    attributs d'une tâche (valeur d'énumération -> membre)
+
+    Raises:
+        ValueError: Si un champ est inconnu
+    """
+    conditions = []
+    for field, value in criteria.items():
+        _check_field(field, 'filtrage')
+        enum_cls = _ENUMS.get(field)
+        if enum_cls is not None and not isinstance(value, Enum):
+            value = next((member for member in enum_cls if member.value == value), value)
+        conditions.append((field, value))
+    return tuple(conditions)
+
+
+def _record_conditions(criteria: Dict[str, Any]) -> Conditions:
+    """
+    Convertit des critères en couples (champ, valeur) comparables aux
+    enregistrements du fichier (membre d'énumération -> valeur)
+
+    Raises:
+        ValueError: Si un champ est inconnu
+    """
+    conditions = []
+    for field, value in criteria.items():
+        _check_field(field, 'filtrage')
+        conditions.append((field, value.value if isinstance(value, Enum) else value))
+    return tuple(conditions)
+
+
+def _select_tasks(tasks: Iterable[Task], conditions: Conditions) -> List[Task]:
+    """
+    Tâches satisfaisant toutes les conditions
+
+    Chaque condition est appliquée à son tour aux tâches retenues par les
+    précédentes ; les attributs sont lus par attrgetter, sans appel de
+    fonction Python par tâche.
+    """
+    selected = tasks if isinstance(tasks, list) else list(tasks)
+    for field, value in conditions:
+        selected = [task for task, actual in zip(selected, map(attrgetter(field), selected)) if actual == value]
+    return selected
+
+
+def _count_key(value: Any) -> Any:
+    """Clé de comptage : les énumérations sont comptées par valeur"""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _read_records(path: str, start: int, end: int, excluded: FrozenSet[str]) -> List[Dict[str, Any]]:
+    """
+    Lit les enregistrements valides d'une plage d'octets du fichier JSON
+
+    La plage va du début d'un enregistrement à la fin d'un autre : entre
+    crochets, elle forme un tableau JSON. Les enregistrements dont l'ID est
+    exclu (modifiés ou supprimés depuis l'écriture du fichier) ou qui ne
+    pourraient pas être chargés sont ignorés.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    records = []
+    for record in json.loads(b'[' + raw + b']'):
+        if not isinstance(record, dict) or any(field not in record for field in _REQUIRED):
+            continue
+        if not isinstance(record['id'], str) or record['id'] in excluded:
+            continue
+        if any(not isinstance(record[field], str) or record[field] not in values
+               for field, values in _VALID_VALUES.items()):
+            continue
+        records.append(record)
+    return records
+
+
+def _filter_range(path: str, start: int, end: int, excluded: FrozenSet[str],
+                  conditions: Conditions) -> List[str]:
+    """IDs des enregistrements d'une plage satisfaisant toutes les conditions"""
+    return [record['id'] for record in _read_records(path, start, end, excluded)
+            if all(record.get(field) == value for field, value in conditions)]
+
+
+def _count_range(path: str, start: int, end: int, excluded: FrozenSet[str], field: str,
+                 conditions: Conditions) -> Dict[Any, int]:
+    """Compte les valeurs d'un champ parmi les enregistrements d'une plage satisfaisant les conditions"""
+    return Counter(record.get(field) for record in _read_records(path, start, end, excluded)
+                   if all(record.get(f) == value for f, value in conditions))
+
+
+def _empty_report(date_: str) -> Dict[str, Any]:
+    """Rapport quotidien sans aucune tâche"""
+    return {'date': date_, 'total': 0, 'completed': 0, 'in_progress': 0,
+            'todo': 0, 'urgent': 0, 'by_assignee': {}}
+
+
+def _report_range(path: str, start: int, end: int, excluded: FrozenSet[str], date_: str) -> Dict[str, Any]:
+    """Rapport quotidien partiel des enregistrements d'une plage"""
+    report = _empty_report(date_)
+    by_assignee = report['by_assignee']
+    for record in _read_records(path, start, end, excluded):
+        if not (record['created_at'].startswith(date_) or record['updated_at'].startswith(date_)):
+            continue
+        report['total'] += 1
+        if record['status'] in ('completed', 'in_progress', 'todo'):
+            report[record['status']] += 1
+        if record['priority'] == 'urgent':
+            report['urgent'] += 1
+        assignee = record.get('assignee')
+        if assignee:
+            by_assignee[assignee] = by_assignee.get(assignee, 0) + 1
+    return report
+
+
+def _merge_reports(date_: str, partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Additionne des rapports quotidiens partiels"""
+    report = _empty_report(date_)
+    partials = list(partials)
+    for key in ('total', 'completed', 'in_progress', 'todo', 'urgent'):
+        report[key] = sum(partial[key] for partial in partials)
+    report['by_assignee'] = _merge_counts(partial['by_assignee'] for partial in partials)
+    return report
+
+
+def _merge_counts(partials: Iterable[Dict[Any, int]]) -> Dict[Any, int]:
+    """Additionne des compteurs partiels"""
+    merged: Dict[Any, int] = {}
+    for counts in partials:
+        for key, count in counts.items():
+            merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+class ParallelScanner:
+    """
+    Parcours complets des tâches (filtres et comptages sur tout champ)
+
+    Les tâches en mémoire sont parcourues directement dans le processus
+    courant : un parcours d'objets Task est plus rapide que leur envoi à
+    d'autres processus. Seul un store lazy, dont les tâches sont dans le
+    fichier et non en mémoire, est découpé en plages d'octets que des
+    processus lisent et filtrent eux-mêmes ; il faut pour cela au moins
+    min_tasks tâches et deux processus, sinon ces plages sont lues dans le
+    processus courant. Le pool est créé au premier parcours parallèle puis
+    réutilisé.
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_tasks: int = 50000,
+                 chunk_size: Optional[int] = None):
+        """
+        Initialise le parcours
+
+        Args:
+            workers: Nombre de processus (nombre de cœurs si None)
+            min_tasks: Nombre de tâches d'un store lazy à partir duquel le pool est utilisé
+            chunk_size: Nombre d'enregistrements par plage (par défaut, deux plages par processus)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_tasks = min_tasks
+        self.chunk_size = chunk_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def filter(self, tasks: Iterable[Task], **criteria: Any) -> List[Task]:
+        """
+        Récupère les tâches dont chaque champ donné vaut la valeur donnée
+
+        Args:
+            tasks: Tâches à parcourir
+            **criteria: Champ (voir SCAN_FIELDS) -> valeur attendue
+
+        Returns:
+            Tâches correspondantes, dans l'ordre d'origine
+
+        Raises:
+            ValueError: Si un champ est inconnu
+        """
+        return _select_tasks(tasks, _task_conditions(criteria))
+
+    def count_by(self, tasks: Iterable[Task], field: str, **criteria: Any) -> Dict[Any, int]:
+        """
+        Compte les tâches par valeur d'un champ
+
+        Args:
+            tasks: Tâches à parcourir
+            field: Champ à compter (les énumérations sont comptées par valeur)
+            **criteria: Filtre optionnel (champ -> valeur attendue)
+
+        Returns:
+            Dictionnaire valeur -> nombre de tâches
+
+        Raises:
+            ValueError: Si un champ est inconnu
+        """
+        _check_field(field, 'comptage')
+        counts = Counter(map(attrgetter(field), _select_tasks(tasks, _task_conditions(criteria))))
+        return {_count_key(value): count for value, count in counts.items()}
+
+    def daily_report(self, tasks: Iterable[Task], date_: str) -> Dict[str, Any]:
+        """
+        Calcule le rapport quotidien (voir ReportService.generate_daily_report)
+
+        Args:
+            tasks: Tâches à parcourir
+            date_: Date (AAAA-MM-JJ) des créations ou modifications retenues
+
+        Returns:
+            Statistiques du rapport
+        """
+        report = _empty_report(date_)
+        by_assignee = report['by_assignee']
+        for task in tasks:
+            if not (task.created_at.startswith(date_) or task.updated_at.startswith(date_)):
+                continue
+            report['total'] += 1
+            if task.status in (Status.COMPLETED, Status.IN_PROGRESS, Status.TODO):
+                report[task.status.value] += 1
+            if task.priority == Priority.URGENT:
+                report['urgent'] += 1
+            if task.assignee:
+                by_assignee[task.assignee] = by_assignee.get(task.assignee, 0) + 1
+        return report
+
+    def daily_report_store(self, store: Any, date_: str) -> Dict[str, Any]:
+        """
+        Calcule le rapport quotidien d'un store lazy en lisant le fichier
+        par plages, sans construire les tâches
+
+        Args:
+            store: LazyTaskStore
+            date_: Date (AAAA-MM-JJ) des créations ou modifications retenues
+
+        Returns:
+            Statistiques du rapport
+        """
+        partials = self._map_store(store, _report_range, date_)
+        partials.append(self.daily_report(store.overridden_tasks(), date_))
+        return _merge_reports(date_, partials)
+
+    def filter_store(self, store: Any, **criteria: Any) -> List[Task]:
+        """
+        Filtre un store lazy en lisant le fichier par plages, sans construire
+        les tâches écartées
+
+        Args:
+            store: LazyTaskStore
+            **criteria: Champ (voir SCAN_FIELDS) -> valeur attendue
+
+        Returns:
+            Tâches correspondantes, dans l'ordre du store
+
+        Raises:
+            ValueError: Si un champ est inconnu
+        """
+        task_conditions = _task_conditions(criteria)
+        partials = self._map_store(store, _filter_range, _record_conditions(criteria))
+        matched = {task_id for ids in partials for task_id in ids}
+        # Tâches modifiées depuis l'écriture du fichier : évaluées en mémoire
+        matched.update(task.id for task in _select_tasks(store.overridden_tasks(), task_conditions))
+        return [store[task_id] for task_id in store if task_id in matched]
+
+    def count_store(self, store: Any, field: str, **criteria: Any) -> Dict[Any, int]:
+        """
+        Compte les tâches d'un store lazy par valeur d'un champ, en lisant
+        le fichier par plages
+
+        Args:
+            store: LazyTaskStore
+            field: Champ à compter (les énumérations sont comptées par valeur)
+            **criteria: Filtre optionnel (champ -> valeur attendue)
+
+        Returns:
+            Dictionnaire valeur -> nombre de tâches
+
+        Raises:
+            ValueError: Si un champ est inconnu
+        """
+        _check_field(field, 'comptage')
+        task_conditions = _task_conditions(criteria)
+        partials = self._map_store(store, _count_range, field, _record_conditions(criteria))
+        partials.append(self.count_by(store.overridden_tasks(), field, **dict(task_conditions)))
+        return _merge_counts(partials)
+
+    def _map_store(self, store: Any, func: Callable, *args: Any) -> List[Any]:
+        """
+        Applique une fonction à chaque plage d'enregistrements du fichier d'un store lazy
+
+        Returns:
+            Résultats partiels, dans l'ordre des plages
+        """
+        parallel = self.workers > 1 and len(store) >= max(self.min_tasks, 2)
+        parts = self.workers * 2 if parallel else 1
+        ranges = store.file_ranges(parts, self.chunk_size)
+        if not ranges:
+            return []
+        excluded = frozenset(store.overridden_ids())
+        if not parallel:
+            return [func(store.path, start, end, excluded, *args) for start, end in ranges]
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        futures = [self._pool.submit(func, store.path, start, end, excluded, *args) for start, end in ranges]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Arrête le pool de processus s'il a été créé"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> 'ParallelScanner':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
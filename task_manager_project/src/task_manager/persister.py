@@ -0,0 +1,90 @@
+import atexit
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundPersister:
+    """
+    Thread de persistance différée (write-behind) d'un TaskManager
+
+    Le gestionnaire, en mode sans sauvegarde automatique, signale chaque
+    mutation ; le thread persiste les mutations en attente au plus une fois
+    par intervalle, ou plus tôt dès que max_pending mutations se sont
+    accumulées. Une rafale de mutations est ainsi regroupée en une seule
+    écriture, et au plus `interval` secondes de mutations peuvent être
+    perdues en cas d'arrêt brutal. Une dernière écriture a lieu à l'arrêt,
+    y compris à la sortie de l'interpréteur.
+    """
+
+    def __init__(self, manager, interval: float = 0.5, max_pending: int = 1000):
+        """
+        Initialise le thread (sans le démarrer)
+
+        Args:
+            manager: Gestionnaire à persister (TaskManager)
+            interval: Délai maximal (en secondes) entre une mutation et son écriture
+            max_pending: Nombre de mutations en attente déclenchant une écriture anticipée
+        """
+        self.manager = manager
+        self.interval = interval
+        self.max_pending = max_pending
+        # Mutations signalées depuis la dernière écriture (une même tâche
+        # modifiée plusieurs fois compte plusieurs fois)
+        self._changes = 0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="task-persister", daemon=True)
+
+    def start(self) -> None:
+        """Démarre le thread et enregistre l'écriture finale à la sortie"""
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def notify(self) -> None:
+        """Signale une mutation en attente (appelé une fois par mutation)"""
+        self._changes += 1
+        if self._changes >= self.max_pending:
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        """Boucle du thread : attendre, puis persister ce qui est en attente"""
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                break
+            self._flush()
+
+    def _flush(self) -> None:
+        """Persiste les mutations en attente en consignant les erreurs"""
+        self._changes = 0
+        if not self.manager.pending_changes:
+            return
+        try:
+            self.manager.flush()
+        except Exception:
+            # Les mutations restent en attente : la prochaine écriture réessaiera
+            logger.exception("Erreur lors de la sauvegarde différée des tâches")
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Arrête le thread
+
+        Args:
+            flush: Si True, persiste une dernière fois les mutations en attente
+        """
+        atexit.unregister(self.stop)
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        if flush:
+            self._flush()
+
+    @property
+    def running(self) -> bool:
+        """Indique si le thread est actif"""
+        return self._thread.is_alive()
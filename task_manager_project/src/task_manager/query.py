@@ -0,0 +1,363 @@
+import heapq
+from abc import ABC, abstractmethod
+from datetime import date
+from enum import Enum
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .task import Task, Priority, Status
+from .indexes import TaskIndex, due_key
+
+
+QUERY_FIELDS = ('id', 'title', 'description', 'priority', 'status', 'project',
+                'assignee', 'due_date', 'created_at', 'updated_at')
+_ENUM_FIELDS = {'priority': Priority, 'status': Status}
+# Rang de chaque membre dans l'ordre de déclaration (LOW < ... < URGENT)
+_RANKS = {member: rank for enum_cls in _ENUM_FIELDS.values() for rank, member in enumerate(enum_cls)}
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    'lt': lambda left, right: left < right,
+    'lte': lambda left, right: left <= right,
+    'gt': lambda left, right: left > right,
+    'gte': lambda left, right: left >= right,
+}
+LOOKUP_OPERATORS = ('eq', 'ne', 'in') + tuple(_COMPARISONS)
+
+
+def _normalize(field: str, value: Any) -> Any:
+    """Convertit une valeur de critère dans la représentation des tâches"""
+    if field in _ENUM_FIELDS and value is not None and not isinstance(value, Enum):
+        return _ENUM_FIELDS[field](value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+class Lookup:
+    """Condition élémentaire sur un champ (ex: due_date__lt="2024-06-01")"""
+
+    __slots__ = ('field', 'op', 'value')
+
+    def __init__(self, field: str, op: str, value: Any):
+        """
+        Initialise la condition
+
+        Args:
+            field: Champ de la tâche (voir QUERY_FIELDS)
+            op: Opérateur (voir LOOKUP_OPERATORS)
+            value: Valeur de comparaison (itérable de valeurs pour 'in')
+
+        Raises:
+            ValueError: Si le champ, l'opérateur ou la valeur est invalide
+            TypeError: Si la valeur de 'in' est une chaîne ou n'est pas itérable
+        """
+        if field not in QUERY_FIELDS:
+            raise ValueError(f"Champ de requête inconnu : {field}")
+        if op not in LOOKUP_OPERATORS:
+            raise ValueError(f"Opérateur de requête inconnu : {op}")
+        if op == 'in':
+            # Une chaîne serait parcourue caractère par caractère
+            if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+                raise TypeError(f"Liste de valeurs attendue pour {field}__in : {value!r}")
+            value = tuple(_normalize(field, item) for item in value)
+        elif field == 'due_date' and op in _COMPARISONS:
+            # Les échéances sont comparées en dates (fuseaux horaires compris)
+            key = due_key(value)
+            if key is None:
+                raise ValueError(f"Échéance invalide : {value!r}")
+            value = key
+        else:
+            value = _normalize(field, value)
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def matches(self, task: Task) -> bool:
+        """Indique si la tâche satisfait la condition"""
+        actual = getattr(task, self.field)
+        if self.op == 'eq':
+            return actual == self.value
+        if self.op == 'ne':
+            return actual != self.value
+        if self.op == 'in':
+            return actual in self.value
+        if actual is None or self.value is None:
+            return False
+        if self.field in _ENUM_FIELDS:
+            return _COMPARISONS[self.op](_RANKS[actual], _RANKS[self.value])
+        if self.field == 'due_date':
+            actual = due_key(actual)
+            return actual is not None and _COMPARISONS[self.op](actual, self.value)
+        return _COMPARISONS[self.op](actual, self.value)
+
+    def __repr__(self) -> str:
+        return f"Lookup({self.field}__{self.op}={self.value!r})"
+
+
+class Condition(ABC):
+    """Condition de requête, combinable avec & (et) et | (ou)"""
+
+    @abstractmethod
+    def matches(self, task: Task) -> bool:
+        """Indique si la tâche satisfait la condition"""
+
+    def __and__(self, other: 'Condition') -> 'Condition':
+        return And(self, other)
+
+    def __or__(self, other: 'Condition') -> 'Condition':
+        return Or(self, other)
+
+
+class Q(Condition):
+    """
+    Conjonction de conditions élémentaires exprimées en arguments nommés
+
+    Chaque argument est de la forme champ=valeur ou champ__opérateur=valeur,
+    par exemple Q(status=Status.TODO, priority__gte=Priority.HIGH,
+    due_date__lt="2024-07-01").
+    """
+
+    def __init__(self, **lookups: Any):
+        """
+        Initialise la conjonction
+
+        Args:
+            **lookups: Conditions champ[__opérateur] -> valeur
+
+        Raises:
+            ValueError: Si un champ, un opérateur ou une valeur est invalide
+            TypeError: Si la valeur d'un critère __in n'est pas une collection
+        """
+        self.lookups: List[Lookup] = []
+        for key, value in lookups.items():
+            field, _, op = key.partition('__')
+            self.lookups.append(Lookup(field, op or 'eq', value))
+
+    def matches(self, task: Task) -> bool:
+        return all(lookup.matches(task) for lookup in self.lookups)
+
+    def __repr__(self) -> str:
+        return f"Q({', '.join(repr(lookup) for lookup in self.lookups)})"
+
+
+class And(Condition):
+    """Conjonction de conditions"""
+
+    def __init__(self, *children: Condition):
+        self.children = children
+
+    def matches(self, task: Task) -> bool:
+        return all(child.matches(task) for child in self.children)
+
+
+class Or(Condition):
+    """Disjonction de conditions"""
+
+    def __init__(self, *children: Condition):
+        self.children = children
+
+    def matches(self, task: Task) -> bool:
+        return any(child.matches(task) for child in self.children)
+
+
+class QueryPlan:
+    """
+    Plan d'exécution d'une requête
+
+    Les candidats proviennent soit des index (driver décrit l'index choisi,
+    ids les IDs à examiner, estimated leur nombre), soit d'un parcours
+    complet (ids vaut None). Chaque élément de filters est une liste de
+    paquets d'index dont un ID doit faire partie d'au moins un : cette
+    intersection d'ensembles d'IDs évite de lire les tâches écartées.
+    """
+
+    def __init__(self, driver: str, ids: Optional[Iterable[str]] = None, estimated: Optional[int] = None,
+                 filters: Sequence[Sequence[Any]] = ()):
+        self.driver = driver
+        self.ids = ids
+        self.estimated = estimated
+        self.filters = filters
+
+    def candidate_ids(self) -> Iterator[str]:
+        """Itère sur les IDs candidats ayant passé les filtres d'index"""
+        for task_id in self.ids:
+            if all(any(task_id in bucket for bucket in buckets) for buckets in self.filters):
+                yield task_id
+
+    def __repr__(self) -> str:
+        return f"QueryPlan(driver={self.driver!r}, estimated={self.estimated})"
+
+
+def _flatten(condition: Condition) -> Tuple[List[Lookup], List['Or']]:
+    """Décompose une conjonction en conditions élémentaires et disjonctions"""
+    if isinstance(condition, Q):
+        return list(condition.lookups), []
+    if isinstance(condition, And):
+        lookups: List[Lookup] = []
+        disjunctions: List[Or] = []
+        for child in condition.children:
+            child_lookups, child_disjunctions = _flatten(child)
+            lookups.extend(child_lookups)
+            disjunctions.extend(child_disjunctions)
+        return lookups, disjunctions
+    if isinstance(condition, Or):
+        return [], [condition]
+    raise TypeError(f"Condition de requête invalide : {condition!r}")
+
+
+def _unique(ids: Iterable[str]) -> Iterator[str]:
+    """Élimine les doublons d'une union d'ensembles d'IDs"""
+    seen = set()
+    for task_id in ids:
+        if task_id not in seen:
+            seen.add(task_id)
+            yield task_id
+
+
+def plan_query(condition: Condition, index: Optional[TaskIndex]) -> QueryPlan:
+    """
+    Choisit comment trouver les tâches satisfaisant une condition
+
+    Pour une conjonction, l'index le plus sélectif (égalité ou 'in' sur un
+    champ indexé, ou intervalle d'échéances, au plus petit nombre d'IDs)
+    fournit les candidats ; les autres conditions indexées filtrent les IDs
+    par appartenance. Une
+    disjonction est l'union des plans de ses branches, si toutes sont
+    indexables. Sinon, toutes les tâches sont parcourues.
+
+    Args:
+        condition: Condition de la requête
+        index: Index disponibles (None : parcours complet)
+
+    Returns:
+        Plan d'exécution
+    """
+    scan = QueryPlan('scan')
+    if index is None:
+        return scan
+
+    if isinstance(condition, Or):
+        branches = [plan_query(child, index) for child in condition.children]
+        if any(branch.ids is None for branch in branches):
+            return scan
+        return QueryPlan('union', _unique(chain.from_iterable(branch.candidate_ids() for branch in branches)),
+                         sum(branch.estimated for branch in branches))
+
+    lookups, disjunctions = _flatten(condition)
+    indexed = []
+    for lookup in lookups:
+        if lookup.field in index.fields and lookup.op in ('eq', 'in'):
+            values = (lookup.value,) if lookup.op == 'eq' else lookup.value
+            buckets = [index.lookup(lookup.field, value) for value in values]
+            indexed.append((sum(len(bucket) for bucket in buckets), lookup.field, buckets))
+
+    best: Optional[QueryPlan] = None
+    if indexed:
+        size, field, buckets = min(indexed, key=lambda item: item[0])
+        best = QueryPlan(f'index:{field}', chain.from_iterable(buckets), size)
+
+    lower = [lookup.value for lookup in lookups if lookup.field == 'due_date' and lookup.op in ('gt', 'gte')]
+    upper = [lookup.value for lookup in lookups if lookup.field == 'due_date' and lookup.op in ('lt', 'lte')]
+    if lower or upper:
+        # Bornes incluses : les candidats sont un sur-ensemble, affiné par matches()
+        start, end = max(lower, default=None), min(upper, default=None)
+        size = index.due_dates.count(start, end, include_end=True)
+        if best is None or size < best.estimated:
+            best = QueryPlan('index:due_date', index.due_dates.range(start, end, include_end=True), size)
+    for disjunction in disjunctions:
+        candidate = plan_query(disjunction, index)
+        if candidate.ids is not None and (best is None or candidate.estimated < best.estimated):
+            best = candidate
+    if best is None:
+        return scan
+
+    best.filters = [buckets for size, field, buckets in indexed if best.driver != f'index:{field}']
+    return best
+
+
+class _Descending:
+    """Enveloppe inversant l'ordre de comparaison (tri décroissant)"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: '_Descending') -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.value < self.value
+
+
+def sort_key(order_by: Union[str, Sequence[str]]) -> Callable[[Task], Tuple]:
+    """
+    Construit une clé de tri à partir de noms de champs
+
+    Args:
+        order_by: Champ ou liste de champs ; préfixe '-' pour un tri
+            décroissant. Les priorités et statuts sont triés selon leur ordre
+            de déclaration, les échéances en dates et les valeurs absentes en
+            dernier.
+
+    Returns:
+        Fonction de clé utilisable par sorted()
+
+    Raises:
+        ValueError: Si un champ est inconnu
+    """
+    if isinstance(order_by, str):
+        order_by = (order_by,)
+    fields = []
+    for name in order_by:
+        descending = name.startswith('-')
+        field = name.lstrip('-')
+        if field not in QUERY_FIELDS:
+            raise ValueError(f"Champ de tri inconnu : {field}")
+        fields.append((field, descending))
+
+    def key(task: Task) -> Tuple:
+        parts = []
+        for field, descending in fields:
+            value = getattr(task, field)
+            if value is not None and field in _ENUM_FIELDS:
+                value = _RANKS[value]
+            elif field == 'due_date':
+                value = due_key(value)
+            parts.append(value is None)
+            parts.append(_Descending(value) if descending else value)
+        return tuple(parts)
+
+    return key
+
+
+def paginate(tasks: Iterable[Task], order_by: Union[str, Sequence[str], None] = None,
+             limit: Optional[int] = None, offset: int = 0) -> List[Task]:
+    """
+    Trie et découpe un flux de tâches sans matérialiser plus que nécessaire
+
+    Sans tri, seules les offset + limit premières tâches sont lues ; avec
+    tri et limite, seules les offset + limit plus petites sont conservées
+    (tas borné) au lieu de trier tout le résultat.
+
+    Args:
+        tasks: Tâches (flux)
+        order_by: Champ(s) de tri (voir sort_key)
+        limit: Nombre maximal de tâches retournées
+        offset: Nombre de tâches à sauter
+
+    Returns:
+        Tâches de la page demandée
+
+    Raises:
+        ValueError: Si limit ou offset est négatif
+    """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("limit et offset doivent être positifs")
+    stop = None if limit is None else offset + limit
+    if order_by is None:
+        return list(islice(tasks, offset, stop))
+    key = sort_key(order_by)
+    if stop is None:
+        return sorted(tasks, key=key)[offset:]
+    return heapq.nsmallest(stop, tasks, key=key)[offset:]
@@ -0,0 +1,286 @@
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .task import Task
+
+
+_WORD = re.compile(r"\w+")
+# Diacritiques isolés par la décomposition NFKD (é -> e + accent aigu)
+_COMBINING = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
+# Termes entre guillemets (phrase) ou mots isolés d'une requête
+_QUERY_PART = re.compile(r'"([^"]*)"|(\S+)')
+
+# Pondération BM25 ; une occurrence dans le titre compte TITLE_WEIGHT fois
+_K1 = 1.2
+_B = 0.75
+TITLE_WEIGHT = 2
+# Écart de positions entre titre et description : une phrase ne les chevauche pas
+_FIELD_GAP = 1
+# Nombre maximal de termes du vocabulaire couverts par un préfixe
+MAX_EXPANSIONS = 50
+
+
+def normalize(text: str) -> str:
+    """
+    Normalise un texte pour la recherche : sans accents ni casse
+
+    Args:
+        text: Texte à normaliser
+
+    Returns:
+        Texte normalisé ("Réviser" -> "reviser")
+    """
+    if text.isascii():
+        return text.lower()
+    return _COMBINING.sub('', unicodedata.normalize('NFKD', text)).casefold()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Découpe un texte en termes normalisés
+
+    Args:
+        text: Texte à découper (None accepté)
+
+    Returns:
+        Liste des termes, dans l'ordre du texte
+    """
+    if not text:
+        return []
+    return _WORD.findall(normalize(text))
+
+
+class SearchIndex:
+    """
+    Index inversé plein texte sur le titre et la description des tâches
+
+    Pour chaque terme, l'index garde les positions de ses occurrences dans
+    chaque tâche, ce qui permet les recherches de phrases, ainsi que leur
+    nombre pondéré (titre compris), calculé à l'indexation. Le vocabulaire
+    est trié pour les recherches par préfixe. L'index est tenu à jour tâche
+    par tâche (add/remove) ; les résultats sont classés par score BM25.
+    """
+
+    def __init__(self, max_expansions: int = MAX_EXPANSIONS):
+        """
+        Initialise un index vide
+
+        Args:
+            max_expansions: Nombre maximal de termes, dans l'ordre du
+                vocabulaire, couverts par un préfixe de requête
+        """
+        self.max_expansions = max_expansions
+        # Terme -> (ID de tâche -> positions du terme)
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+        # Terme -> (ID de tâche -> nombre d'occurrences pondéré)
+        self._frequencies: Dict[str, Dict[str, int]] = {}
+        # ID -> (longueur du titre, longueur totale, termes distincts)
+        self._documents: Dict[str, Tuple[int, int, Tuple[str, ...]]] = {}
+        self._vocabulary: List[str] = []
+        self._total_length = 0
+
+    def add(self, task: Task) -> None:
+        """
+        Indexe le titre et la description d'une tâche (réindexe si besoin)
+
+        Args:
+            task: Tâche à indexer
+        """
+        self.remove(task.id)
+        title = tokenize(task.title)
+        description = tokenize(task.description)
+        offset = len(title) + _FIELD_GAP
+        positions: Dict[str, List[int]] = {}
+        for position, term in enumerate(title):
+            positions.setdefault(term, []).append(position)
+        for position, term in enumerate(description, offset):
+            positions.setdefault(term, []).append(position)
+
+        title_length = len(title)
+        for term, term_positions in positions.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._frequencies[term] = {}
+                insort(self._vocabulary, term)
+            postings[task.id] = term_positions
+            # Positions croissantes : celles du titre sont en tête
+            in_title = bisect_left(term_positions, title_length) if term_positions[0] < title_length else 0
+            self._frequencies[term][task.id] = len(term_positions) + (TITLE_WEIGHT - 1) * in_title
+        length = len(title) + len(description)
+        self._documents[task.id] = (len(title), length, tuple(positions))
+        self._total_length += length
+
+    def remove(self, task_id: str) -> None:
+        """
+        Retire une tâche de l'index
+
+        Args:
+            task_id: ID de la tâche
+        """
+        document = self._documents.pop(task_id, None)
+        if document is None:
+            return
+        _, length, terms = document
+        self._total_length -= length
+        for term in terms:
+            postings = self._postings[term]
+            del postings[task_id]
+            del self._frequencies[term][task_id]
+            if not postings:
+                del self._postings[term]
+                del self._frequencies[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+
+    def clear(self) -> None:
+        """Vide l'index"""
+        self._postings.clear()
+        self._frequencies.clear()
+        self._documents.clear()
+        self._vocabulary.clear()
+        self._total_length = 0
+
+    def _weighted_frequency(self, task_id: str, positions: Iterable[int]) -> float:
+        """Nombre d'occurrences, celles du titre comptant TITLE_WEIGHT fois"""
+        title_length = self._documents[task_id][0]
+        return sum(TITLE_WEIGHT if position < title_length else 1 for position in positions)
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Termes du vocabulaire commençant par un préfixe (au plus max_expansions)"""
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in islice(self._vocabulary, start, start + self.max_expansions):
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    @staticmethod
+    def _prefix_frequencies(candidates: Set[str], postings: List[Dict[str, int]]) -> Dict[str, int]:
+        """Nombres pondérés cumulés des termes d'un préfixe, pour les tâches retenues"""
+        frequencies = dict.fromkeys(candidates, 0)
+        for term_postings in postings:
+            if len(term_postings) < len(frequencies):
+                for task_id, frequency in term_postings.items():
+                    if task_id in frequencies:
+                        frequencies[task_id] += frequency
+            else:
+                for task_id in frequencies:
+                    frequencies[task_id] += term_postings.get(task_id, 0)
+        return frequencies
+
+    def _phrase_frequency(self, task_id: str, terms: List[str]) -> int:
+        """Nombre pondéré d'occurrences d'une suite de termes consécutifs dans une tâche"""
+        followers = [set(self._postings[term][task_id]) for term in terms[1:]]
+        starts = [start for start in self._postings[terms[0]][task_id]
+                  if all(start + shift in positions for shift, positions in enumerate(followers, 1))]
+        return self._weighted_frequency(task_id, starts) if starts else 0
+
+    def _clauses(self, query: str) -> List[Tuple[str, List[str]]]:
+        """Découpe une requête en clauses (terme, préfixe ou phrase)"""
+        clauses = []
+        for phrase, word in _QUERY_PART.findall(query):
+            if phrase:
+                terms = tokenize(phrase)
+                if len(terms) == 1:
+                    clauses.append(('term', terms))
+                elif terms:
+                    clauses.append(('phrase', terms))
+                continue
+            terms = tokenize(word)
+            if not terms:
+                continue
+            # "l'API*" : seul le dernier terme est un préfixe
+            for term in terms[:-1]:
+                clauses.append(('term', [term]))
+            clauses.append(('prefix' if word.endswith('*') else 'term', [terms[-1]]))
+        return clauses
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Recherche les tâches contenant tous les éléments de la requête
+
+        La requête est une suite de mots ; un mot terminé par * est un
+        préfixe, et une suite de mots entre guillemets doit apparaître telle
+        quelle. Accents et casse sont ignorés.
+
+        Args:
+            query: Requête (ex: 'revis* "documentation api"')
+            limit: Nombre maximal de résultats (tous si None)
+
+        Returns:
+            Couples (ID de tâche, score), du plus pertinent au moins pertinent
+        """
+        clauses = self._clauses(query)
+        if not clauses:
+            return []
+
+        # Listes d'occurrences de chaque clause, sans encore rien calculer
+        count = len(self._documents)
+        plans = []
+        for kind, terms in clauses:
+            if kind == 'prefix':
+                terms = self._expand(terms[0])
+            postings = [self._frequencies.get(term) for term in terms]
+            if not postings or not all(postings):
+                return []
+            # Nombre de tâches couvertes (majorant pour un préfixe ou une phrase)
+            size = min(count, sum(map(len, postings))) if kind == 'prefix' else min(map(len, postings))
+            plans.append((size, kind, terms, postings))
+
+        # Intersection des IDs en partant de la clause la plus sélective
+        plans.sort(key=lambda plan: plan[0])
+        _, kind, _, postings = plans[0]
+        if kind == 'prefix':
+            candidates = set().union(*postings)
+        elif len(postings) == 1:
+            candidates = set(postings[0])
+        else:
+            candidates = {task_id for task_id in min(postings, key=len)
+                          if all(task_id in term_postings for term_postings in postings)}
+        for _, kind, _, postings in plans[1:]:
+            if kind == 'prefix':
+                candidates = {task_id for task_id in candidates
+                              if any(task_id in term_postings for term_postings in postings)}
+            else:
+                candidates = {task_id for task_id in candidates
+                              if all(task_id in term_postings for term_postings in postings)}
+            if not candidates:
+                return []
+
+        # Fréquences et scores BM25 des seules tâches retenues
+        clause_frequencies = []
+        for size, kind, terms, postings in plans:
+            if kind == 'term':
+                frequencies = {task_id: postings[0][task_id] for task_id in candidates}
+            elif kind == 'prefix':
+                frequencies = self._prefix_frequencies(candidates, postings)
+            else:
+                frequencies = {task_id: self._phrase_frequency(task_id, terms) for task_id in candidates}
+                candidates = {task_id for task_id, frequency in frequencies.items() if frequency}
+                if not candidates:
+                    return []
+            clause_frequencies.append((math.log(1 + (count - size + 0.5) / (size + 0.5)), frequencies))
+
+        average = self._total_length / count
+        documents = self._documents
+        totals = {}
+        for task_id in candidates:
+            norm = _K1 * (1 - _B + _B * documents[task_id][1] / average) if average else _K1
+            score = 0.0
+            for idf, frequencies in clause_frequencies:
+                frequency = frequencies[task_id]
+                score += idf * frequency * (_K1 + 1) / (frequency + norm)
+            totals[task_id] = score
+        if limit is None:
+            return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(limit, totals.items(), key=lambda item: item[1])
+
+    def __len__(self) -> int:
+        """Retourne le nombre de tâches indexées"""
+        return len(self._documents)
@@ -2,21 +2,62 @@ import smtplib
 import os
 import csv
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional
+from email.message import EmailMessage
+from typing import Iterable, Dict, Any, List, Optional, Tuple, Union
 from .task import Task
+from .mailing import BatchResult, SMTPConnectionPool, send_messages
+from .manager import TaskManager
+
+
+TaskSource = Union[Iterable[Task], TaskManager]
+
+
+def _consistent(tasks: TaskSource) -> Iterable[Task]:
+    """Lit un gestionnaire via un instantané, pour un rapport cohérent"""
+    if isinstance(tasks, TaskManager):
+        return tasks.snapshot()
+    return tasks
 
 
 class EmailService:
-    """Service simulé d'envoi d'emails pour les rappels et notifications de tâches."""
-    def __init__(self, smtp_server: str = "smtp.gmail.com", port: int = 587):
+    """
+    Service d'envoi d'emails pour les rappels et notifications de tâches.
+
+    Les envois groupés (send_reminders, send_completion_notifications)
+    passent par SMTP : un message par destinataire, sur un pool de
+    connexions réutilisées, avec nouvelles tentatives en cas d'échec
+    temporaire. Les envois unitaires (send_task_reminder...) restent simulés.
+    """
+    def __init__(self, smtp_server: str = "smtp.gmail.com", port: int = 587,
+                 sender: str = "noreply@task-manager.local", username: Optional[str] = None,
+                 password: Optional[str] = None, starttls: bool = False, pool_size: int = 4,
+                 max_retries: int = 3, backoff: float = 0.5, timeout: float = 10.0):
         self.smtp_server = smtp_server
         self.port = port
+        # Paramètres des envois groupés réels (send_reminders...)
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._pool: Optional[SMTPConnectionPool] = None
+
+    @staticmethod
+    def _reminder_text(task_title: str, due_date: str) -> str:
+        return f"La tâche '{task_title}' est à rendre pour le {due_date}."
+
+    @staticmethod
+    def _completion_text(task_title: str) -> str:
+        return f"La tâche '{task_title}' a été complétée avec succès."
 
     def send_task_reminder(self, email: str, task_title: str, due_date: str) -> str:
         if "@" not in email:
             raise ValueError(f"Adresse email invalide : {email}")
         # Simulation d'envoi
-        message = f"[RAPPEL] La tâche '{task_title}' est à rendre pour le {due_date}."
+        message = f"[RAPPEL] {self._reminder_text(task_title, due_date)}"
         print(f"[SIMULATION EMAIL] Envoi à {email} via {self.smtp_server}:{self.port} : {message}")
         return message
 
@@ -24,16 +65,84 @@ class EmailService:
         if "@" not in email:
             raise ValueError(f"Adresse email invalide : {email}")
         # Simulation d'envoi
-        message = f"[CONFIRMATION] La tâche '{task_title}' a été complétée avec succès."
+        message = f"[CONFIRMATION] {self._completion_text(task_title)}"
         print(f"[SIMULATION EMAIL] Envoi à {email} via {self.smtp_server}:{self.port} : {message}")
         return message
 
+    def send_reminders(self, reminders: Iterable[Tuple[str, str, str]]) -> BatchResult:
+        """
+        Envoie des rappels par SMTP, regroupés en un message par destinataire
+
+        Les messages partent sur un pool de connexions réutilisées (voir
+        send_messages) : tentatives répétées avec attente croissante en cas
+        d'échec temporaire, échecs définitifs consignés sans interrompre le lot.
+
+        Args:
+            reminders: Triplets (email, titre de la tâche, échéance)
+
+        Returns:
+            Bilan de l'envoi (adresses invalides comprises dans les échecs)
+        """
+        return self._send_digests(((email, self._reminder_text(title, due_date))
+                                   for email, title, due_date in reminders),
+                                  "[RAPPEL]", "à rendre")
+
+    def send_completion_notifications(self, notifications: Iterable[Tuple[str, str]]) -> BatchResult:
+        """
+        Envoie des notifications de fin par SMTP, une par destinataire
+
+        Args:
+            notifications: Couples (email, titre de la tâche)
+
+        Returns:
+            Bilan de l'envoi
+        """
+        return self._send_digests(((email, self._completion_text(title)) for email, title in notifications),
+                                  "[CONFIRMATION]", "complétée(s)")
+
+    def _send_digests(self, entries: Iterable[Tuple[str, str]], tag: str, action: str) -> BatchResult:
+        """Regroupe des lignes par destinataire et envoie un message par groupe"""
+        result = BatchResult()
+        digests: Dict[str, List[str]] = {}
+        for email, line in entries:
+            if "@" not in email:
+                result.record(email, ValueError(f"Adresse email invalide : {email}"))
+                continue
+            digests.setdefault(email, []).append(line)
+
+        messages = []
+        for email, lines in digests.items():
+            message = EmailMessage()
+            message['From'] = self.sender
+            message['To'] = email
+            message['Subject'] = f"{tag} {len(lines)} tâche(s) {action}"
+            message.set_content("\n".join(f"- {line}" for line in lines))
+            messages.append(message)
+        return send_messages(self._get_pool(), messages, self.max_retries, self.backoff, result)
+
+    def _get_pool(self) -> SMTPConnectionPool:
+        """Crée à la demande le pool de connexions, conservé entre les lots"""
+        if self._pool is None:
+            self._pool = SMTPConnectionPool(self.smtp_server, self.port, self.pool_size, self.timeout,
+                                            self.starttls, self.username, self.password)
+        return self._pool
+
+    def close(self) -> None:
+        """Ferme les connexions SMTP ouvertes par les envois groupés"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
 
 class ReportService:
     """Service de génération de rapports et d'export CSV pour les tâches."""
-    def generate_daily_report(self, tasks: List[Task], date_: Optional[str] = None) -> Dict[str, Any]:
+    def generate_daily_report(self, tasks: TaskSource, date_: Optional[str] = None) -> Dict[str, Any]:
         if date_ is None:
             date_ = date.today().isoformat()
+        if isinstance(tasks, TaskManager):
+            # Calculé par le gestionnaire, sous son verrou (rapport cohérent) ;
+            # un store lazy est lu par plages dans son pool de processus
+            return tasks.daily_report(date_)
         # Filtrer les tâches créées ou modifiées à la date donnée
         filtered = [t for t in tasks if (t.created_at.startswith(date_) or t.updated_at.startswith(date_))]
         stats = {
@@ -50,7 +159,8 @@ class ReportService:
                 stats['by_assignee'][t.assignee] = stats['by_assignee'].get(t.assignee, 0) + 1
         return stats
 
-    def export_tasks_csv(self, tasks: List[Task], filename: str) -> None:
+    def export_tasks_csv(self, tasks: TaskSource, filename: str) -> None:
+        tasks = _consistent(tasks)
         try:
             dirname = os.path.dirname(filename)
             if dirname:
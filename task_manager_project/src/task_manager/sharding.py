@@ -0,0 +1,594 @@
+import json
+import logging
+import os
+import zlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from urllib.parse import quote
+
+from .task import Task, Priority, Status
+from .manager import TaskManager
+from .atomic import atomic_write
+from .locking import ReadWriteLock, read_locked, write_locked
+
+
+logger = logging.getLogger(__name__)
+
+SHARD_STRATEGIES = ('project', 'hash')
+
+# Fichiers des shards : un par projet (nom encodé suivi d'une empreinte du
+# nom exact, qui distingue "Alpha" et "alpha" sur un système de fichiers
+# insensible à la casse), ou un par intervalle de hachage
+_PROJECT_PREFIX = 'project-'
+_NO_PROJECT = 'no-project'
+_HASH_PREFIX = 'shard-'
+# Longueur maximale du nom de projet encodé dans une clé : avec l'empreinte
+# et les suffixes (.json.journal, fichiers temporaires), le nom de fichier
+# reste sous NAME_MAX (255 octets) ; les clés plus courtes sont inchangées
+_MAX_QUOTED_PROJECT = 200
+# Paramètres de répartition, vérifiés à chaque ouverture du dossier
+MANIFEST_FILE = 'manifest.json'
+
+
+def merge_statistics(stats_list: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fusionne les statistiques de plusieurs gestionnaires (voir get_statistics)
+
+    Args:
+        stats_list: Statistiques de chaque gestionnaire
+
+    Returns:
+        Statistiques cumulées
+    """
+    merged: Dict[str, Any] = {
+        'total_tasks': 0,
+        'by_status': {status.value: 0 for status in Status},
+        'by_priority': {priority.value: 0 for priority in Priority},
+        'by_project': {},
+        'by_assignee': {},
+    }
+    for stats in stats_list:
+        merged['total_tasks'] += stats['total_tasks']
+        for key in ('by_status', 'by_priority', 'by_project', 'by_assignee'):
+            counts = merged[key]
+            for value, count in stats[key].items():
+                counts[value] = counts.get(value, 0) + count
+    return merged
+
+
+class ShardedTaskManager:
+    """
+    Gestionnaire de tâches réparti en plusieurs stockages (shards)
+
+    Chaque shard est un TaskManager avec son propre fichier dans storage_dir.
+    Avec la stratégie "project", chaque projet a son shard : une mutation ne
+    réécrit que le fichier de son projet et get_tasks_by_project ne lit qu'un
+    shard. Avec la stratégie "hash", les tâches sont réparties selon un
+    hachage stable de leur ID en num_shards shards. Les requêtes
+    transversales (statut, priorité, personne assignée, statistiques)
+    interrogent tous les shards et fusionnent les résultats.
+
+    La stratégie et le nombre de shards sont enregistrés dans un manifeste
+    (storage_dir/manifest.json) : rouvrir le dossier avec d'autres
+    paramètres enverrait les recherches par ID vers le mauvais shard, et
+    est donc refusé.
+    """
+
+    def __init__(self, storage_dir: str = "tasks_shards", shard_by: str = "project",
+                 num_shards: int = 16, **options: Any):
+        """
+        Initialise le gestionnaire et ouvre les shards existants
+
+        Args:
+            storage_dir: Dossier contenant un fichier par shard
+            shard_by: "project" (un shard par projet) ou "hash" (hachage de l'ID)
+            num_shards: Nombre de shards avec la stratégie "hash"
+            **options: Options transmises à chaque TaskManager (journal,
+                lazy, backend, fsync, file_format...)
+
+        Raises:
+            ValueError: Si la stratégie ou le nombre de shards est invalide,
+                ou diffère de celui avec lequel le dossier a été créé
+        """
+        if shard_by not in SHARD_STRATEGIES:
+            raise ValueError(f"Stratégie de partitionnement inconnue : {shard_by}")
+        if num_shards < 1:
+            raise ValueError("Le nombre de shards doit être positif")
+
+        self.storage_dir = storage_dir
+        self.shard_by = shard_by
+        self.num_shards = num_shards
+        self._options = options
+        self._extension = '.db' if options.get('backend') == 'sqlite' else '.json'
+        self._lock = ReadWriteLock()
+        self.shards: Dict[str, TaskManager] = {}
+        # Stratégie "project" : shard de chaque tâche (ID -> clé du shard)
+        self._locations: Dict[str, str] = {}
+
+        manifest = self._read_manifest()
+        if manifest is not None:
+            self._check_manifest(manifest)
+
+        if shard_by == 'hash':
+            for number in range(num_shards):
+                self._open_shard(f"{_HASH_PREFIX}{number:03d}")
+        elif os.path.isdir(storage_dir):
+            for filename in sorted(os.listdir(storage_dir)):
+                if filename.startswith(_PROJECT_PREFIX) or filename == _NO_PROJECT + self._extension:
+                    if filename.endswith(self._extension):
+                        self._open_shard(filename[:-len(self._extension)])
+
+        if manifest is None:
+            # Dossier antérieur au manifeste : vérifier la répartition existante
+            self._check_layout()
+            self._write_manifest()
+
+    def _manifest(self) -> Dict[str, Any]:
+        """Paramètres de répartition à enregistrer dans le manifeste"""
+        manifest: Dict[str, Any] = {'shard_by': self.shard_by}
+        if self.shard_by == 'hash':
+            manifest['num_shards'] = self.num_shards
+        return manifest
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        Lit le manifeste du dossier
+
+        Returns:
+            Paramètres enregistrés, ou None si le dossier n'a pas de manifeste
+
+        Raises:
+            ValueError: Si le manifeste est illisible
+        """
+        path = os.path.join(self.storage_dir, MANIFEST_FILE)
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Manifeste des shards illisible ({path}): {e}")
+
+    def _check_manifest(self, manifest: Dict[str, Any]) -> None:
+        """
+        Vérifie que les paramètres demandés sont ceux du dossier
+
+        Raises:
+            ValueError: Si la stratégie ou le nombre de shards diffère
+        """
+        expected = self._manifest()
+        if manifest != expected:
+            raise ValueError(
+                f"Le dossier {self.storage_dir} est réparti avec {manifest}, "
+                f"incompatible avec les paramètres demandés {expected}"
+            )
+
+    def _check_layout(self) -> None:
+        """
+        Vérifie qu'un dossier sans manifeste correspond aux paramètres demandés
+
+        Raises:
+            ValueError: Si des fichiers ou des tâches ont été répartis avec
+                une autre stratégie ou un autre nombre de shards
+        """
+        hash_files = set()
+        project_files = False
+        if os.path.isdir(self.storage_dir):
+            for filename in os.listdir(self.storage_dir):
+                key = filename[:-len(self._extension)] if filename.endswith(self._extension) else None
+                if key is None:
+                    continue
+                if key.startswith(_HASH_PREFIX):
+                    hash_files.add(key)
+                elif key.startswith(_PROJECT_PREFIX) or key == _NO_PROJECT:
+                    project_files = True
+        if self.shard_by == 'project':
+            foreign = bool(hash_files)
+        else:
+            foreign = project_files or not hash_files <= set(self.shards) or any(
+                self._key_for_id(task_id) != key
+                for key, shard in self.shards.items() for task_id in shard.tasks
+            )
+        if foreign:
+            raise ValueError(
+                f"Les tâches de {self.storage_dir} ont été réparties avec une autre stratégie "
+                f"ou un autre nombre de shards que ({self.shard_by}, {self.num_shards})"
+            )
+
+    def _write_manifest(self) -> None:
+        """Enregistre les paramètres de répartition dans le dossier"""
+        os.makedirs(self.storage_dir, exist_ok=True)
+        with atomic_write(os.path.join(self.storage_dir, MANIFEST_FILE)) as f:
+            json.dump(self._manifest(), f)
+
+    def _open_shard(self, key: str) -> TaskManager:
+        """Ouvre (ou crée) le shard d'une clé et enregistre ses tâches"""
+        shard = TaskManager(os.path.join(self.storage_dir, key + self._extension), **self._options)
+        self.shards[key] = shard
+        if self.shard_by == 'project':
+            for task_id in list(shard.tasks):
+                other = self._locations.get(task_id)
+                if other is None:
+                    self._locations[task_id] = key
+                else:
+                    self._dedupe(task_id, other, key)
+        return shard
+
+    def _dedupe(self, task_id: str, first_key: str, second_key: str) -> None:
+        """
+        Résout une tâche présente dans deux shards
+
+        Un changement de projet interrompu entre l'ajout au nouveau shard et
+        la suppression de l'ancien laisse deux copies : la plus récemment
+        modifiée (la copie déplacée) est gardée, l'autre est supprimée.
+
+        Args:
+            task_id: ID de la tâche dupliquée
+            first_key: Shard où la tâche a été vue en premier
+            second_key: Shard où elle vient d'être vue
+        """
+        first = self.shards[first_key].get_task(task_id)
+        second = self.shards[second_key].get_task(task_id)
+        keep, drop = (second_key, first_key) if second.updated_at > first.updated_at else (first_key, second_key)
+        logger.warning("Tâche %s présente dans les shards %s et %s : copie de %s supprimée",
+                       task_id, first_key, second_key, drop)
+        self.shards[drop].delete_task(task_id)
+        self._locations[task_id] = keep
+
+    @staticmethod
+    def shard_key_for_project(project: Optional[str]) -> str:
+        """
+        Calcule la clé (nom de fichier sans extension) du shard d'un projet
+
+        Args:
+            project: Nom du projet (None pour les tâches sans projet)
+
+        Le nom encodé d'un projet très long est tronqué : l'empreinte du nom
+        complet distingue alors les projets de même début.
+
+        Returns:
+            Clé du shard
+        """
+        if not project:
+            return _NO_PROJECT
+        digest = zlib.crc32(project.encode('utf-8'))
+        quoted = quote(project, safe='')
+        if len(quoted) > _MAX_QUOTED_PROJECT:
+            quoted = quoted[:_MAX_QUOTED_PROJECT]
+            # Ne pas couper une séquence %XX
+            escape = quoted.rfind('%', -2)
+            if escape != -1:
+                quoted = quoted[:escape]
+        return f"{_PROJECT_PREFIX}{quoted}-{digest:08x}"
+
+    def _key_for_id(self, task_id: str) -> Optional[str]:
+        """Clé du shard contenant une tâche, ou None si elle est inconnue"""
+        if self.shard_by == 'hash':
+            number = zlib.crc32(task_id.encode('utf-8')) % self.num_shards
+            return f"{_HASH_PREFIX}{number:03d}"
+        return self._locations.get(task_id)
+
+    def _key_for_task(self, task: Task) -> str:
+        """Clé du shard où ranger une tâche"""
+        if self.shard_by == 'hash':
+            return self._key_for_id(task.id)
+        return self.shard_key_for_project(task.project)
+
+    def _shard(self, key: str) -> TaskManager:
+        """Shard d'une clé, créé s'il n'existe pas encore"""
+        shard = self.shards.get(key)
+        if shard is None:
+            shard = self._open_shard(key)
+        return shard
+
+    def _shard_for_id(self, task_id: str) -> Optional[TaskManager]:
+        """Shard contenant une tâche, ou None si elle est inconnue"""
+        key = self._key_for_id(task_id)
+        return self.shards.get(key) if key is not None else None
+
+    def _contains(self, task_id: str) -> bool:
+        """Indique si une tâche existe dans l'un des shards"""
+        if self.shard_by == 'project':
+            return task_id in self._locations
+        return self._shard_for_id(task_id).get_task(task_id) is not None
+
+    @write_locked
+    def add_task(self, task: Task) -> str:
+        """
+        Ajoute une tâche dans le shard de son projet (ou de son ID)
+
+        Args:
+            task: Tâche à ajouter
+
+        Returns:
+            ID de la tâche ajoutée
+
+        Raises:
+            ValueError: Si la tâche a déjà un ID existant
+        """
+        if self._contains(task.id):
+            raise ValueError(f"Une tâche avec l'ID {task.id} existe déjà")
+        key = self._key_for_task(task)
+        self._shard(key).add_task(task)
+        if self.shard_by == 'project':
+            self._locations[task.id] = key
+        return task.id
+
+    @write_locked
+    def add_tasks(self, tasks: Iterable[Task]) -> List[str]:
+        """
+        Ajoute plusieurs tâches, en une opération persistée par shard concerné
+
+        Args:
+            tasks: Tâches à ajouter
+
+        Returns:
+            IDs des tâches ajoutées, dans l'ordre
+
+        Raises:
+            ValueError: Si des IDs existent déjà ou sont dupliqués
+        """
+        tasks = list(tasks)
+        seen = set()
+        duplicates = []
+        for task in tasks:
+            if task.id in seen or self._contains(task.id):
+                duplicates.append(task.id)
+            seen.add(task.id)
+        if duplicates:
+            raise ValueError(f"Des tâches avec les IDs {', '.join(duplicates)} existent déjà")
+
+        for key, group in self._group(tasks, self._key_for_task).items():
+            self._shard(key).add_tasks(group)
+            if self.shard_by == 'project':
+                for task in group:
+                    self._locations[task.id] = key
+        return [task.id for task in tasks]
+
+    @read_locked
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """
+        Récupère une tâche par son ID (un seul shard consulté)
+
+        Args:
+            task_id: ID de la tâche à récupérer
+
+        Returns:
+            Tâche trouvée ou None si non trouvée
+        """
+        shard = self._shard_for_id(task_id)
+        return shard.get_task(task_id) if shard is not None else None
+
+    @write_locked
+    def update_task(self, task_id: str, **kwargs) -> bool:
+        """
+        Met à jour une tâche existante
+
+        Avec la stratégie "project", un changement de projet déplace la tâche
+        dans le shard de son nouveau projet : elle est ajoutée au nouveau
+        shard avant d'être retirée de l'ancien. Si l'opération est
+        interrompue entre les deux, la copie restée dans l'ancien shard est
+        écartée à la prochaine ouverture (voir _dedupe).
+
+        Args:
+            task_id: ID de la tâche à mettre à jour
+            **kwargs: Attributs à mettre à jour
+
+        Returns:
+            True si la tâche a été mise à jour, False sinon
+        """
+        shard = self._shard_for_id(task_id)
+        if shard is None:
+            return False
+        if self.shard_by != 'project' or 'project' not in kwargs:
+            return shard.update_task(task_id, **kwargs)
+
+        key = self.shard_key_for_project(kwargs['project'])
+        if key == self._locations[task_id]:
+            return shard.update_task(task_id, **kwargs)
+
+        target = self._shard(key)
+        try:
+            with shard.batch():
+                shard.update_task(task_id, **kwargs)
+                target.add_task(shard.get_task(task_id))
+                shard.delete_task(task_id)
+        except BaseException:
+            # L'ancien shard a été restauré : retirer la copie déjà ajoutée
+            if target.get_task(task_id) is not None:
+                target.delete_task(task_id)
+            raise
+        self._locations[task_id] = key
+        return True
+
+    @write_locked
+    def update_tasks(self, updates: Any) -> List[bool]:
+        """
+        Met à jour plusieurs tâches (voir update_task)
+
+        Args:
+            updates: Correspondance ID -> attributs, ou itérable de couples (ID, attributs)
+
+        Returns:
+            Pour chaque mise à jour, True si la tâche a été mise à jour, False sinon
+        """
+        if isinstance(updates, Mapping):
+            updates = updates.items()
+        updates = list(updates)
+        if self.shard_by == 'project' and any('project' in fields for _, fields in updates):
+            return [self.update_task(task_id, **fields) for task_id, fields in updates]
+
+        results: Dict[int, bool] = {}
+        positions: Dict[str, List[int]] = {}
+        for position, (task_id, _) in enumerate(updates):
+            key = self._key_for_id(task_id)
+            if key is None or key not in self.shards:
+                results[position] = False
+            else:
+                positions.setdefault(key, []).append(position)
+        for key, group in positions.items():
+            shard_results = self.shards[key].update_tasks([updates[position] for position in group])
+            results.update(zip(group, shard_results))
+        return [results[position] for position in range(len(updates))]
+
+    @write_locked
+    def delete_task(self, task_id: str) -> bool:
+        """
+        Supprime une tâche par son ID
+
+        Args:
+            task_id: ID de la tâche à supprimer
+
+        Returns:
+            True si la tâche a été supprimée, False sinon
+        """
+        shard = self._shard_for_id(task_id)
+        if shard is None or not shard.delete_task(task_id):
+            return False
+        self._locations.pop(task_id, None)
+        return True
+
+    @write_locked
+    def delete_tasks(self, task_ids: Iterable[str]) -> List[bool]:
+        """
+        Supprime plusieurs tâches, en une opération persistée par shard concerné
+
+        Args:
+            task_ids: IDs des tâches à supprimer
+
+        Returns:
+            Pour chaque ID, True si la tâche a été supprimée, False sinon
+        """
+        task_ids = list(task_ids)
+        results: Dict[int, bool] = {}
+        positions: Dict[str, List[int]] = {}
+        for position, task_id in enumerate(task_ids):
+            key = self._key_for_id(task_id)
+            if key is None or key not in self.shards:
+                results[position] = False
+            else:
+                positions.setdefault(key, []).append(position)
+        for key, group in positions.items():
+            shard_results = self.shards[key].delete_tasks([task_ids[position] for position in group])
+            results.update(zip(group, shard_results))
+        for position, deleted in results.items():
+            if deleted:
+                self._locations.pop(task_ids[position], None)
+        return [results[position] for position in range(len(task_ids))]
+
+    @read_locked
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Récupère toutes les tâches, shard par shard
+
+        Returns:
+            Liste de toutes les tâches
+        """
+        return [task for shard in self.shards.values() for task in shard.get_all_tasks()]
+
+    @read_locked
+    def get_tasks_by_project(self, project: str) -> List[Task]:
+        """
+        Récupère toutes les tâches d'un projet (un seul shard consulté avec la
+        stratégie "project")
+
+        Args:
+            project: Nom du projet
+
+        Returns:
+            Liste des tâches du projet
+        """
+        if self.shard_by == 'project':
+            shard = self.shards.get(self.shard_key_for_project(project))
+            return shard.get_tasks_by_project(project) if shard is not None else []
+        return self._fan_out('get_tasks_by_project', project)
+
+    @read_locked
+    def get_tasks_by_status(self, status: Status) -> List[Task]:
+        """Récupère toutes les tâches avec un statut donné, tous shards confondus"""
+        return self._fan_out('get_tasks_by_status', status)
+
+    @read_locked
+    def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
+        """Récupère toutes les tâches avec une priorité donnée, tous shards confondus"""
+        return self._fan_out('get_tasks_by_priority', priority)
+
+    @read_locked
+    def get_tasks_by_assignee(self, assignee: str) -> List[Task]:
+        """Récupère toutes les tâches assignées à une personne, tous shards confondus"""
+        return self._fan_out('get_tasks_by_assignee', assignee)
+
+    @read_locked
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Calcule les statistiques des tâches en fusionnant celles des shards
+
+        Returns:
+            Dictionnaire contenant les statistiques (même format que
+            TaskManager.get_statistics)
+        """
+        return merge_statistics(shard.get_statistics() for shard in self.shards.values())
+
+    def _fan_out(self, method: str, *args: Any) -> List[Task]:
+        """Appelle une méthode de filtrage sur chaque shard et concatène les résultats"""
+        return [task for shard in self.shards.values() for task in getattr(shard, method)(*args)]
+
+    @staticmethod
+    def _group(tasks: List[Task], key_func) -> Dict[str, List[Task]]:
+        """Regroupe des tâches par clé de shard, en conservant leur ordre"""
+        groups: Dict[str, List[Task]] = {}
+        for task in tasks:
+            groups.setdefault(key_func(task), []).append(task)
+        return groups
+
+    @write_locked
+    def flush(self) -> None:
+        """
+        Persiste les mutations en attente de chaque shard
+
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        for shard in self.shards.values():
+            shard.flush()
+
+    @write_locked
+    def clear_all_tasks(self) -> None:
+        """Supprime toutes les tâches de tous les shards"""
+        for shard in self.shards.values():
+            shard.clear_all_tasks()
+        self._locations.clear()
+
+    def close(self) -> None:
+        """
+        Persiste les mutations en attente et ferme chaque shard
+
+        Raises:
+            IOError: En cas d'erreur d'écriture
+        """
+        with self._lock.writing():
+            for shard in self.shards.values():
+                shard.close()
+
+    def shard_sizes(self) -> Dict[str, int]:
+        """
+        Retourne le nombre de tâches de chaque shard
+
+        Returns:
+            Dictionnaire clé du shard -> nombre de tâches
+        """
+        with self._lock.reading():
+            return {key: len(shard) for key, shard in self.shards.items()}
+
+    @read_locked
+    def __len__(self) -> int:
+        """Retourne le nombre total de tâches"""
+        return sum(len(shard) for shard in self.shards.values())
+
+    def __str__(self) -> str:
+        """Représentation string du gestionnaire"""
+        return f"ShardedTaskManager({len(self.shards)} shards)"
+
+    def __repr__(self) -> str:
+        """Représentation détaillée du gestionnaire"""
+        return (f"ShardedTaskManager(storage_dir='{self.storage_dir}', shard_by='{self.shard_by}', "
+                f"shards_count={len(self.shards)})")
@@ -0,0 +1,136 @@
+import copy
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from .task import Task, Priority, Status
+
+
+class TaskSnapshot:
+    """
+    Vue figée des tâches d'un TaskManager à un instant donné
+
+    L'instantané ne copie à sa création que la table ID -> tâche et partage
+    les tâches du gestionnaire, qui les modifie en place. Chaque tâche
+    partagée est copiée au plus une fois : à sa première lecture depuis
+    l'instantané, ou avant sa première modification par le gestionnaire si
+    elle survient d'abord (voir TaskManager.snapshot). Les tâches lues
+    depuis l'instantané ne changent donc plus, sans verrou du gestionnaire,
+    quelles que soient les écritures ultérieures.
+    """
+
+    # Nombre de tâches copiées par prise du verrou lors d'un parcours
+    _CHUNK_SIZE = 1000
+
+    def __init__(self, tasks: Dict[str, Task], sequence: int = 0,
+                 lock: Optional[threading.Lock] = None):
+        """
+        Initialise l'instantané
+
+        Args:
+            tasks: Table (ID -> tâche) propre à l'instantané
+            sequence: Numéro du dernier changement reflété (voir
+                TaskManager.changes_since)
+            lock: Verrou partagé avec le gestionnaire si les tâches sont
+                partagées avec lui (None : tâches déjà propres à l'instantané)
+        """
+        self._tasks = tasks
+        self._lock = lock
+        # IDs des tâches déjà copiées (propres à l'instantané)
+        self._owned: Set[str] = set()
+        self.sequence = sequence
+        self.taken_at = datetime.now().isoformat()
+
+    def _own(self, task_id: str) -> Task:
+        """Retourne la tâche propre à l'instantané, copiée si elle est encore partagée (verrou détenu)"""
+        task = self._tasks[task_id]
+        if task_id not in self._owned:
+            task = self._tasks[task_id] = copy.copy(task)
+            self._owned.add(task_id)
+        return task
+
+    def _shares(self, task: Task) -> bool:
+        """Indique si une tâche du gestionnaire est encore partagée avec l'instantané (verrou détenu)"""
+        return task.id not in self._owned and self._tasks.get(task.id) is task
+
+    def _detach(self, task: Task, previous: Task) -> None:
+        """
+        Remplace une tâche partagée par la copie de son état actuel, avant
+        que le gestionnaire ne la modifie (verrou détenu)
+
+        Args:
+            task: Tâche du gestionnaire sur le point d'être modifiée
+            previous: Copie de son état actuel
+        """
+        self._tasks[task.id] = previous
+        self._owned.add(task.id)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """
+        Récupère une tâche par son ID
+
+        Args:
+            task_id: ID de la tâche
+
+        Returns:
+            Tâche telle qu'à la prise de l'instantané, ou None
+        """
+        if task_id not in self._tasks:
+            return None
+        if self._lock is None:
+            return self._tasks[task_id]
+        with self._lock:
+            return self._own(task_id)
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Récupère toutes les tâches de l'instantané
+
+        Returns:
+            Liste des tâches
+        """
+        return list(self)
+
+    def get_tasks_by_status(self, status: Status) -> List[Task]:
+        """Récupère les tâches de l'instantané ayant un statut donné"""
+        return self._select('status', status)
+
+    def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
+        """Récupère les tâches de l'instantané ayant une priorité donnée"""
+        return self._select('priority', priority)
+
+    def get_tasks_by_project(self, project: str) -> List[Task]:
+        """Récupère les tâches de l'instantané d'un projet"""
+        return self._select('project', project)
+
+    def get_tasks_by_assignee(self, assignee: str) -> List[Task]:
+        """Récupère les tâches de l'instantané assignées à une personne"""
+        return self._select('assignee', assignee)
+
+    def _select(self, field: str, value: Any) -> List[Task]:
+        """Parcourt l'instantané (sans index) à la recherche d'une valeur"""
+        return [task for task in self if getattr(task, field) == value]
+
+    def __iter__(self) -> Iterator[Task]:
+        """Itère sur les tâches de l'instantané"""
+        if self._lock is None:
+            return iter(self._tasks.values())
+        return self._iter_owned()
+
+    def _iter_owned(self) -> Iterator[Task]:
+        """Itère sur les tâches en copiant par morceaux celles encore partagées"""
+        task_ids = list(self._tasks)
+        for start in range(0, len(task_ids), self._CHUNK_SIZE):
+            with self._lock:
+                tasks = [self._own(task_id) for task_id in task_ids[start:start + self._CHUNK_SIZE]]
+            yield from tasks
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def __len__(self) -> int:
+        """Retourne le nombre de tâches de l'instantané"""
+        return len(self._tasks)
+
+    def __repr__(self) -> str:
+        return f"TaskSnapshot({len(self._tasks)} tâches, taken_at={self.taken_at!r})"
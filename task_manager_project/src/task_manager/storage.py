@@ -0,0 +1,254 @@
+import os
+import sqlite3
+from abc import abstractmethod
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .task import Task, Priority, Status
+
+
+class TaskStore(MutableMapping):
+    """
+    Interface d'un backend de stockage transactionnel des tâches (ID -> Task)
+
+    Contrairement au fichier JSON, un tel backend écrit chaque mutation
+    individuellement et sait exécuter lui-même les filtres et comptages.
+    Les écritures ne sont durables qu'après commit(). Un backend incomplet
+    ne peut pas être instancié (classe abstraite).
+    """
+
+    @abstractmethod
+    def select(self, field: str, value: Any) -> List[Task]:
+        """
+        Récupère les tâches dont le champ vaut la valeur donnée
+
+        Args:
+            field: Champ filtré (status, priority, project ou assignee)
+            value: Valeur recherchée
+
+        Returns:
+            Liste des tâches correspondantes, dans l'ordre d'insertion
+        """
+
+    @abstractmethod
+    def counts(self, field: str) -> Dict[Any, int]:
+        """
+        Compte les tâches par valeur d'un champ
+
+        Args:
+            field: Champ compté (status, priority, project ou assignee)
+
+        Returns:
+            Dictionnaire valeur -> nombre de tâches (valeurs présentes uniquement)
+        """
+
+    @abstractmethod
+    def iter_ordered(self, order_by: str, after: Optional[Tuple[str, str]] = None,
+                     descending: bool = False, chunk_size: int = 500) -> Iterator[Task]:
+        """
+        Parcourt les tâches dans un ordre de pagination, à partir d'une clé
+
+        Args:
+            order_by: Ordre de pagination ('created_at' ou 'id')
+            after: Clé (valeur, ID) de la dernière tâche déjà lue (None : depuis le début)
+            descending: Si True, parcours dans l'ordre décroissant
+            chunk_size: Nombre de tâches lues par requête
+
+        Returns:
+            Itérateur sur les tâches ; seules celles consommées sont lues
+        """
+
+    def replace(self, tasks: Iterable[Task]) -> None:
+        """
+        Remplace tout le contenu du store
+
+        Args:
+            tasks: Nouvelles tâches
+        """
+        self.clear()
+        for task in tasks:
+            self[task.id] = task
+
+    @abstractmethod
+    def commit(self) -> None:
+        """Rend durables les écritures en cours"""
+
+    @abstractmethod
+    def rollback(self) -> None:
+        """Annule les écritures non encore validées"""
+
+    def close(self) -> None:
+        """Libère les ressources du store"""
+
+
+_COLUMNS = ('id', 'title', 'description', 'priority', 'status', 'project',
+            'assignee', 'due_date', 'created_at', 'updated_at')
+_FILTER_FIELDS = ('status', 'priority', 'project', 'assignee')
+_ENUMS = {'status': Status, 'priority': Priority}
+
+
+class SQLiteTaskStore(TaskStore):
+    """Backend de stockage des tâches dans une base SQLite indexée"""
+
+    def __init__(self, db_file: str, synchronous: str = "NORMAL",
+                 on_read: Optional[Callable[[Task], None]] = None):
+        """
+        Ouvre (ou crée) la base de données
+
+        Args:
+            db_file: Chemin vers le fichier SQLite
+            synchronous: Niveau de synchronisation disque (PRAGMA synchronous :
+                "FULL", "NORMAL" ou "OFF")
+            on_read: Fonction appelée avec chaque tâche relue depuis la base
+        """
+        dirname = os.path.dirname(db_file)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        self.db_file = db_file
+        self._on_read = on_read
+        # Partagée entre threads : les accès sont sérialisés par TaskManager
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        if synchronous not in ("FULL", "NORMAL", "OFF"):
+            raise ValueError(f"Niveau de synchronisation inconnu : {synchronous}")
+        self._conn.execute(f"PRAGMA synchronous = {synchronous}")
+        # L'ordre d'insertion est celui du rowid implicite, conservé par UPDATE
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "id TEXT PRIMARY KEY, title TEXT NOT NULL, description TEXT, "
+            "priority TEXT NOT NULL, status TEXT NOT NULL, project TEXT, "
+            "assignee TEXT, due_date TEXT, created_at TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL)"
+        )
+        for field in _FILTER_FIELDS:
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_tasks_{field} ON tasks ({field})")
+        # Pagination par curseur dans l'ordre de création
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at, id)")
+        self._conn.commit()
+
+    @staticmethod
+    def _to_row(task: Task) -> Tuple[Any, ...]:
+        data = task.to_dict()
+        return tuple(data[column] for column in _COLUMNS)
+
+    def _from_row(self, row: Tuple[Any, ...]) -> Task:
+        task = Task.from_dict(dict(zip(_COLUMNS, row)))
+        if self._on_read is not None:
+            self._on_read(task)
+        return task
+
+    @staticmethod
+    def _sql_value(field: str, value: Any) -> Any:
+        if field in _ENUMS and isinstance(value, _ENUMS[field]):
+            return value.value
+        return value
+
+    def _query(self, where: str = "", params: Tuple[Any, ...] = ()) -> List[Task]:
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM tasks {where} ORDER BY rowid", params
+        )
+        return [self._from_row(row) for row in cursor]
+
+    def __getitem__(self, task_id: str) -> Task:
+        row = self._conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(task_id)
+        return self._from_row(row)
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        row = self._to_row(task)
+        assignments = ', '.join(f"{column} = ?" for column in _COLUMNS[1:])
+        cursor = self._conn.execute(
+            f"UPDATE tasks SET {assignments} WHERE id = ?", row[1:] + (task_id,)
+        )
+        if cursor.rowcount == 0:
+            placeholders = ', '.join('?' for _ in _COLUMNS)
+            self._conn.execute(f"INSERT INTO tasks ({', '.join(_COLUMNS)}) VALUES ({placeholders})", row)
+
+    def __delitem__(self, task_id: str) -> None:
+        cursor = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        if cursor.rowcount == 0:
+            raise KeyError(task_id)
+
+    def __contains__(self, task_id: object) -> bool:
+        return self._conn.execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([row[0] for row in self._conn.execute("SELECT id FROM tasks ORDER BY rowid")])
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def values(self) -> List[Task]:
+        """
+        Récupère toutes les tâches en une requête
+
+        Returns:
+            Liste des tâches, dans l'ordre d'insertion
+        """
+        return self._query()
+
+    def items(self) -> List[Tuple[str, Task]]:
+        """
+        Récupère tous les couples (ID, tâche) en une requête
+
+        Returns:
+            Liste des couples, dans l'ordre d'insertion
+        """
+        return [(task.id, task) for task in self._query()]
+
+    def clear(self) -> None:
+        """Supprime toutes les tâches"""
+        self._conn.execute("DELETE FROM tasks")
+
+    def select(self, field: str, value: Any) -> List[Task]:
+        if field not in _FILTER_FIELDS:
+            raise ValueError(f"Champ non filtrable : {field}")
+        if value is None:
+            return self._query(f"WHERE {field} IS NULL")
+        return self._query(f"WHERE {field} = ?", (self._sql_value(field, value),))
+
+    def counts(self, field: str) -> Dict[Any, int]:
+        if field not in _FILTER_FIELDS:
+            raise ValueError(f"Champ non filtrable : {field}")
+        enum_cls = _ENUMS.get(field)
+        cursor = self._conn.execute(f"SELECT {field}, COUNT(*) FROM tasks GROUP BY {field}")
+        return {(enum_cls(value) if enum_cls else value): count for value, count in cursor}
+
+    def iter_ordered(self, order_by: str, after: Optional[Tuple[str, str]] = None,
+                     descending: bool = False, chunk_size: int = 500) -> Iterator[Task]:
+        if order_by == 'id':
+            columns, key = "id", lambda task: (task.id,)
+            after = None if after is None else (after[1],)
+        elif order_by == 'created_at':
+            columns, key = "created_at, id", lambda task: (task.created_at, task.id)
+        else:
+            raise ValueError(f"Ordre de pagination inconnu : {order_by}")
+        direction, comparison = ("DESC", "<") if descending else ("ASC", ">")
+        order = ', '.join(f"{column} {direction}" for column in columns.split(', '))
+        placeholders = ', '.join('?' for _ in columns.split(', '))
+        select = f"SELECT {', '.join(_COLUMNS)} FROM tasks"
+        while True:
+            if after is None:
+                cursor = self._conn.execute(f"{select} ORDER BY {order} LIMIT ?", (chunk_size,))
+            else:
+                cursor = self._conn.execute(
+                    f"{select} WHERE ({columns}) {comparison} ({placeholders}) ORDER BY {order} LIMIT ?",
+                    after + (chunk_size,)
+                )
+            tasks = [self._from_row(row) for row in cursor]
+            yield from tasks
+            if len(tasks) < chunk_size:
+                return
+            after = key(tasks[-1])
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        self._conn.rollback()
+
+    def close(self) -> None:
+        self._conn.close()
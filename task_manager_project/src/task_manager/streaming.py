@@ -0,0 +1,125 @@
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _ArrayReader:
+    """Tampon de lecture par blocs sur un fichier texte"""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0  # Position dans le fichier du début du tampon
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Lit un bloc supplémentaire ; retourne False en fin de fichier"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Retirer la partie déjà analysée pour garder un tampon borné
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Retourne le prochain caractère significatif ('' en fin de fichier)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        """Construit une erreur de format positionnée dans le fichier"""
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def iter_json_array(f: TextIO, chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Itère sur les éléments d'un tableau JSON sans charger tout le fichier
+
+    Le fichier est lu par blocs et chaque élément est décodé dès qu'il est
+    complet, de sorte que la mémoire utilisée reste de l'ordre d'un bloc
+    plus un élément.
+
+    Args:
+        f: Fichier texte ouvert en lecture, contenant un tableau JSON
+        chunk_size: Taille des blocs lus (en caractères)
+
+    Returns:
+        Itérateur sur les éléments du tableau
+
+    Raises:
+        json.JSONDecodeError: Si le contenu n'est pas un tableau JSON valide
+    """
+    for item, _, _ in iter_json_array_spans(f, chunk_size):
+        yield item
+
+
+def iter_json_array_spans(f: TextIO, chunk_size: int = 65536) -> Iterator[Tuple[Any, int, int]]:
+    """
+    Itère sur les éléments d'un tableau JSON avec leur position dans le fichier
+
+    Les positions sont comptées en caractères depuis le début du fichier ;
+    elles correspondent à des octets si le fichier est ouvert en 'latin-1'.
+
+    Args:
+        f: Fichier texte ouvert en lecture, contenant un tableau JSON
+        chunk_size: Taille des blocs lus (en caractères)
+
+    Returns:
+        Itérateur sur les triplets (élément, début, fin)
+
+    Raises:
+        json.JSONDecodeError: Si le contenu n'est pas un tableau JSON valide
+    """
+    decoder = json.JSONDecoder()
+    reader = _ArrayReader(f, chunk_size)
+
+    if reader.peek() != '[':
+        raise reader.error("Tableau JSON attendu")
+    reader.pos += 1
+
+    if reader.peek() == ']':
+        reader.pos += 1
+    else:
+        while True:
+            if not reader.peek():
+                raise reader.error("Fin de fichier inattendue")
+            while True:
+                try:
+                    item, end = decoder.raw_decode(reader.buffer, reader.pos)
+                except json.JSONDecodeError:
+                    # Élément incomplet : lire la suite, sinon l'erreur est réelle
+                    if not reader.fill():
+                        raise
+                    continue
+                # Un nombre peut être coupé en fin de tampon : s'assurer qu'il est terminé
+                if end == len(reader.buffer) and reader.fill():
+                    continue
+                break
+            start = reader.offset + reader.pos
+            reader.pos = end
+            yield item, start, reader.offset + end
+
+            separator = reader.peek()
+            reader.pos += 1
+            if separator == ']':
+                break
+            if separator != ',':
+                reader.pos -= 1
+                raise reader.error("',' ou ']' attendu")
+
+    if reader.peek():
+        raise reader.error("Données en trop après le tableau JSON")
@@ -1,3 +1,4 @@
+import sys
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -21,9 +22,54 @@ class Status(Enum):
     CANCELLED = "cancelled"
 
 
+# Tables de correspondance valeur -> membre, plus rapides que Priority(...)/Status(...)
+_PRIORITIES = {priority.value: priority for priority in Priority}
+_STATUSES = {status.value: status for status in Status}
+
+
+def _enum_from_value(table: Dict[Any, Enum], enum_cls: type, value: Any) -> Enum:
+    """
+    Retrouve un membre d'énumération à partir de sa valeur via une table en cache
+    
+    Args:
+        table: Table valeur -> membre
+        enum_cls: Énumération, utilisée pour lever l'erreur habituelle
+        value: Valeur recherchée
+        
+    Returns:
+        Membre correspondant
+        
+    Raises:
+        ValueError: Si la valeur ne correspond à aucun membre
+    """
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Interne une chaîne pour partager une seule copie entre toutes les tâches
+    
+    Args:
+        value: Chaîne à interner (None et sous-classes de str sont conservés tels quels)
+        
+    Returns:
+        La chaîne internée
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
 class Task:
     """Classe représentant une tâche dans le gestionnaire de tâches"""
     
+    # Pas de __dict__ par instance : les tâches sont nombreuses en mémoire
+    __slots__ = ('id', 'title', 'description', 'priority', 'status', '_project',
+                 '_assignee', 'due_date', 'created_at', 'updated_at', '_owner')
+    
     def __init__(self, title: str, description: str = "", priority: Priority = Priority.MEDIUM, 
                  status: Status = Status.TODO, project: Optional[str] = None, 
                  assignee: Optional[str] = None, due_date: Optional[str] = None):
@@ -49,11 +95,49 @@ class Task:
         self.due_date = due_date
         self.created_at = datetime.now().isoformat()
         self.updated_at = datetime.now().isoformat()
+        # Référence faible vers le gestionnaire qui détient la tâche
+        self._owner = None
+    
+    @property
+    def project(self) -> Optional[str]:
+        """Projet associé à la tâche (chaîne internée)"""
+        return self._project
+    
+    @project.setter
+    def project(self, value: Optional[str]) -> None:
+        self._project = _intern(value)
+    
+    @property
+    def assignee(self) -> Optional[str]:
+        """Personne assignée à la tâche (chaîne internée)"""
+        return self._assignee
+    
+    @assignee.setter
+    def assignee(self, value: Optional[str]) -> None:
+        self._assignee = _intern(value)
+    
+    def _modify(self, **fields: Any) -> None:
+        """
+        Applique la modification demandée par un mutateur public
+        
+        Une tâche détenue par un gestionnaire est modifiée via
+        TaskManager.update_task, qui tient à jour index, statistiques,
+        persistance et événements ; les affectations directes d'attributs
+        ne sont pas suivies.
+        
+        Args:
+            **fields: Attributs à modifier
+        """
+        manager = self._owner() if self._owner is not None else None
+        if manager is not None and manager._update_owned(self, fields):
+            return
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.updated_at = datetime.now().isoformat()
     
     def mark_completed(self) -> None:
         """Marque la tâche comme terminée"""
-        self.status = Status.COMPLETED
-        self.updated_at = datetime.now().isoformat()
+        self._modify(status=Status.COMPLETED)
     
     def update_priority(self, new_priority: Priority) -> None:
         """
@@ -62,8 +146,7 @@ class Task:
         Args:
             new_priority: Nouvelle priorité à assigner
         """
-        self.priority = new_priority
-        self.updated_at = datetime.now().isoformat()
+        self._modify(priority=new_priority)
     
     def assign_to_project(self, project_name: str) -> None:
         """
@@ -72,8 +155,7 @@ class Task:
         Args:
             project_name: Nom du projet
         """
-        self.project = project_name
-        self.updated_at = datetime.now().isoformat()
+        self._modify(project=project_name)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -100,30 +182,65 @@ class Task:
         """
         Crée une instance de Task à partir d'un dictionnaire
         
+        L'objet est construit directement à partir des champs stockés, sans
+        passer par __init__ (ni uuid4 ni horloge, qui seraient écrasés).
+        
         Args:
             data: Dictionnaire contenant les données de la tâche
             
         Returns:
             Instance de Task
+            
+        Raises:
+            KeyError: Si un champ obligatoire est absent
+            ValueError: Si la priorité ou le statut est invalide
         """
-        task = cls(
-            title=data['title'],
-            description=data.get('description', ''),
-            priority=Priority(data['priority']),
-            status=Status(data['status']),
-            project=data.get('project'),
-            assignee=data.get('assignee'),
-            due_date=data.get('due_date')
-        )
+        priority = _enum_from_value(_PRIORITIES, Priority, data['priority'])
+        status = _enum_from_value(_STATUSES, Status, data['status'])
+        
+        task = cls.__new__(cls)
         task.id = data['id']
+        task.title = data['title']
+        task.description = data.get('description', '')
+        task.priority = priority
+        task.status = status
+        task.project = data.get('project')
+        task.assignee = data.get('assignee')
+        task.due_date = data.get('due_date')
         task.created_at = data['created_at']
         task.updated_at = data['updated_at']
+        task._owner = None
         return task
     
+    def __copy__(self) -> 'Task':
+        """Copie superficielle, détachée du gestionnaire de la tâche d'origine"""
+        task = self.__class__.__new__(self.__class__)
+        for name in _STATE:
+            setattr(task, name, getattr(self, name))
+        task._owner = None
+        return task
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Task':
+        # Champs immuables (chaînes, énumérations) : la copie superficielle suffit
+        return self.__copy__()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Le gestionnaire (référence faible) n'est pas sérialisé
+        return {name: getattr(self, name) for name in _STATE}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._owner = None
+    
     def __str__(self) -> str:
         """Représentation string de la tâche"""
         return f"Task(id={self.id}, title='{self.title}', status={self.status.value}, priority={self.priority.value})"
     
     def __repr__(self) -> str:
         """Représentation détaillée de la tâche"""
-        return f"Task(id={self.id}, title='{self.title}', description='{self.description}', status={self.status.value}, priority={self.priority.value}, project={self.project}, assignee={self.assignee})" 
\ No newline at end of file
+        return f"Task(id={self.id}, title='{self.title}', description='{self.description}', status={self.status.value}, priority={self.priority.value}, project={self.project}, assignee={self.assignee})" 
+
+
+# Attributs portant l'état d'une tâche (copies et sérialisation)
+_STATE = tuple(name for name in Task.__slots__ if name != '_owner')
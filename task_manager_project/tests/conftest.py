@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import TaskManager
+
+
+@pytest.fixture
+def initial_tasks():
+    """Tâches ajoutées au gestionnaire de test (à redéfinir dans un module de test)"""
+    return []
+
+
+@pytest.fixture(params=["json", "lazy", "sqlite"])
+def manager(request, tmp_path, initial_tasks):
+    """Gestionnaire sur chaque backend (JSON, JSON lazy, SQLite), fermé en fin de test"""
+    if request.param == "sqlite":
+        manager = TaskManager(str(tmp_path / "tasks.db"), backend="sqlite")
+    else:
+        manager = TaskManager(str(tmp_path / "tasks.json"), lazy=request.param == "lazy")
+    manager.add_tasks(initial_tasks)
+    yield manager
+    manager.close()
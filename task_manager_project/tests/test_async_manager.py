@@ -0,0 +1,84 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager, AsyncTaskManager
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    return str(tmp_path / "tasks.json")
+
+
+def test_async_crud_and_filters(storage_file):
+    """Les opérations asynchrones reflètent celles du gestionnaire"""
+    async def scenario():
+        async with await AsyncTaskManager.open(storage_file) as manager:
+            task = Task("Tâche", priority=Priority.HIGH, assignee="Alice")
+            task_id = await manager.add_task(task)
+            assert (await manager.get_task(task_id)) is task
+            assert await manager.update_task(task_id, status=Status.IN_PROGRESS)
+            assert await manager.get_tasks_by_status(Status.IN_PROGRESS) == [task]
+            assert await manager.get_tasks_by_assignee("Alice") == [task]
+            assert await manager.get_tasks_by_priority(Priority.HIGH) == [task]
+            assert (await manager.get_statistics())['total_tasks'] == 1
+            assert await manager.delete_task("inexistante") is False
+            assert len(manager) == 1
+
+    asyncio.run(scenario())
+    assert TaskManager(storage_file).get_all_tasks()[0].status == Status.IN_PROGRESS
+
+
+def test_async_writes_are_coalesced(storage_file):
+    """Une rafale de mutations ne produit qu'une écriture"""
+    async def scenario():
+        manager = AsyncTaskManager(TaskManager(storage_file), flush_delay=0.05)
+        with patch.object(manager.manager, '_save_to_file', wraps=manager.manager._save_to_file) as save:
+            await asyncio.gather(*(manager.add_task(Task(f"Tâche {i}")) for i in range(30)))
+            assert save.call_count == 0
+            await asyncio.sleep(0.2)
+            assert save.call_count == 1
+        await manager.close()
+
+    asyncio.run(scenario())
+    with open(storage_file, encoding='utf-8') as f:
+        assert len(json.load(f)) == 30
+
+
+def test_async_event_loop_not_blocked_by_save(storage_file):
+    """La sauvegarde s'exécute hors du thread de la boucle d'événements"""
+    async def scenario():
+        manager = AsyncTaskManager(TaskManager(storage_file), flush_delay=0)
+        save_threads = []
+        original = manager.manager._save_to_file
+
+        def tracking_save(*args, **kwargs):
+            save_threads.append(threading.get_ident())
+            return original(*args, **kwargs)
+
+        manager.manager._save_to_file = tracking_save
+        await manager.add_task(Task("Tâche"))
+        await manager.flush()
+        assert save_threads
+        assert threading.get_ident() not in save_threads
+        await manager.close()
+
+    asyncio.run(scenario())
+
+
+def test_async_close_flushes_pending(storage_file):
+    """close() persiste les mutations encore en attente"""
+    async def scenario():
+        manager = AsyncTaskManager(TaskManager(storage_file), flush_delay=60)
+        await manager.add_tasks([Task("Tâche 1"), Task("Tâche 2")])
+        assert manager.manager.pending_changes == 2
+        await manager.close()
+
+    asyncio.run(scenario())
+    assert len(TaskManager(storage_file)) == 2
@@ -0,0 +1,99 @@
+import json
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, TaskManager
+from task_manager.atomic import atomic_write
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    """Le fichier n'est remplacé qu'une fois l'écriture terminée"""
+    path = str(tmp_path / "data.json")
+    with atomic_write(path) as f:
+        f.write("nouveau")
+        assert not os.path.exists(path)
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == "nouveau"
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_atomic_write_keeps_original_on_error(tmp_path):
+    """Une erreur pendant l'écriture laisse le fichier d'origine intact"""
+    path = str(tmp_path / "data.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("original")
+    os.chmod(path, 0o640)
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("partiel")
+            raise RuntimeError("crash simulé")
+
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == "original"
+    assert os.listdir(tmp_path) == ["data.json"]
+
+    with atomic_write(path) as f:
+        f.write("remplacé")
+    # Les droits du fichier existant sont conservés
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="droits POSIX")
+def test_new_file_follows_umask_without_changing_it(tmp_path):
+    """Un nouveau fichier reçoit les droits d'un open() ordinaire ; le umask n'est pas modifié"""
+    previous = os.umask(0o027)
+    try:
+        with patch.object(os, 'umask', side_effect=AssertionError("umask modifié")):
+            with atomic_write(str(tmp_path / "data.json")) as f:
+                f.write("contenu")
+    finally:
+        os.umask(previous)
+    assert stat.S_IMODE(os.stat(tmp_path / "data.json").st_mode) == 0o640
+
+
+def test_failed_save_does_not_truncate_store(tmp_path):
+    """Une sauvegarde interrompue ne tronque pas le stockage"""
+    storage_file = str(tmp_path / "tasks.json")
+    manager = TaskManager(storage_file)
+    manager.add_task(Task("Tâche 1"))
+
+    with patch('task_manager.manager.json.dump', side_effect=RuntimeError("disque plein")):
+        with pytest.raises(IOError):
+            manager.add_task(Task("Tâche 2"))
+
+    with open(storage_file, encoding='utf-8') as f:
+        assert [t['title'] for t in json.load(f)] == ["Tâche 1"]
+
+
+@pytest.mark.parametrize("policy, snapshot_syncs, journal_syncs", [
+    ("always", 2, 2),
+    ("batch", 1, 1),
+    ("never", 0, 0),
+])
+def test_fsync_policy(tmp_path, policy, snapshot_syncs, journal_syncs):
+    """Le nombre de fsync suit la politique choisie"""
+    storage_file = str(tmp_path / "tasks.json")
+    manager = TaskManager(storage_file, fsync=policy)
+    with patch('task_manager.atomic.os.fsync') as fsync:
+        manager.add_task(Task("Tâche"))
+        # 'always' synchronise aussi le dossier après le renommage
+        assert fsync.call_count == snapshot_syncs
+
+    journaled = TaskManager(str(tmp_path / "journal.json"), journal=True, fsync=policy)
+    with patch('task_manager.journal.os.fsync') as fsync:
+        with journaled.batch():
+            journaled.add_task(Task("Tâche 1"))
+            journaled.add_task(Task("Tâche 2"))
+        assert fsync.call_count == journal_syncs
+
+
+def test_invalid_fsync_policy(tmp_path):
+    """Une politique inconnue est refusée"""
+    with pytest.raises(ValueError):
+        TaskManager(str(tmp_path / "tasks.json"), fsync="sometimes")
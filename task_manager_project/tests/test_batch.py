@@ -0,0 +1,176 @@
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    return str(tmp_path / "tasks.json")
+
+
+def test_batch_saves_once(storage_file):
+    """Un lot de mutations ne déclenche qu'une seule sauvegarde"""
+    manager = TaskManager(storage_file)
+    with patch.object(manager, '_save_to_file', wraps=manager._save_to_file) as save:
+        with manager.batch():
+            for i in range(50):
+                manager.add_task(Task(f"Tâche {i}"))
+        assert save.call_count == 1
+
+    with open(storage_file, encoding='utf-8') as f:
+        assert len(json.load(f)) == 50
+
+
+def test_batch_rollback_on_error(storage_file):
+    """Une exception dans le bloc annule toutes les mutations du lot"""
+    manager = TaskManager(storage_file)
+    existing = Task("Existante", priority=Priority.LOW, assignee="Alice")
+    removed = Task("Supprimée")
+    manager.add_task(existing)
+    manager.add_task(removed)
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.add_task(Task("Nouvelle"))
+            manager.update_task(existing.id, priority=Priority.URGENT, assignee="Bob")
+            manager.delete_task(removed.id)
+            raise RuntimeError("import interrompu")
+
+    assert len(manager) == 2
+    assert manager.get_task(existing.id) is existing
+    assert existing.priority == Priority.LOW
+    assert manager.get_task(removed.id) is removed
+    assert manager.get_tasks_by_assignee("Alice") == [existing]
+    assert manager.get_tasks_by_assignee("Bob") == []
+    assert len(TaskManager(storage_file)) == 2
+
+
+def test_batch_rollback_after_clear(storage_file):
+    """clear_all_tasks dans un lot annulé est également annulé"""
+    manager = TaskManager(storage_file)
+    task = Task("Tâche", status=Status.IN_PROGRESS)
+    manager.add_task(task)
+
+    with pytest.raises(ValueError):
+        with manager.batch():
+            manager.clear_all_tasks()
+            manager.add_task(Task("Après vidage"))
+            raise ValueError("échec")
+
+    assert manager.get_all_tasks() == [task]
+    assert manager.get_statistics()['by_status']['in_progress'] == 1
+
+
+def test_nested_batches_flush_once(storage_file):
+    """Les lots imbriqués rejoignent le lot englobant"""
+    manager = TaskManager(storage_file)
+    with manager.batch():
+        manager.add_task(Task("Tâche 1"))
+        with manager.batch():
+            manager.add_task(Task("Tâche 2"))
+        assert not os.path.exists(storage_file)
+
+    assert len(TaskManager(storage_file)) == 2
+
+
+def test_batch_with_journal_coalesces_records(storage_file):
+    """En mode journal, un lot n'écrit qu'une entrée par tâche modifiée"""
+    manager = TaskManager(storage_file, journal=True)
+    task = Task("Tâche")
+    with manager.batch():
+        manager.add_task(task)
+        manager.update_task(task.id, status=Status.REVIEW)
+        manager.update_task(task.id, status=Status.COMPLETED)
+
+    assert len(manager._journal) == 1
+    reloaded = TaskManager(storage_file, journal=True)
+    assert reloaded.get_task(task.id).status == Status.COMPLETED
+
+
+def test_add_tasks_bulk(storage_file):
+    """add_tasks ajoute tout en une sauvegarde et retourne les IDs"""
+    manager = TaskManager(storage_file)
+    tasks = [Task(f"Tâche {i}", assignee="Alice") for i in range(10)]
+    with patch.object(manager, '_save_to_file', wraps=manager._save_to_file) as save:
+        ids = manager.add_tasks(tasks)
+        assert save.call_count == 1
+
+    assert ids == [t.id for t in tasks]
+    assert len(manager.get_tasks_by_assignee("Alice")) == 10
+
+
+def test_add_tasks_rejects_duplicates_atomically(storage_file):
+    """Un doublon fait échouer tout le lot sans rien ajouter"""
+    manager = TaskManager(storage_file)
+    existing = Task("Existante")
+    manager.add_task(existing)
+    fresh = Task("Nouvelle")
+    twin = Task("Jumelle")
+    twin.id = fresh.id
+
+    with pytest.raises(ValueError):
+        manager.add_tasks([fresh, twin])
+    with pytest.raises(ValueError):
+        manager.add_tasks([Task("Autre"), existing])
+    assert manager.get_all_tasks() == [existing]
+
+
+def test_update_and_delete_tasks_bulk(storage_file):
+    """update_tasks et delete_tasks retournent un résultat par élément"""
+    manager = TaskManager(storage_file)
+    task1, task2 = Task("Tâche 1"), Task("Tâche 2")
+    manager.add_tasks([task1, task2])
+
+    results = manager.update_tasks({
+        task1.id: {'status': Status.COMPLETED},
+        'inexistante': {'status': Status.COMPLETED},
+    })
+    assert results == [True, False]
+    assert manager.update_tasks([(task2.id, {'priority': Priority.HIGH})]) == [True]
+    assert manager.get_tasks_by_status(Status.COMPLETED) == [task1]
+
+    assert manager.delete_tasks([task1.id, 'inexistante']) == [True, False]
+    reloaded = TaskManager(storage_file)
+    assert [t.id for t in reloaded.get_all_tasks()] == [task2.id]
+    assert reloaded.get_task(task2.id).priority == Priority.HIGH
+
+
+def test_autosave_disabled_defers_until_flush(storage_file):
+    """Sans sauvegarde automatique, seules flush() et close() écrivent"""
+    manager = TaskManager(storage_file, autosave=False)
+    task = Task("Tâche")
+    manager.add_task(task)
+    manager.update_task(task.id, status=Status.COMPLETED)
+    with manager.batch():
+        manager.add_task(Task("Dans un lot"))
+    assert not os.path.exists(storage_file)
+    assert manager.pending_changes == 2
+
+    manager.flush()
+    assert manager.pending_changes == 0
+    assert len(TaskManager(storage_file)) == 2
+
+    manager.delete_task(task.id)
+    manager.close()
+    assert len(TaskManager(storage_file)) == 1
+
+
+def test_autosave_disabled_rollback_keeps_earlier_pending(storage_file):
+    """Un lot annulé ne perd pas les mutations en attente d'avant le lot"""
+    manager = TaskManager(storage_file, autosave=False, journal=True)
+    kept = Task("En attente")
+    manager.add_task(kept)
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.add_task(Task("Annulée"))
+            raise RuntimeError("échec")
+
+    manager.flush()
+    reloaded = TaskManager(storage_file, journal=True)
+    assert [t.id for t in reloaded.get_all_tasks()] == [kept.id]
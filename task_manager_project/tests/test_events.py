@@ -0,0 +1,136 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+from task_manager.events import ChangeFeed
+
+
+def test_typed_events_with_field_diffs(manager):
+    """Ajout, mise à jour et suppression produisent des événements typés et numérotés"""
+    events = []
+    manager.subscribe(events.append)
+    task = Task("Rédiger", priority=Priority.LOW)
+    manager.add_task(task)
+    manager.update_task(task.id, priority=Priority.HIGH, title="Rédiger")
+    manager.delete_task(task.id)
+    manager.delete_task("inexistante")
+
+    assert [(e.sequence, e.kind, e.task_id) for e in events] == \
+        [(1, 'created', task.id), (2, 'updated', task.id), (3, 'deleted', task.id)]
+    assert events[1].changes == {'priority': (Priority.LOW, Priority.HIGH)}
+    assert events[1].task.priority == Priority.HIGH
+    assert events[2].task.title == "Rédiger"
+    assert manager.change_sequence == 3
+
+
+def test_events_keep_task_state_at_emit_time(manager):
+    """Chaque événement garde l'état de la tâche au moment du changement"""
+    events = []
+    manager.subscribe(events.append)
+    task = Task("v1")
+    manager.add_task(task)
+    manager.update_task(task.id, title="v2")
+    manager.update_task(task.id, title="v3")
+    with manager.batch():
+        manager.update_task(task.id, status=Status.COMPLETED)
+        manager.update_task(task.id, title="v4")
+
+    assert [e.task.title for e in manager.changes_since(0)] == ["v1", "v2", "v3", "v3", "v4"]
+    assert [e.task.status for e in events[-2:]] == [Status.COMPLETED, Status.COMPLETED]
+    # Modifier la tâche d'un événement ne touche pas le gestionnaire
+    events[0].task.mark_completed()
+    assert manager.get_task(task.id).title == "v4"
+    assert manager.get_tasks_by_status(Status.TODO) == []
+
+
+def test_batch_events_published_on_commit_only(manager):
+    """Les événements d'un lot sont publiés à sa validation, jamais s'il est annulé"""
+    events = []
+    manager.subscribe(events.append, kinds=['created'])
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.add_task(Task("Annulée"))
+            raise RuntimeError("échec")
+    assert events == []
+
+    with manager.batch():
+        manager.add_tasks([Task("A"), Task("B")])
+        manager.update_task(manager.get_all_tasks()[0].id, status=Status.REVIEW)
+        assert events == []
+    assert [e.task.title for e in events] == ["A", "B"]
+
+
+def test_changes_since_and_snapshot_resync(manager):
+    """Un dérivé construit depuis un instantané se met à jour avec changes_since"""
+    manager.add_tasks([Task("A"), Task("B")])
+    snapshot = manager.snapshot()
+    titles = {task.id: task.title for task in snapshot}
+
+    added = Task("C")
+    manager.add_task(added)
+    manager.update_task(added.id, title="C bis")
+    manager.delete_task(next(iter(titles)))
+
+    for event in manager.changes_since(snapshot.sequence):
+        if event.kind == 'deleted':
+            del titles[event.task_id]
+        else:
+            titles[event.task_id] = event.task.title
+    assert sorted(titles.values()) == sorted(t.title for t in manager.get_all_tasks())
+    assert manager.changes_since(manager.change_sequence) == []
+
+
+def test_history_limit_and_reload_require_resync(tmp_path):
+    """Un historique dépassé ou un rechargement complet imposent une resynchronisation"""
+    manager = TaskManager(str(tmp_path / "tasks.json"), change_history=2)
+    manager.add_tasks([Task("A"), Task("B"), Task("C")])
+    assert [e.task.title for e in manager.changes_since(1)] == ["B", "C"]
+    with pytest.raises(ValueError):
+        manager.changes_since(0)
+
+    sequence = manager.change_sequence
+    manager.load_from_file(manager.storage_file)
+    with pytest.raises(ValueError):
+        manager.changes_since(sequence)
+    assert manager.changes_since(manager.change_sequence) == []
+
+
+def test_bounded_queue_never_blocks_writer(tmp_path):
+    """Une file pleine abandonne les événements au lieu de bloquer l'écrivain"""
+    manager = TaskManager(str(tmp_path / "tasks.json"), autosave=False)
+    subscription = manager.subscribe(maxsize=3)
+    manager.add_tasks(Task(f"Tâche {i}") for i in range(5))
+    assert [e.sequence for e in subscription.drain()] == [1, 2, 3]
+    assert subscription.dropped == 2
+    assert [e.sequence for e in manager.changes_since(3)] == [4, 5]
+
+    received = []
+    consumer = threading.Thread(target=lambda: received.append(subscription.get(timeout=5)))
+    consumer.start()
+    manager.add_task(Task("Attendue"))
+    consumer.join()
+    assert received[0].task.title == "Attendue"
+
+    subscription.unsubscribe()
+    manager.add_task(Task("Ignorée"))
+    assert subscription.get(timeout=0.01) is None
+
+
+def test_failing_subscriber_does_not_break_writes(tmp_path):
+    """L'exception d'un abonné est consignée sans interrompre l'écriture ni les autres abonnés"""
+    feed = ChangeFeed()
+    received = []
+
+    def failing(event):
+        raise RuntimeError("abonné défaillant")
+
+    feed.subscribe(failing)
+    feed.subscribe(received.append)
+    feed.publish('created', "id", None)
+    assert len(received) == 1
+    with pytest.raises(ValueError):
+        feed.subscribe(received.append, kinds=['renamed'])
@@ -0,0 +1,103 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+from task_manager.formats import COMPRESSIONS, FILE_FORMATS, detect_compression, dump_tasks, iter_task_records
+
+
+def _sample_tasks():
+    return [
+        Task("Tâche accentuée", "Description é à ü", Priority.HIGH, project="Alpha", assignee="Zoé"),
+        Task("Deuxième", priority=Priority.LOW, due_date="2024-12-31T00:00:00"),
+        Task("Troisième", status=Status.COMPLETED),
+    ]
+
+
+@pytest.mark.parametrize("file_format", FILE_FORMATS)
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_roundtrip_all_formats(tmp_path, file_format, compression):
+    """Chaque combinaison format/compression est relue à l'identique"""
+    path = str(tmp_path / "tasks.dat")
+    records = [task.to_dict() for task in _sample_tasks()]
+    with open(path, 'wb') as f:
+        dump_tasks(records, f, file_format, compression)
+
+    with open(path, 'rb') as f:
+        assert detect_compression(f.read(8)) == compression
+    assert list(iter_task_records(path)) == records
+
+
+def test_compact_formats_are_smaller(tmp_path):
+    """Le JSON compact, le binaire et la compression réduisent la taille du fichier"""
+    records = [Task(f"Tâche {i}", "Description répétée", project="Projet").to_dict() for i in range(200)]
+
+    def size(file_format, compression=None):
+        buffer = io.BytesIO()
+        dump_tasks(records, buffer, file_format, compression)
+        return len(buffer.getvalue())
+
+    assert size('json-min') < size('json')
+    assert size('binary') < size('json')
+    assert size('json', 'gzip') < size('json-min')
+    assert size('binary', 'lzma') < size('binary')
+
+
+def test_manager_binary_gzip_storage(tmp_path):
+    """Le gestionnaire écrit dans son format et relit sans le connaître"""
+    path = str(tmp_path / "tasks.bin")
+    manager = TaskManager(path, file_format="binary", compression="gzip")
+    ids = [manager.add_task(task) for task in _sample_tasks()]
+
+    with open(path, 'rb') as f:
+        assert f.read(2) == b'\x1f\x8b'
+
+    reloaded = TaskManager(path)
+    assert [task.id for task in reloaded.get_all_tasks()] == ids
+    assert reloaded.get_task(ids[0]).assignee == "Zoé"
+    assert reloaded.get_tasks_by_status(Status.COMPLETED)[0].id == ids[2]
+
+
+def test_save_to_file_with_format(tmp_path):
+    """Une sauvegarde peut être exportée dans un autre format que le stockage"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    manager.add_tasks(_sample_tasks())
+
+    backup = str(tmp_path / "backup_taches.json.xz")
+    manager.save_to_file(backup, compression="lzma")
+    with open(backup, 'rb') as f:
+        assert detect_compression(f.read(8)) == 'lzma'
+
+    # Le fichier de stockage reste en JSON indenté
+    with open(manager.storage_file, encoding='utf-8') as f:
+        assert len(json.load(f)) == 3
+
+    restored = TaskManager(str(tmp_path / "restored.json"))
+    restored.load_from_file(backup)
+    assert len(restored) == 3
+
+
+def test_lazy_requires_plain_json(tmp_path):
+    """Le mode lazy refuse les formats binaires ou compressés"""
+    with pytest.raises(ValueError):
+        TaskManager(str(tmp_path / "tasks.json"), lazy=True, compression="gzip")
+    with pytest.raises(ValueError):
+        TaskManager(str(tmp_path / "tasks.json"), file_format="xml")
+
+
+def test_corrupted_compressed_file(tmp_path):
+    """Un fichier compressé tronqué lève ValueError"""
+    path = str(tmp_path / "tasks.json")
+    manager = TaskManager(path, compression="zlib")
+    manager.add_tasks(_sample_tasks())
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:len(data) // 2])
+
+    with pytest.raises(ValueError):
+        TaskManager(path)
@@ -0,0 +1,212 @@
+import copy
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+from task_manager.indexes import TaskIndex, DueDateIndex
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return TaskManager(str(tmp_path / "tasks.json"))
+
+
+def test_task_index_add_lookup_remove():
+    """L'index retrouve les IDs par valeur et se vide proprement"""
+    index = TaskIndex()
+    task = Task("Tâche", priority=Priority.HIGH, project="Projet A", assignee="Alice")
+    index.add(task)
+
+    assert list(index.lookup('priority', Priority.HIGH)) == [task.id]
+    assert list(index.lookup('project', "Projet A")) == [task.id]
+
+    index.remove(task.id)
+    assert list(index.lookup('priority', Priority.HIGH)) == []
+    assert len(index) == 0
+    # Les valeurs sans tâche ne laissent pas d'entrée vide
+    assert Priority.HIGH not in index._indexes['priority']
+
+
+def test_task_index_tracks_mutated_task():
+    """Réindexer une tâche modifiée retire bien ses anciennes valeurs"""
+    index = TaskIndex()
+    task = Task("Tâche", status=Status.TODO)
+    index.add(task)
+    task.status = Status.COMPLETED
+    index.add(task)
+
+    assert list(index.lookup('status', Status.TODO)) == []
+    assert list(index.lookup('status', Status.COMPLETED)) == [task.id]
+
+
+def test_indexes_follow_update_and_delete(manager):
+    """Les filtres restent cohérents après mise à jour et suppression"""
+    task1 = Task("Tâche 1", status=Status.TODO, assignee="Alice", project="Projet A")
+    task2 = Task("Tâche 2", status=Status.TODO, assignee="Bob", project="Projet A")
+    manager.add_task(task1)
+    manager.add_task(task2)
+
+    manager.update_task(task1.id, status=Status.IN_PROGRESS, assignee="Bob")
+    assert manager.get_tasks_by_status(Status.TODO) == [task2]
+    assert manager.get_tasks_by_status(Status.IN_PROGRESS) == [task1]
+    assert manager.get_tasks_by_assignee("Alice") == []
+    assert len(manager.get_tasks_by_assignee("Bob")) == 2
+
+    manager.delete_task(task2.id)
+    assert manager.get_tasks_by_status(Status.TODO) == []
+    assert manager.get_tasks_by_project("Projet A") == [task1]
+
+    manager.clear_all_tasks()
+    assert manager.get_tasks_by_assignee("Bob") == []
+
+
+def test_indexes_rebuilt_on_load(tmp_path):
+    """Les index sont reconstruits au chargement, journal compris"""
+    storage_file = str(tmp_path / "tasks.json")
+    manager1 = TaskManager(storage_file, journal=True)
+    task = Task("Tâche", priority=Priority.LOW)
+    manager1.add_task(task)
+    manager1.update_task(task.id, priority=Priority.URGENT)
+
+    manager2 = TaskManager(storage_file, journal=True)
+    assert [t.id for t in manager2.get_tasks_by_priority(Priority.URGENT)] == [task.id]
+    assert manager2.get_tasks_by_priority(Priority.LOW) == []
+
+
+def test_statistics_follow_mutations(manager):
+    """Les statistiques reflètent les mutations sans parcourir les tâches"""
+    task1 = Task("Tâche 1", priority=Priority.HIGH, project="Projet A", assignee="Alice")
+    task2 = Task("Tâche 2", priority=Priority.HIGH, project="Projet B")
+    manager.add_task(task1)
+    manager.add_task(task2)
+    manager.update_task(task2.id, status=Status.COMPLETED, project="Projet A")
+
+    stats = manager.get_statistics()
+    assert stats['total_tasks'] == 2
+    assert stats['by_status'] == {
+        'todo': 1, 'in_progress': 0, 'review': 0, 'completed': 1, 'cancelled': 0
+    }
+    assert stats['by_priority'] == {'low': 0, 'medium': 0, 'high': 2, 'urgent': 0}
+    assert stats['by_project'] == {'Projet A': 2}
+    assert stats['by_assignee'] == {'Alice': 1}
+
+    manager.delete_task(task1.id)
+    stats = manager.get_statistics()
+    assert stats['by_priority']['high'] == 1
+    assert stats['by_assignee'] == {}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_statistics_follow_task_mutators(tmp_path, lazy):
+    """Les statistiques suivent les mutateurs appelés directement sur une tâche"""
+    manager = TaskManager(str(tmp_path / "tasks.json"), lazy=lazy)
+    manager.add_tasks([Task("Tâche 1", priority=Priority.LOW), Task("Tâche 2")])
+    task = manager.get_all_tasks()[0]
+    task.mark_completed()
+    task.update_priority(Priority.HIGH)
+    task.assign_to_project("Projet A")
+
+    stats = manager.get_statistics()
+    assert stats['by_status']['todo'] == 1
+    assert stats['by_status']['completed'] == 1
+    assert stats['by_priority'] == {'low': 0, 'medium': 1, 'high': 1, 'urgent': 0}
+    assert stats['by_project'] == {'Projet A': 1}
+
+
+def test_due_date_index_ranges():
+    """L'index trié répond aux intervalles et suit les modifications d'échéance"""
+    index = DueDateIndex()
+    index.add("a", "2024-03-01T09:00:00")
+    index.add("b", "2024-01-15")
+    index.add("c", None)
+    index.add("d", "pas une date")
+    index.add("e", datetime(2024, 2, 1, tzinfo=timezone.utc))
+
+    assert list(index.range()) == ["b", "e", "a"]
+    assert list(index.range("2024-01-16", "2024-03-01T09:00:00")) == ["e"]
+    assert list(index.range(end="2024-03-01T09:00:00", include_end=True)) == ["b", "e", "a"]
+    assert index.count(start=datetime(2024, 2, 15)) == 1
+
+    index.add("b", "2024-12-31")
+    assert list(index.range()) == ["e", "a", "b"]
+    index.remove("e")
+    assert list(index.range()) == ["a", "b"]
+    assert len(index) == 2
+
+
+def test_overdue_and_upcoming(manager):
+    """Les tâches en retard ou à échéance proche sont trouvées sans parcours"""
+    now = datetime(2024, 6, 1, 12, 0)
+    late = Task("En retard", due_date=(now - timedelta(days=2)).isoformat())
+    done = Task("Terminée", status=Status.COMPLETED, due_date=(now - timedelta(days=1)).isoformat())
+    soon = Task("Demain", due_date=(now + timedelta(hours=20)).isoformat())
+    later = Task("Semaine prochaine", due_date=(now + timedelta(days=7)).isoformat())
+    manager.add_tasks([later, soon, done, late, Task("Sans échéance")])
+
+    assert manager.get_overdue_tasks(now) == [late]
+    assert manager.get_tasks_due_soon(24, now) == [soon]
+    assert manager.get_tasks_due_between(now - timedelta(days=3), now + timedelta(days=1)) == [late, done, soon]
+
+    manager.update_task(later.id, due_date=(now + timedelta(hours=1)).isoformat())
+    assert manager.get_tasks_due_soon(24, now) == [later, soon]
+    manager.delete_task(late.id)
+    assert manager.get_overdue_tasks(now) == []
+
+
+def test_due_date_lookups_on_sqlite(tmp_path):
+    """Le backend SQLite donne les mêmes résultats par parcours"""
+    manager = TaskManager(str(tmp_path / "tasks.db"), backend="sqlite")
+    now = datetime(2024, 6, 1, 12, 0)
+    late = Task("En retard", due_date=(now - timedelta(hours=1)).isoformat())
+    soon = Task("Bientôt", due_date=(now + timedelta(hours=2)).isoformat())
+    manager.add_tasks([soon, late])
+
+    assert [t.id for t in manager.get_overdue_tasks(now)] == [late.id]
+    assert [t.id for t in manager.get_tasks_due_between()] == [late.id, soon.id]
+
+
+@pytest.mark.parametrize("backend", ["json", "lazy", "sqlite"])
+def test_task_mutators_keep_indexes_current(tmp_path, backend):
+    """Les mutateurs d'une tâche détenue passent par le gestionnaire (index, persistance)"""
+    def open_manager():
+        if backend == "sqlite":
+            return TaskManager(str(tmp_path / "tasks.db"), backend="sqlite")
+        return TaskManager(str(tmp_path / "tasks.json"), lazy=backend == "lazy")
+
+    manager = open_manager()
+    manager.add_tasks([Task("Tâche 1"), Task("Tâche 2"), Task("Tâche 3")])
+    first, second, third = manager.get_all_tasks()
+
+    first.mark_completed()
+    second.update_priority(Priority.URGENT)
+    third.assign_to_project("Projet A")
+    assert first.status == Status.COMPLETED
+    assert [t.id for t in manager.get_tasks_by_status(Status.TODO)] == [second.id, third.id]
+    assert [t.id for t in manager.get_tasks_by_status(Status.COMPLETED)] == [first.id]
+    assert [t.id for t in manager.get_tasks_by_priority(Priority.URGENT)] == [second.id]
+    assert [t.id for t in manager.get_tasks_by_project("Projet A")] == [third.id]
+    manager.close()
+
+    reopened = open_manager()
+    assert [t.id for t in reopened.get_tasks_by_status(Status.COMPLETED)] == [first.id]
+    assert reopened.get_task(third.id).project == "Projet A"
+    reopened.close()
+
+
+def test_mutators_of_removed_task_stay_local(manager):
+    """Une tâche supprimée ou copiée n'est plus rattachée au gestionnaire"""
+    task = Task("Tâche")
+    manager.add_task(task)
+    detached = copy.copy(task)
+    detached.mark_completed()
+    assert task.status == Status.TODO
+    assert manager.get_tasks_by_status(Status.COMPLETED) == []
+
+    manager.delete_task(task.id)
+    task.mark_completed()
+    assert task.status == Status.COMPLETED
+    assert len(manager) == 0
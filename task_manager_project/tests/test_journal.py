@@ -0,0 +1,120 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+from task_manager.journal import TaskJournal
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    return str(tmp_path / "tasks.json")
+
+
+def test_journal_append_and_replay(tmp_path):
+    """Les entrées sont relues dans l'ordre d'écriture"""
+    journal = TaskJournal(str(tmp_path / "tasks.json.journal"))
+    journal.append({'op': 'put', 'task': {'id': 'a'}})
+    journal.append({'op': 'delete', 'id': 'a'})
+    assert len(journal) == 2
+
+    records = list(journal.replay())
+    assert [r['op'] for r in records] == ['put', 'delete']
+    assert len(journal) == 2
+
+    journal.reset()
+    assert len(journal) == 0
+    assert list(journal.replay()) == []
+
+
+def test_journal_ignores_truncated_last_line(tmp_path):
+    """Une ligne partiellement écrite (crash) est ignorée au rejeu"""
+    path = str(tmp_path / "tasks.json.journal")
+    journal = TaskJournal(path)
+    journal.append({'op': 'delete', 'id': 'a'})
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "put", "task": {"id"')
+
+    assert [r['id'] for r in journal.replay()] == ['a']
+
+
+def test_mutations_append_to_journal_without_rewriting_snapshot(storage_file):
+    """En mode journal, les mutations ne réécrivent pas le fichier principal"""
+    manager = TaskManager(storage_file, journal=True)
+    task = Task("Tâche journalisée", priority=Priority.HIGH)
+    manager.add_task(task)
+    manager.update_task(task.id, status=Status.IN_PROGRESS)
+
+    assert not os.path.exists(storage_file)
+    with open(storage_file + '.journal', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])['task']['status'] == 'in_progress'
+
+
+def test_journal_replayed_on_load(storage_file):
+    """Un nouveau gestionnaire reconstruit l'état à partir du snapshot et du journal"""
+    manager1 = TaskManager(storage_file, journal=True)
+    keep = Task("À garder", project="Projet A")
+    drop = Task("À supprimer")
+    manager1.add_task(keep)
+    manager1.add_task(drop)
+    manager1.update_task(keep.id, status=Status.COMPLETED)
+    manager1.delete_task(drop.id)
+
+    manager2 = TaskManager(storage_file, journal=True)
+    assert len(manager2) == 1
+    assert manager2.get_task(keep.id).status == Status.COMPLETED
+    assert manager2.get_task(drop.id) is None
+
+
+def test_journal_compaction(storage_file):
+    """Le journal est compacté dans le snapshot une fois le seuil atteint"""
+    manager = TaskManager(storage_file, journal=True, compact_threshold=3)
+    tasks = [Task(f"Tâche {i}") for i in range(4)]
+    for task in tasks:
+        manager.add_task(task)
+
+    with open(storage_file, encoding='utf-8') as f:
+        assert len(json.load(f)) == 3
+    assert len(manager._journal) == 1
+
+    reloaded = TaskManager(storage_file, journal=True)
+    assert {t.id for t in reloaded.get_all_tasks()} == {t.id for t in tasks}
+
+
+def test_clear_all_tasks_with_journal(storage_file):
+    """clear_all_tasks vide à la fois le snapshot et le journal"""
+    manager = TaskManager(storage_file, journal=True)
+    manager.add_task(Task("Tâche"))
+    manager.clear_all_tasks()
+
+    assert not os.path.exists(storage_file + '.journal')
+    assert len(TaskManager(storage_file, journal=True)) == 0
+
+
+def test_load_from_file_then_journal_keeps_loaded_tasks(storage_file, tmp_path):
+    """Après load_from_file, la persistance repart d'un snapshot complet, pas du journal"""
+    source = TaskManager(str(tmp_path / "src.json"))
+    source.add_tasks(Task(f"Importée {i}") for i in range(5))
+
+    manager = TaskManager(storage_file, journal=True)
+    manager.add_task(Task("Remplacée"))
+    manager.load_from_file(source.storage_file)
+    added = Task("Ajoutée")
+    manager.add_task(added)
+    manager.add_task(Task("Journalisée"))
+
+    assert len(manager._journal) == 1
+    reloaded = TaskManager(storage_file, journal=True)
+    assert len(reloaded) == 7
+    assert reloaded.get_task(added.id).title == "Ajoutée"
+
+    batched = TaskManager(storage_file, journal=True, autosave=False)
+    batched.load_from_file(source.storage_file)
+    batched.add_task(Task("En attente"))
+    batched.close()
+    assert len(TaskManager(storage_file, journal=True)) == 6
@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+from task_manager.lazy import LazyTaskStore
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    path = str(tmp_path / "tasks.json")
+    tasks = [
+        Task(f"Réviser la documentation {i}", project="Projet A" if i % 2 else "Projet B",
+             priority=Priority.HIGH if i < 3 else Priority.LOW)
+        for i in range(20)
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([t.to_dict() for t in tasks], f, indent=2, ensure_ascii=False)
+    return path
+
+
+def test_lazy_store_hydrates_on_access(storage_file):
+    """Seul l'index des positions est construit, les tâches sont lues à la demande"""
+    store = LazyTaskStore(max_resident=5)
+    store.load(storage_file)
+    assert len(store) == 20
+    assert store.resident_count == 0
+
+    with open(storage_file, encoding='utf-8') as f:
+        expected = json.load(f)
+    for data in expected:
+        assert store[data['id']].to_dict() == data
+    assert store.resident_count == 5
+
+
+def test_lazy_store_lru_keeps_recent_tasks(storage_file):
+    """Le cache conserve les tâches les plus récemment utilisées"""
+    store = LazyTaskStore(max_resident=2)
+    store.load(storage_file)
+    ids = list(store)
+    first = store[ids[0]]
+    store[ids[1]]
+    assert store[ids[0]] is first
+    store[ids[2]]
+    assert list(store._resident) == [ids[0], ids[2]]
+    assert store[ids[0]] is first
+
+
+def test_lazy_manager_get_task_reads_one_record(storage_file):
+    """get_task ne reconstruit que la tâche demandée"""
+    with open(storage_file, encoding='utf-8') as f:
+        target = json.load(f)[7]['id']
+    manager = TaskManager(storage_file, lazy=True)
+    with patch.object(Task, 'from_dict', wraps=Task.from_dict) as from_dict:
+        task = manager.get_task(target)
+        assert from_dict.call_count == 1
+    assert task.title == "Réviser la documentation 7"
+    assert manager.tasks.resident_count == 1
+
+
+def test_lazy_manager_filters_and_statistics(storage_file):
+    """Les filtres et statistiques fonctionnent en mode lazy"""
+    manager = TaskManager(storage_file, lazy=True, max_resident=3)
+    assert len(manager.get_tasks_by_priority(Priority.HIGH)) == 3
+    assert len(manager.get_tasks_by_project("Projet A")) == 10
+    assert manager.get_statistics()['by_priority']['low'] == 17
+
+
+def test_lazy_manager_mutations_survive_eviction(storage_file, tmp_path):
+    """Les tâches modifiées restent en mémoire malgré la borne du cache"""
+    manager = TaskManager(storage_file, lazy=True, max_resident=1, journal=True)
+    ids = list(manager.tasks)
+    manager.update_task(ids[0], status=Status.COMPLETED)
+    for task_id in ids[1:]:
+        manager.get_task(task_id)
+    assert manager.get_task(ids[0]).status == Status.COMPLETED
+
+    new_task = Task("Nouvelle")
+    manager.add_task(new_task)
+    manager.delete_task(ids[1])
+    assert len(manager) == 20
+
+    reloaded = TaskManager(storage_file, lazy=True, journal=True)
+    assert reloaded.get_task(ids[0]).status == Status.COMPLETED
+    assert reloaded.get_task(new_task.id).title == "Nouvelle"
+    assert reloaded.get_task(ids[1]) is None
+
+
+def test_lazy_manager_full_save_reindexes_file(storage_file):
+    """Après une réécriture complète, les positions sont recalculées"""
+    manager = TaskManager(storage_file, lazy=True, max_resident=2)
+    ids = list(manager.tasks)
+    manager.update_task(ids[5], title="Titre modifié avec accents éèà")
+    assert manager.tasks.resident_count == 0
+    assert manager.get_task(ids[5]).title == "Titre modifié avec accents éèà"
+    assert manager.get_task(ids[6]).title == "Réviser la documentation 6"
+
+
+def test_lazy_load_builds_no_task_and_validates_on_access(storage_file):
+    """Le chargement n'indexe que les IDs ; un enregistrement invalide est signalé à son accès"""
+    with open(storage_file, encoding='utf-8') as f:
+        records = json.load(f)
+    records[3]['priority'] = "inconnue"
+    records.append({'title': "Sans ID"})
+    with open(storage_file, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False)
+
+    with patch.object(Task, 'from_dict', wraps=Task.from_dict) as from_dict:
+        manager = TaskManager(storage_file, lazy=True)
+        assert from_dict.call_count == 0
+    assert len(manager) == 20
+    assert len(manager.load_errors) == 1
+
+    assert manager.get_task(records[3]['id']) is None
+    assert len(manager.load_errors) == 2
+    assert len(manager) == 19
+    assert len(manager.get_all_tasks()) == 19
+
+
+def test_invalid_record_reported_after_save(storage_file):
+    """Après une sauvegarde complète, un enregistrement invalide reste signalé à son accès"""
+    manager = TaskManager(storage_file, lazy=True)
+    task_id = next(iter(manager.tasks))
+    manager.update_task(task_id, priority=Priority.MEDIUM)
+    manager.save_to_file()
+
+    with open(storage_file, encoding='utf-8') as f:
+        content = f.read()
+    # Même longueur : les positions indexées restent valables
+    with open(storage_file, 'w', encoding='utf-8') as f:
+        f.write(content.replace('"medium"', '"mediun"', 1))
+
+    assert manager.get_task(task_id) is None
+    assert len(manager.load_errors) == 1
@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+from task_manager.locking import ReadWriteLock
+
+
+def test_readers_run_in_parallel():
+    """Plusieurs lecteurs détiennent le verrou en même temps"""
+    lock = ReadWriteLock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def reader():
+        with lock.reading():
+            barrier.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # Si les lectures étaient exclusives, la barrière aurait expiré
+    assert not barrier.broken
+
+
+def test_writer_excludes_readers():
+    """Un lecteur attend la fin de l'écriture en cours"""
+    lock = ReadWriteLock()
+    events = []
+    lock.acquire_write()
+
+    def reader():
+        with lock.reading():
+            events.append('lecture')
+
+    t = threading.Thread(target=reader)
+    t.start()
+    t.join(timeout=0.1)
+    events.append('fin écriture')
+    lock.release_write()
+    t.join()
+    assert events == ['fin écriture', 'lecture']
+
+
+def test_lock_reentrancy():
+    """Un rédacteur peut relire et réécrire ; un lecteur ne peut pas écrire"""
+    lock = ReadWriteLock()
+    with lock.writing():
+        with lock.reading():
+            with lock.writing():
+                pass
+    with lock.reading():
+        with lock.reading():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+    # Le verrou est de nouveau libre
+    with lock.writing():
+        pass
+
+
+def test_concurrent_workers_keep_state_consistent(tmp_path):
+    """Des écritures et lectures concurrentes laissent un état cohérent"""
+    storage_file = str(tmp_path / "tasks.json")
+    manager = TaskManager(storage_file, journal=True)
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(20):
+                task = Task(f"Tâche {n}-{i}", priority=Priority.HIGH, assignee=f"worker-{n}")
+                manager.add_task(task)
+                manager.update_task(task.id, status=Status.COMPLETED)
+        except Exception as e:  # pragma: no cover - remonté par l'assertion
+            errors.append(e)
+
+    def reader():
+        try:
+            for _ in range(50):
+                stats = manager.get_statistics()
+                assert stats['by_priority']['high'] == stats['total_tasks']
+                manager.get_tasks_by_status(Status.COMPLETED)
+                manager.get_all_tasks()
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for n in range(4):
+            pool.submit(writer, n)
+            pool.submit(reader)
+
+    assert errors == []
+    assert len(manager) == 80
+    assert len(manager.get_tasks_by_status(Status.COMPLETED)) == 80
+    assert len(TaskManager(storage_file, journal=True)) == 80
+
+
+def test_sqlite_manager_shared_between_threads(tmp_path):
+    """Le backend SQLite peut être utilisé depuis plusieurs threads"""
+    manager = TaskManager(str(tmp_path / "tasks.db"), backend="sqlite")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda i: manager.add_task(Task(f"Tâche {i}")), range(20)))
+        counts = list(pool.map(lambda _: len(manager.get_all_tasks()), range(4)))
+    assert len(manager) == 20
+    assert all(count <= 20 for count in counts)
+    manager.close()
@@ -0,0 +1,172 @@
+import os
+import socketserver
+import sys
+import threading
+from collections import deque
+from email import message_from_bytes, policy
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import EmailService
+from task_manager.mailing import SMTPConnectionPool, send_messages
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Dialogue SMTP minimal (EHLO, MAIL, RCPT, DATA, RSET, NOOP, QUIT)"""
+
+    def reply(self, line):
+        self.wfile.write(line.encode('ascii') + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 stand-in ESMTP")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.strip().decode('ascii', 'replace')
+            verb = command.split(' ', 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250-stand-in")
+                self.reply("250 8BITMIME")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(':', 1)[1].strip().strip('<>')
+                if address in server.refused:
+                    self.reply("550 Destinataire inconnu")
+                else:
+                    recipients.append(address)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 Fin par <CRLF>.<CRLF>")
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b".\r\n", b""):
+                        break
+                    data.append(chunk[1:] if chunk.startswith(b"..") else chunk)
+                with server.lock:
+                    failure = server.failures.popleft() if server.failures else None
+                    if failure is None:
+                        server.messages.append(message_from_bytes(b"".join(data), policy=policy.default))
+                if failure == "drop":
+                    return
+                self.reply(failure or "250 OK")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Au revoir")
+                return
+            else:
+                self.reply("502 Commande non reconnue")
+
+
+class _StandInSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = []
+        self.refused = set()
+        # Réponses imposées aux prochains DATA ("drop" : coupure de connexion)
+        self.failures = deque()
+
+
+@pytest.fixture
+def smtp_server():
+    server = _StandInSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _service(server, **options):
+    options.setdefault('backoff', 0.001)
+    return EmailService(smtp_server="127.0.0.1", port=server.server_address[1], **options)
+
+
+def test_reminders_grouped_per_recipient(smtp_server):
+    """Les rappels d'un même destinataire forment un seul message"""
+    service = _service(smtp_server)
+    result = service.send_reminders([
+        ("alice@exemple.fr", "Rapport", "2024-06-01"),
+        ("bob@exemple.fr", "Réunion", "2024-06-02"),
+        ("alice@exemple.fr", "Relecture", "2024-06-03"),
+    ])
+    service.close()
+
+    assert result.ok and sorted(result.sent) == ["alice@exemple.fr", "bob@exemple.fr"]
+    by_recipient = {message['To']: message for message in smtp_server.messages}
+    alice = by_recipient["alice@exemple.fr"]
+    assert alice['Subject'] == "[RAPPEL] 2 tâche(s) à rendre"
+    body = alice.get_content()
+    assert "'Rapport' est à rendre pour le 2024-06-01" in body
+    assert "'Relecture' est à rendre pour le 2024-06-03" in body
+
+
+def test_connections_pooled_and_reused(smtp_server):
+    """Des centaines de messages n'ouvrent pas plus de connexions que la taille du pool"""
+    service = _service(smtp_server, pool_size=3)
+    reminders = [(f"personne{i}@exemple.fr", f"Tâche {i}", "2024-06-01") for i in range(300)]
+    assert len(service.send_reminders(reminders).sent) == 300
+    assert len(service.send_completion_notifications([("alice@exemple.fr", "Rapport")]).sent) == 1
+    service.close()
+
+    assert len(smtp_server.messages) == 301
+    assert smtp_server.connections <= 3
+
+
+def test_transient_failures_retried(smtp_server):
+    """Réponses 4xx et coupures sont retentées sur une nouvelle connexion"""
+    smtp_server.failures.extend(["451 Reessayez plus tard", "drop"])
+    service = _service(smtp_server, pool_size=1)
+    result = service.send_reminders([("alice@exemple.fr", "Rapport", "2024-06-01")])
+    service.close()
+
+    assert result.ok and result.retries == 2
+    assert len(smtp_server.messages) == 1
+    assert smtp_server.connections == 3
+
+
+def test_permanent_and_exhausted_failures_reported(smtp_server):
+    """Refus définitifs, tentatives épuisées et adresses invalides sont consignés sans bloquer le lot"""
+    smtp_server.refused.add("inconnu@exemple.fr")
+    service = _service(smtp_server, pool_size=1, max_retries=2)
+    result = service.send_reminders([
+        ("inconnu@exemple.fr", "A", "2024-06-01"),
+        ("pasdemail", "B", "2024-06-01"),
+        ("alice@exemple.fr", "C", "2024-06-01"),
+    ])
+    assert result.sent == ["alice@exemple.fr"]
+    assert set(result.failed) == {"inconnu@exemple.fr", "pasdemail"}
+    assert result.retries == 0
+
+    smtp_server.failures.extend(["421 Service indisponible"] * 3)
+    result = service.send_reminders([("bob@exemple.fr", "D", "2024-06-01")])
+    service.close()
+    assert list(result.failed) == ["bob@exemple.fr"]
+    assert result.retries == 2
+
+
+def test_pool_waits_for_free_connection(smtp_server):
+    """Un pool plein fait attendre jusqu'à ce qu'une connexion soit rendue"""
+    pool = SMTPConnectionPool("127.0.0.1", smtp_server.server_address[1], size=1)
+    first = pool.acquire()
+    released = threading.Timer(0.1, pool.release, args=(first,))
+    released.start()
+    assert pool.acquire() is first
+    pool.release(first)
+    pool.close()
+    assert pool.connections_opened == 1
+    assert send_messages(pool, []).ok
@@ -0,0 +1,120 @@
+import base64
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Status, TaskManager, TaskPage
+
+
+def _tasks(count):
+    tasks = []
+    for i in range(count):
+        task = Task(f"Tâche {i}", status=Status.TODO if i % 3 else Status.COMPLETED)
+        # Dates de création en partie identiques : l'ID départage
+        task.created_at = f"2024-01-01T00:00:{i // 2:02d}"
+        tasks.append(task)
+    return tasks
+
+
+@pytest.fixture
+def initial_tasks():
+    return _tasks(25)
+
+
+def _walk(manager, **kwargs):
+    pages, cursor = [], None
+    while True:
+        page = manager.get_tasks_page(cursor=cursor, **kwargs)
+        pages.append([task.id for task in page])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("order_by", ["created_at", "id"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_cover_sorted_order(manager, order_by, descending):
+    """Les pages successives couvrent toutes les tâches, dans l'ordre, sans doublon"""
+    expected = sorted(manager.get_all_tasks(), key=lambda t: (getattr(t, order_by), t.id), reverse=descending)
+    pages = _walk(manager, limit=10, order_by=order_by, descending=descending)
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [task_id for page in pages for task_id in page] == [t.id for t in expected]
+
+
+def test_filtered_pages(manager):
+    """Les filtres s'appliquent avant le découpage en pages"""
+    pages = _walk(manager, limit=4, status=Status.COMPLETED)
+    assert [len(page) for page in pages] == [4, 4, 1]
+    expected = [t.id for t in sorted(manager.get_tasks_by_status(Status.COMPLETED),
+                                     key=lambda t: (t.created_at, t.id))]
+    assert [task_id for page in pages for task_id in page] == expected
+
+
+def test_cursor_stable_under_concurrent_changes(manager):
+    """Ajouts et suppressions entre deux pages ne décalent pas la pagination"""
+    first = manager.get_tasks_page(limit=5)
+    ordered = sorted(manager.get_all_tasks(), key=lambda t: (t.created_at, t.id))
+    manager.delete_task(ordered[2].id)
+    manager.delete_task(ordered[5].id)
+    early = Task("Plus ancienne")
+    early.created_at = "2023-12-31T00:00:00"
+    manager.add_task(early)
+
+    second = manager.get_tasks_page(limit=5, cursor=first.next_cursor)
+    assert [t.id for t in second] == [t.id for t in ordered[6:11]]
+
+
+def test_iter_tasks_reads_lazily(tmp_path):
+    """iter_tasks ne lit que les pages consommées"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    manager.add_tasks(_tasks(25))
+    calls = []
+    original = manager.get_tasks_page
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    manager.get_tasks_page = counting
+    iterator = manager.iter_tasks(batch_size=4, status=Status.TODO)
+    first = [next(iterator) for _ in range(5)]
+    assert len(calls) == 2
+    assert all(t.status == Status.TODO for t in first)
+    assert len(first) + len(list(iterator)) == len(manager.get_tasks_by_status(Status.TODO))
+
+
+def test_invalid_page_arguments(manager):
+    """Ordres, tailles, curseurs et filtres invalides lèvent ValueError"""
+    with pytest.raises(ValueError):
+        manager.get_tasks_page(order_by="title")
+    with pytest.raises(ValueError):
+        manager.get_tasks_page(limit=0)
+    with pytest.raises(ValueError):
+        manager.get_tasks_page(cursor="pas-un-curseur")
+    cursor = manager.get_tasks_page(limit=3, order_by="id").next_cursor
+    with pytest.raises(ValueError):
+        manager.get_tasks_page(cursor=cursor, order_by="created_at")
+    with pytest.raises(ValueError):
+        manager.iter_tasks(couleur="bleu")
+    assert isinstance(manager.get_tasks_page(), TaskPage)
+
+
+@pytest.mark.parametrize("payload", [
+    ["created_at", False, 5, "x"],
+    ["created_at", False, "2024-01-01T00:00:00", None],
+    ["created_at", None, "2024-01-01T00:00:00", "x"],
+    ["created_at", 0, "2024-01-01T00:00:00", "x"],
+    [None, False, "2024-01-01T00:00:00", "x"],
+    ["title", False, "Tâche", "x"],
+    ["created_at", False, "2024-01-01T00:00:00"],
+    {"created_at": 1, "a": 2, "b": 3, "c": 4},
+    None,
+])
+def test_malformed_cursor_rejected(manager, payload):
+    """Un curseur bien encodé mais au contenu mal formé lève ValueError"""
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+    with pytest.raises(ValueError):
+        manager.get_tasks_page(cursor=cursor)
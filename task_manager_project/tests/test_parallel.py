@@ -0,0 +1,107 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager, ReportService
+from task_manager.parallel import ParallelScanner
+
+
+def _tasks(count):
+    statuses = list(Status)
+    priorities = list(Priority)
+    return [Task(f"Tâche {i}", priority=priorities[i % len(priorities)], status=statuses[i % len(statuses)],
+                 project=f"P{i % 3}", assignee=f"Personne {i % 4}" if i % 5 else None,
+                 due_date="2024-06-01T00:00:00" if i % 2 else None)
+            for i in range(count)]
+
+
+@pytest.fixture
+def scanner():
+    with ParallelScanner(workers=2, min_tasks=0, chunk_size=7) as pool_scanner:
+        yield pool_scanner
+
+
+def test_in_memory_scan_stays_in_process(scanner):
+    """Les tâches en mémoire sont parcourues directement, sans pool de processus"""
+    tasks = _tasks(100)
+    criteria = {'project': "P1", 'status': Status.TODO}
+    expected = [t for t in tasks if t.project == "P1" and t.status == Status.TODO]
+    assert scanner.filter(tasks, **criteria) == expected
+    assert scanner.filter(tasks, project="P1", status="todo") == expected
+    assert scanner.count_by(tasks, 'priority', project="P0") == \
+        {p.value: sum(1 for t in tasks if t.project == "P0" and t.priority == p) for p in Priority}
+    assert scanner._pool is None
+
+
+def test_lazy_store_scanned_by_file_ranges(scanner, tmp_path):
+    """Un store lazy est lu par plages dans des processus, modifications en mémoire comprises"""
+    storage_file = str(tmp_path / "tasks.json")
+    TaskManager(storage_file).add_tasks(_tasks(100))
+    manager = TaskManager(storage_file, lazy=True, autosave=False)
+    manager._scanner = scanner
+    ids = list(manager.tasks)
+    manager.update_task(ids[0], project="P1", status=Status.TODO)
+    manager.update_task(ids[1], project="P2")
+    manager.delete_task(ids[2])
+    manager.add_task(Task("Nouvelle", project="P1"))
+
+    reference = manager.get_all_tasks()
+    found = manager.find_tasks(project="P1", status=Status.TODO)
+    assert [t.id for t in found] == [t.id for t in reference if t.project == "P1" and t.status == Status.TODO]
+    assert ids[0] in {t.id for t in found}
+    counts = manager.count_tasks('project', priority=Priority.LOW)
+    assert counts == ParallelScanner(workers=1).count_by(reference, 'project', priority=Priority.LOW)
+    assert manager.count_tasks('status') == ParallelScanner(workers=1).count_by(reference, 'status')
+    assert scanner._pool is not None
+
+
+def test_small_store_stays_in_process(tmp_path):
+    """En dessous du seuil, aucun pool de processus n'est créé"""
+    storage_file = str(tmp_path / "tasks.json")
+    TaskManager(storage_file).add_tasks(_tasks(50))
+    manager = TaskManager(storage_file, lazy=True, scan_workers=4, parallel_threshold=1000)
+    assert len(manager.find_tasks(project="P2")) == 16
+    assert manager._scanner._pool is None
+
+
+def test_unknown_field_rejected(scanner):
+    """Un champ inconnu lève ValueError"""
+    with pytest.raises(ValueError):
+        scanner.filter(_tasks(3), couleur="bleu")
+    with pytest.raises(ValueError):
+        scanner.count_by(_tasks(3), 'couleur')
+
+
+def test_manager_find_and_count(tmp_path):
+    """find_tasks et count_tasks acceptent tout champ de tâche"""
+    manager = TaskManager(str(tmp_path / "tasks.json"), scan_workers=2, parallel_threshold=10)
+    tasks = _tasks(30)
+    manager.add_tasks(tasks)
+
+    due = manager.find_tasks(due_date="2024-06-01T00:00:00", priority=Priority.LOW)
+    assert [t.id for t in due] == [t.id for t in tasks if t.due_date and t.priority == Priority.LOW]
+    assert manager.count_tasks('status') == {status.value: 6 for status in Status}
+    assert manager.count_tasks('due_date', project="P0") == {None: 5, "2024-06-01T00:00:00": 5}
+    manager.close()
+
+
+def test_daily_report_of_lazy_store_by_file_ranges(tmp_path):
+    """Le rapport d'un gestionnaire lazy est calculé par plages dans le pool, comme le rapport séquentiel"""
+    storage_file = str(tmp_path / "tasks.json")
+    tasks = _tasks(40)
+    TaskManager(storage_file).add_tasks(tasks)
+    manager = TaskManager(storage_file, lazy=True, scan_workers=2, parallel_threshold=10)
+    manager.update_task(tasks[0].id, priority=Priority.URGENT, assignee="Personne 9")
+    manager.delete_task(tasks[1].id)
+    manager.add_task(Task("Nouvelle", status=Status.COMPLETED))
+    today = date.today().isoformat()
+
+    report = ReportService().generate_daily_report(manager, today)
+    assert manager._scanner._pool is not None
+    assert report == ReportService().generate_daily_report(list(manager.get_all_tasks()), today)
+    assert report['total'] == 40
+    assert report['by_assignee']["Personne 9"] == 1
+    manager.close()
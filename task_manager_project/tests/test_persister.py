@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Status, TaskManager
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    return str(tmp_path / "tasks.json")
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_background_persister_coalesces_bursts(storage_file):
+    """Une rafale de mutations est persistée en une écriture par intervalle"""
+    manager = TaskManager(storage_file, flush_interval=0.2)
+    with patch.object(manager, '_save_to_file', wraps=manager._save_to_file) as save:
+        for i in range(100):
+            manager.add_task(Task(f"Tâche {i}"))
+        assert save.call_count == 0
+        assert wait_for(lambda: manager.pending_changes == 0)
+        assert save.call_count == 1
+    manager.close()
+
+    with open(storage_file, encoding='utf-8') as f:
+        assert len(json.load(f)) == 100
+
+
+def test_background_persister_flushes_after_max_pending(storage_file):
+    """Le seuil de mutations déclenche une écriture sans attendre l'intervalle"""
+    manager = TaskManager(storage_file, flush_interval=60, flush_after=5)
+    for i in range(5):
+        manager.add_task(Task(f"Tâche {i}"))
+    assert wait_for(lambda: os.path.exists(storage_file))
+    manager.close()
+    assert len(TaskManager(storage_file)) == 5
+
+
+def test_max_pending_counts_every_change(storage_file):
+    """Les modifications répétées d'une même tâche comptent chacune pour le seuil"""
+    manager = TaskManager(storage_file, flush_interval=60, flush_after=5)
+    task = Task("Tâche")
+    manager.add_task(task)
+    for i in range(4):
+        manager.update_task(task.id, title=f"Version {i}")
+    assert wait_for(lambda: manager.pending_changes == 0)
+    manager.close()
+    assert TaskManager(storage_file).get_task(task.id).title == "Version 3"
+
+
+def test_close_stops_thread_and_flushes(storage_file):
+    """close() arrête le thread et écrit les mutations restantes"""
+    manager = TaskManager(storage_file, flush_interval=60)
+    task = Task("Tâche")
+    manager.add_task(task)
+    manager.update_task(task.id, status=Status.COMPLETED)
+    manager.close()
+
+    assert not manager._persister.running
+    assert TaskManager(storage_file).get_task(task.id).status == Status.COMPLETED
+
+
+def test_explicit_flush(storage_file):
+    """flush() persiste immédiatement sans attendre le thread"""
+    manager = TaskManager(storage_file, flush_interval=60)
+    manager.add_task(Task("Tâche"))
+    manager.flush()
+    assert len(TaskManager(storage_file)) == 1
+    manager.close()
+
+
+def test_persister_registered_at_exit(storage_file):
+    """Une écriture finale est enregistrée pour la sortie de l'interpréteur"""
+    with patch('task_manager.persister.atexit') as mock_atexit:
+        manager = TaskManager(storage_file, flush_interval=60)
+        mock_atexit.register.assert_called_once_with(manager._persister.stop)
+        manager.close()
+        mock_atexit.unregister.assert_called_with(manager._persister.stop)
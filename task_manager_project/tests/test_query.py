@@ -0,0 +1,126 @@
+import os
+import random
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager, Q
+from task_manager.query import Condition, paginate, plan_query
+
+
+def _tasks(count, seed=7):
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(count):
+        task = Task(f"Tâche {i}", priority=rng.choice(list(Priority)), status=rng.choice(list(Status)),
+                    project=rng.choice(["Alpha", "Bêta", "Gamma", None]),
+                    assignee=rng.choice(["Alice", "Bob", "Chloé", None]),
+                    due_date=rng.choice([None, f"2024-0{rng.randint(1, 9)}-15T12:00:00"]))
+        task.created_at = f"2024-01-{rng.randint(10, 28)}T08:00:00"
+        tasks.append(task)
+    tasks.append(Task("Rare", project="Rare", status=Status.TODO))
+    return tasks
+
+
+@pytest.fixture
+def initial_tasks():
+    return _tasks(200)
+
+
+def test_combined_filters_match_brute_force(manager):
+    """Conjonctions, disjonctions et intervalles donnent le même résultat qu'un parcours"""
+    everything = manager.get_all_tasks()
+    cases = [
+        (Q(status=Status.TODO, project="Alpha"),
+         lambda t: t.status == Status.TODO and t.project == "Alpha"),
+        (Q(assignee="Alice") | Q(priority__gte=Priority.HIGH),
+         lambda t: t.assignee == "Alice" or t.priority in (Priority.HIGH, Priority.URGENT)),
+        (Q(project__in=["Alpha", "Bêta"]) & Q(status__ne=Status.COMPLETED),
+         lambda t: t.project in ("Alpha", "Bêta") and t.status != Status.COMPLETED),
+        (Q(due_date__gte="2024-03-01", due_date__lt=datetime(2024, 6, 1)),
+         lambda t: t.due_date is not None and "2024-03-01" <= t.due_date < "2024-06-01"),
+        (Q(created_at__lte="2024-01-15T23:59:59", assignee=None),
+         lambda t: t.created_at <= "2024-01-15T23:59:59" and t.assignee is None),
+    ]
+    for condition, predicate in cases:
+        expected = {t.id for t in everything if predicate(t)}
+        assert {t.id for t in manager.query(condition)} == expected
+
+
+def test_keyword_filters_and_where_combined(manager):
+    """Les arguments nommés s'ajoutent en conjonction à la condition where"""
+    result = manager.query(Q(status=Status.TODO) | Q(status=Status.REVIEW), project="Rare")
+    assert [t.title for t in result] == ["Rare"]
+    assert [t.title for t in manager.query(project="Rare", status="todo")] == ["Rare"]
+
+
+def test_order_limit_offset(manager):
+    """Tri multi-champs, limite et décalage correspondent à un tri complet découpé"""
+    everything = manager.get_all_tasks()
+    ranks = {priority: rank for rank, priority in enumerate(Priority)}
+    expected = sorted(everything, key=lambda t: (t.due_date is None, t.due_date or ""))
+    expected = sorted(expected, key=lambda t: -ranks[t.priority])
+    page = manager.query(order_by=["-priority", "due_date"], limit=10, offset=5)
+    assert [t.id for t in page] == [t.id for t in expected[5:15]]
+
+    all_sorted = manager.query(order_by="created_at")
+    assert [t.created_at for t in all_sorted] == sorted(t.created_at for t in everything)
+
+
+def test_planner_picks_most_selective_index(tmp_path):
+    """Le planificateur part de l'index le plus petit et intersecte les autres"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    manager.add_tasks(_tasks(200))
+
+    plan = plan_query(Q(status=Status.TODO, project="Rare"), manager._index)
+    assert plan.driver == "index:project"
+    assert plan.estimated == 1
+    assert len(plan.filters) == 1
+
+    assert plan_query(Q(project="Rare") | Q(assignee="Alice"), manager._index).driver == "union"
+    assert plan_query(Q(title="Rare"), manager._index).driver == "scan"
+
+
+def test_limit_without_order_stops_early():
+    """Sans tri, seules les premières tâches du flux sont lues"""
+    consumed = []
+
+    def stream():
+        for task in _tasks(50):
+            consumed.append(task)
+            yield task
+
+    assert len(paginate(stream(), limit=3, offset=2)) == 3
+    assert len(consumed) == 5
+
+
+def test_invalid_query(manager):
+    """Champs, opérateurs et valeurs invalides lèvent ValueError"""
+    with pytest.raises(ValueError):
+        manager.query(couleur="bleu")
+    with pytest.raises(ValueError):
+        manager.query(status__environ=Status.TODO)
+    with pytest.raises(ValueError):
+        manager.query(status="inconnu")
+    with pytest.raises(ValueError):
+        manager.query(limit=-1)
+
+
+def test_in_lookup_requires_a_collection(manager):
+    """Une chaîne ou une valeur non itérable pour __in lève TypeError"""
+    with pytest.raises(TypeError):
+        manager.query(project__in="AB")
+    with pytest.raises(TypeError):
+        Q(priority__in=Priority.HIGH)
+    assert manager.query(project__in=("AB",)) == []
+
+
+def test_condition_requires_matches():
+    """Une condition sans matches ne peut pas être instanciée"""
+    class Incomplete(Condition):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
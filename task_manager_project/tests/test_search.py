@@ -0,0 +1,124 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, TaskManager
+from task_manager.search import SearchIndex, tokenize
+
+
+def _tasks():
+    return [
+        Task("Réviser la documentation de l'API", description="Relire chaque exemple"),
+        Task("Corriger le bug d'export", description="La documentation de l'export est fausse"),
+        Task("Préparer la réunion", description="Ordre du jour et compte rendu"),
+        Task("Documenter le déploiement", description="Étapes de mise en production"),
+    ]
+
+
+@pytest.fixture
+def initial_tasks():
+    return _tasks()
+
+
+def test_tokenize_ignores_accents_and_case():
+    """Les accents et la casse sont ignorés, les élisions séparées"""
+    assert tokenize("Étape RÉVISÉE de l'API") == ["etape", "revisee", "de", "l", "api"]
+    assert tokenize(None) == []
+
+
+def test_term_prefix_and_phrase_queries():
+    """Termes, préfixes et phrases se combinent en conjonction"""
+    index = SearchIndex()
+    tasks = _tasks()
+    for task in tasks:
+        index.add(task)
+    ids = [task.id for task in tasks]
+
+    assert {task_id for task_id, _ in index.search("documentation")} == {ids[0], ids[1]}
+    assert {task_id for task_id, _ in index.search("docum*")} == {ids[0], ids[1], ids[3]}
+    assert [task_id for task_id, _ in index.search('"documentation de l\'api"')] == [ids[0]]
+    assert index.search('"api documentation"') == []
+    assert [task_id for task_id, _ in index.search("REUNION compte")] == [ids[2]]
+    assert index.search("documentation réunion") == []
+    assert index.search("  ") == []
+
+
+def test_title_matches_rank_first():
+    """Un mot du titre pèse plus qu'un mot de la description"""
+    index = SearchIndex()
+    tasks = _tasks()
+    for task in tasks:
+        index.add(task)
+    ranked = [task_id for task_id, _ in index.search("documentation")]
+    assert ranked == [tasks[0].id, tasks[1].id]
+    assert len(index.search("documentation", limit=1)) == 1
+
+
+def test_clauses_intersected_before_scoring():
+    """Une clause rare restreint les tâches évaluées ; un préfixe couvre au plus max_expansions termes"""
+    index = SearchIndex(max_expansions=2)
+    tasks = [Task(f"Serveur client {i}", description="bug" if i == 7 else "") for i in range(50)]
+    tasks.extend([Task("Alpha"), Task("Alpine"), Task("Alpiniste")])
+    for task in tasks:
+        index.add(task)
+
+    assert [task_id for task_id, _ in index.search("serveur client bug")] == [tasks[7].id]
+    assert [task_id for task_id, _ in index.search("bug serv*")] == [tasks[7].id]
+    # Vocabulaire trié : alpha et alpine sont couverts, pas alpiniste
+    assert {task_id for task_id, _ in index.search("alp*")} == {tasks[-3].id, tasks[-2].id}
+    assert {task_id for task_id, _ in index.search("alpin*")} == {tasks[-2].id, tasks[-1].id}
+
+
+def test_phrase_does_not_span_title_and_description():
+    """Une phrase ne chevauche pas la fin du titre et le début de la description"""
+    index = SearchIndex()
+    index.add(Task("Écrire le rapport", description="annuel"))
+    assert index.search('"rapport annuel"') == []
+
+
+def test_incremental_updates(manager):
+    """L'index suit les ajouts, modifications et suppressions"""
+    assert [t.title for t in manager.search("réunion")] == ["Préparer la réunion"]
+    meeting = manager.search("réunion")[0]
+
+    manager.update_task(meeting.id, title="Planifier le séminaire")
+    assert manager.search("réunion") == []
+    assert [t.id for t in manager.search("seminaire")] == [meeting.id]
+
+    added = Task("Séminaire d'équipe")
+    manager.add_task(added)
+    assert {t.id for t in manager.search("sémin*")} == {meeting.id, added.id}
+
+    manager.delete_task(meeting.id)
+    assert [t.id for t in manager.search("seminaire")] == [added.id]
+    manager.clear_all_tasks()
+    assert manager.search("seminaire") == []
+
+
+def test_batch_rollback_restores_index(tmp_path):
+    """Une annulation de lot restaure aussi l'index plein texte"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    manager.add_tasks(_tasks())
+    assert len(manager.search("documentation")) == 2
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.add_task(Task("Documentation interne"))
+            raise RuntimeError("échec")
+    assert len(manager.search("documentation")) == 2
+
+
+def test_reload_rebuilds_index(tmp_path):
+    """Un rechargement du stockage réindexe les tâches chargées"""
+    source = TaskManager(str(tmp_path / "source.json"))
+    source.add_task(Task("Migration de la base"))
+
+    for manager in (TaskManager(str(tmp_path / "tasks.json")),
+                    TaskManager(str(tmp_path / "tasks.db"), backend="sqlite")):
+        manager.add_tasks(_tasks())
+        assert manager.search("migration") == []
+        manager.load_from_file(source.storage_file)
+        assert [t.title for t in manager.search("migration")] == ["Migration de la base"]
+        assert manager.search("documentation") == []
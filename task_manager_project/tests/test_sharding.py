@@ -0,0 +1,181 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, ShardedTaskManager, TaskManager
+
+
+@pytest.fixture
+def storage_dir(tmp_path):
+    return str(tmp_path / "shards")
+
+
+def _populate(manager):
+    tasks = [
+        Task("Alpha 1", priority=Priority.HIGH, project="Alpha", assignee="Alice"),
+        Task("Alpha 2", project="Alpha", assignee="Bob"),
+        Task("Bêta 1", priority=Priority.HIGH, project="Bêta/Web", assignee="Alice"),
+        Task("Sans projet"),
+    ]
+    manager.add_tasks(tasks)
+    return tasks
+
+
+def test_one_file_per_project(storage_dir):
+    """Chaque projet est stocké dans son propre fichier, même si les noms ne diffèrent que par la casse"""
+    manager = ShardedTaskManager(storage_dir)
+    _populate(manager)
+    manager.add_task(Task("alpha 1", project="alpha"))
+
+    alpha = ShardedTaskManager.shard_key_for_project("Alpha")
+    lower_alpha = ShardedTaskManager.shard_key_for_project("alpha")
+    beta = ShardedTaskManager.shard_key_for_project("Bêta/Web")
+    assert alpha.lower() != lower_alpha.lower()
+    assert sorted(os.listdir(storage_dir)) == sorted(["manifest.json", "no-project.json", alpha + ".json",
+                                                      lower_alpha + ".json", beta + ".json"])
+    assert manager.shard_sizes() == {alpha: 2, beta: 1, "no-project": 1, lower_alpha: 1}
+    assert [t.title for t in manager.get_tasks_by_project("alpha")] == ["alpha 1"]
+
+
+def test_long_project_names_fit_in_a_file_name(storage_dir):
+    """Un nom de projet long et non ASCII donne un nom de fichier court, distinct par projet"""
+    manager = ShardedTaskManager(storage_dir)
+    first, second = "é" * 60, "é" * 60 + "x"
+    manager.add_tasks([Task("Première", project=first), Task("Seconde", project=second)])
+
+    first_key = ShardedTaskManager.shard_key_for_project(first)
+    second_key = ShardedTaskManager.shard_key_for_project(second)
+    assert first_key != second_key
+    assert len(first_key) < 220
+    assert max(len(name) for name in os.listdir(storage_dir)) < 255
+    assert [t.title for t in manager.get_tasks_by_project(second)] == ["Seconde"]
+    assert [t.title for t in ShardedTaskManager(storage_dir).get_tasks_by_project(first)] == ["Première"]
+
+
+def test_mutation_rewrites_only_its_shard(storage_dir):
+    """Modifier une tâche ne réécrit que le fichier de son projet"""
+    manager = ShardedTaskManager(storage_dir)
+    tasks = _populate(manager)
+    beta = manager.shards[ShardedTaskManager.shard_key_for_project("Bêta/Web")]
+
+    with patch.object(beta, '_save_to_file') as save:
+        manager.update_task(tasks[0].id, status=Status.COMPLETED)
+        manager.add_task(Task("Alpha 3", project="Alpha"))
+        save.assert_not_called()
+
+
+def test_queries_fan_out_and_merge(storage_dir):
+    """Les requêtes transversales fusionnent les résultats des shards"""
+    manager = ShardedTaskManager(storage_dir)
+    tasks = _populate(manager)
+
+    assert {t.id for t in manager.get_tasks_by_assignee("Alice")} == {tasks[0].id, tasks[2].id}
+    assert {t.id for t in manager.get_tasks_by_priority(Priority.HIGH)} == {tasks[0].id, tasks[2].id}
+    assert [t.id for t in manager.get_tasks_by_project("Alpha")] == [tasks[0].id, tasks[1].id]
+    assert manager.get_tasks_by_project("Inconnu") == []
+
+    stats = manager.get_statistics()
+    assert stats['total_tasks'] == 4
+    assert stats['by_priority']['high'] == 2
+    assert stats['by_project'] == {"Alpha": 2, "Bêta/Web": 1}
+    assert stats['by_assignee'] == {"Alice": 2, "Bob": 1}
+
+
+def test_project_change_moves_task(storage_dir):
+    """Changer le projet d'une tâche la déplace dans le shard du nouveau projet"""
+    manager = ShardedTaskManager(storage_dir)
+    tasks = _populate(manager)
+
+    assert manager.update_task(tasks[1].id, project="Gamma", title="Déplacée")
+    assert manager.get_task(tasks[1].id).title == "Déplacée"
+    assert [t.id for t in manager.get_tasks_by_project("Gamma")] == [tasks[1].id]
+    assert [t.id for t in manager.get_tasks_by_project("Alpha")] == [tasks[0].id]
+
+    reopened = ShardedTaskManager(storage_dir)
+    assert reopened.get_task(tasks[1].id).project == "Gamma"
+    assert len(reopened) == 4
+
+
+def test_interrupted_project_change_leaves_one_copy(storage_dir):
+    """Un déplacement interrompu ne duplique pas la tâche, en mémoire comme au rechargement"""
+    manager = ShardedTaskManager(storage_dir)
+    tasks = _populate(manager)
+    alpha = manager.shards[ShardedTaskManager.shard_key_for_project("Alpha")]
+
+    with patch.object(alpha, 'delete_task', side_effect=IOError("disque plein")):
+        with pytest.raises(IOError):
+            manager.update_task(tasks[1].id, project="Gamma")
+    assert [t.id for t in manager.get_all_tasks()].count(tasks[1].id) == 1
+    assert manager.get_task(tasks[1].id).project == "Alpha"
+
+    # Crash entre l'ajout au nouveau shard et la suppression dans l'ancien
+    manager.update_task(tasks[1].id, project="Gamma", title="Déplacée")
+    stale = TaskManager(alpha.storage_file)
+    stale.add_task(Task.from_dict({**tasks[1].to_dict(), 'project': "Alpha", 'title': "Alpha 2",
+                                   'updated_at': "2000-01-01T00:00:00"}))
+
+    reopened = ShardedTaskManager(storage_dir)
+    assert len(reopened) == 4
+    assert reopened.get_task(tasks[1].id).title == "Déplacée"
+    assert [t.id for t in reopened.get_tasks_by_project("Alpha")] == [tasks[0].id]
+    assert len(ShardedTaskManager(storage_dir)) == 4
+
+
+def test_bulk_operations_and_duplicates(storage_dir):
+    """Les opérations groupées sont routées par shard et les doublons refusés"""
+    manager = ShardedTaskManager(storage_dir)
+    tasks = _populate(manager)
+
+    with pytest.raises(ValueError):
+        manager.add_task(tasks[0])
+    assert manager.update_tasks({tasks[0].id: {'status': Status.REVIEW}, "inconnue": {}}) == [True, False]
+    assert manager.delete_tasks([tasks[3].id, "inconnue", tasks[2].id]) == [True, False, True]
+    assert len(manager) == 2
+    assert manager.get_task(tasks[3].id) is None
+
+
+def test_hash_sharding(storage_dir):
+    """Avec la stratégie de hachage, les tâches sont réparties de façon stable"""
+    manager = ShardedTaskManager(storage_dir, shard_by="hash", num_shards=4)
+    tasks = [Task(f"Tâche {i}", project="Unique") for i in range(40)]
+    manager.add_tasks(tasks)
+
+    assert len(manager.shards) == 4
+    assert sum(manager.shard_sizes().values()) == 40
+    assert max(manager.shard_sizes().values()) < 40
+    assert len(manager.get_tasks_by_project("Unique")) == 40
+
+    with pytest.raises(ValueError):
+        manager.add_task(tasks[5])
+
+    reopened = ShardedTaskManager(storage_dir, shard_by="hash", num_shards=4)
+    assert all(reopened.get_task(task.id).title == task.title for task in tasks)
+
+
+def test_invalid_strategy(storage_dir):
+    """Une stratégie inconnue est refusée"""
+    with pytest.raises(ValueError):
+        ShardedTaskManager(storage_dir, shard_by="assignee")
+
+
+def test_shard_layout_recorded_and_checked(storage_dir):
+    """Rouvrir un dossier avec une autre stratégie ou un autre nombre de shards est refusé"""
+    manager = ShardedTaskManager(storage_dir, shard_by="hash", num_shards=4)
+    manager.add_tasks(Task(f"Tâche {i}") for i in range(20))
+    manager.close()
+
+    with pytest.raises(ValueError):
+        ShardedTaskManager(storage_dir, shard_by="hash", num_shards=8)
+    with pytest.raises(ValueError):
+        ShardedTaskManager(storage_dir, shard_by="project")
+    assert len(ShardedTaskManager(storage_dir, shard_by="hash", num_shards=4)) == 20
+
+    # Dossier sans manifeste : la répartition des tâches existantes est vérifiée
+    os.remove(os.path.join(storage_dir, "manifest.json"))
+    with pytest.raises(ValueError):
+        ShardedTaskManager(storage_dir, shard_by="hash", num_shards=8)
+    assert len(ShardedTaskManager(storage_dir, shard_by="hash", num_shards=4)) == 20
+    assert os.path.exists(os.path.join(storage_dir, "manifest.json"))
@@ -0,0 +1,116 @@
+import json
+import multiprocessing
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Status, TaskManager
+
+
+@pytest.fixture
+def storage_file(tmp_path):
+    return str(tmp_path / "tasks.json")
+
+
+def test_changes_visible_across_managers(storage_file):
+    """Chaque gestionnaire voit les mutations de l'autre sans rechargement explicite"""
+    api = TaskManager(storage_file, shared=True)
+    cron = TaskManager(storage_file, shared=True)
+
+    task = Task("Partagée")
+    api.add_task(task)
+    assert cron.get_task(task.id).title == "Partagée"
+
+    cron.update_task(task.id, status=Status.COMPLETED)
+    assert api.get_task(task.id).status == Status.COMPLETED
+    assert [t.id for t in api.get_tasks_by_status(Status.COMPLETED)] == [task.id]
+
+
+def test_no_lost_updates(storage_file):
+    """Des écritures alternées ne s'écrasent pas"""
+    first = TaskManager(storage_file, shared=True)
+    second = TaskManager(storage_file, shared=True)
+    for i in range(5):
+        first.add_task(Task(f"A{i}"))
+        second.add_task(Task(f"B{i}"))
+
+    with open(storage_file, encoding='utf-8') as f:
+        assert len(json.load(f)) == 10
+
+
+def test_reload_only_when_file_changed(storage_file):
+    """Le fichier n'est relu que s'il a changé depuis la dernière lecture"""
+    writer = TaskManager(storage_file, shared=True)
+    reader = TaskManager(storage_file, shared=True)
+    writer.add_task(Task("Initiale"))
+
+    with patch.object(reader, '_load_snapshot', wraps=reader._load_snapshot) as load:
+        assert len(reader) == 1
+        assert len(reader) == 1
+        reader.get_statistics()
+        assert load.call_count == 1
+
+        writer.add_task(Task("Nouvelle"))
+        assert len(reader) == 2
+        assert load.call_count == 2
+
+
+def test_journal_changes_merged_incrementally(storage_file):
+    """En mode journal, seules les nouvelles entrées des autres processus sont rejouées"""
+    writer = TaskManager(storage_file, shared=True, journal=True)
+    reader = TaskManager(storage_file, shared=True, journal=True)
+    task = Task("Journalisée")
+    writer.add_task(task)
+
+    with patch.object(reader, '_load_snapshot') as load:
+        assert reader.get_task(task.id).title == "Journalisée"
+        writer.delete_task(task.id)
+        assert reader.get_task(task.id) is None
+        load.assert_not_called()
+
+
+def test_pending_changes_survive_refresh(storage_file):
+    """Les mutations locales non persistées sont conservées lors d'un rechargement"""
+    writer = TaskManager(storage_file, shared=True)
+    deferred = TaskManager(storage_file, shared=True, autosave=False)
+
+    local = Task("Locale")
+    deferred.add_task(local)
+    remote = Task("Distante")
+    writer.add_task(remote)
+
+    assert {t.id for t in deferred.get_all_tasks()} == {local.id, remote.id}
+    deferred.flush()
+    assert {t.id for t in writer.get_all_tasks()} == {local.id, remote.id}
+
+
+def test_shared_requires_json_backend(tmp_path):
+    """Le mode partagé ne s'applique pas au backend SQLite"""
+    with pytest.raises(ValueError):
+        TaskManager(str(tmp_path / "tasks.db"), backend="sqlite", shared=True)
+
+
+def _add_tasks_in_process(storage_file, prefix, count):
+    manager = TaskManager(storage_file, shared=True, journal=True, compact_threshold=7)
+    for i in range(count):
+        manager.add_task(Task(f"{prefix}-{i}"))
+    manager.close()
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="fork indisponible")
+def test_concurrent_processes(storage_file):
+    """Plusieurs processus écrivant en parallèle ne perdent aucune tâche"""
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=_add_tasks_in_process, args=(storage_file, f"p{n}", 20))
+                 for n in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    manager = TaskManager(storage_file, journal=True)
+    assert len(manager) == 80
@@ -0,0 +1,125 @@
+import copy
+import csv
+import os
+import sys
+import threading
+import time
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager, ReportService
+
+
+@pytest.fixture
+def initial_tasks():
+    return [Task(f"Tâche {i}", assignee="Alice" if i % 2 else "Bob") for i in range(20)]
+
+
+def test_snapshot_ignores_later_writes(manager):
+    """Ajouts, mises à jour et suppressions postérieurs n'affectent pas l'instantané"""
+    snapshot = manager.snapshot()
+    first, second = snapshot.get_all_tasks()[:2]
+
+    manager.update_task(first.id, status=Status.COMPLETED, title="Renommée")
+    manager.delete_task(second.id)
+    manager.add_task(Task("Nouvelle"))
+
+    assert len(snapshot) == 20
+    assert snapshot.get_task(first.id).status == Status.TODO
+    assert snapshot.get_task(first.id).title == "Tâche 0"
+    assert second.id in snapshot
+    assert snapshot.get_tasks_by_status(Status.COMPLETED) == []
+    assert manager.get_task(first.id).status == Status.COMPLETED
+    assert len(manager.snapshot()) == 20
+
+
+def test_update_in_place_snapshot_keeps_copies(tmp_path):
+    """Les mises à jour modifient la tâche en place ; l'instantané garde l'état antérieur"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    task = Task("Partagée")
+    manager.add_task(task)
+    snapshot = manager.snapshot()
+
+    manager.update_task(task.id, priority=Priority.URGENT)
+    assert manager.get_task(task.id) is task
+    assert task.priority == Priority.URGENT
+    assert snapshot.get_task(task.id) is not task
+    assert snapshot.get_task(task.id).priority == Priority.MEDIUM
+
+
+def test_snapshot_copies_each_task_at_most_once(tmp_path, monkeypatch):
+    """Seules les tâches modifiées ou lues sont copiées, une seule fois chacune"""
+    manager = TaskManager(str(tmp_path / "tasks.json"), autosave=False)
+    tasks = [Task(f"Tâche {i}") for i in range(100)]
+    manager.add_tasks(tasks)
+    # Seules les copies dues aux instantanés sont comptées, pas celles des événements
+    monkeypatch.setattr(manager, '_emit', lambda *args: None)
+    copies = []
+    original_copy = copy.copy
+    monkeypatch.setattr(copy, 'copy', lambda task: copies.append(task.id) or original_copy(task))
+
+    snapshot = manager.snapshot()
+    assert copies == []
+    manager.update_task(tasks[0].id, title="Première")
+    manager.update_task(tasks[0].id, title="Seconde")
+    assert copies == [tasks[0].id]
+
+    held = snapshot.get_task(tasks[1].id)
+    manager.update_task(tasks[1].id, status=Status.COMPLETED)
+    assert held.status == Status.TODO
+    assert snapshot.get_task(tasks[1].id) is held
+    assert copies == [tasks[0].id, tasks[1].id]
+
+    # Les instantanés relâchés ne coûtent plus de copie
+    del snapshot, held
+    manager.update_task(tasks[2].id, title="Sans instantané")
+    assert len(copies) == 2
+
+
+def test_batch_rollback_restores_original_objects(tmp_path):
+    """L'annulation d'un lot remet en place les objets d'origine"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    task = Task("Originale")
+    manager.add_task(task)
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.update_task(task.id, title="Modifiée")
+            raise RuntimeError("échec")
+    assert manager.get_task(task.id) is task
+    assert task.title == "Originale"
+
+
+def test_reports_consistent_under_concurrent_updates(tmp_path):
+    """Rapport et export lus depuis un gestionnaire restent cohérents malgré les écritures"""
+    manager = TaskManager(str(tmp_path / "tasks.json"), autosave=False)
+    manager.add_tasks(Task(f"Tâche {i}") for i in range(2000))
+    ids = [task.id for task in manager.get_all_tasks()]
+    group = ids[::7]
+
+    def writer():
+        for _ in range(20):
+            for status in (Status.COMPLETED, Status.TODO):
+                with manager.batch():
+                    for task_id in group:
+                        manager.update_task(task_id, status=status)
+                time.sleep(0.001)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    service = ReportService()
+    reports = []
+    while thread.is_alive():
+        reports.append(service.generate_daily_report(manager, date.today().isoformat()))
+    csv_file = tmp_path / "export.csv"
+    service.export_tasks_csv(manager, str(csv_file))
+    thread.join()
+
+    # Le groupe change de statut en un lot : une vue cohérente le voit
+    # entièrement dans un statut ou dans l'autre
+    for report in reports:
+        assert report['total'] == 2000
+        assert report['completed'] in (0, len(group))
+    with open(csv_file, encoding='utf-8') as f:
+        assert len(list(csv.reader(f))) == 2001
@@ -0,0 +1,153 @@
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, Priority, Status, TaskManager
+from task_manager.storage import SQLiteTaskStore, TaskStore
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    return str(tmp_path / "tasks.db")
+
+
+@pytest.fixture
+def manager(db_file):
+    manager = TaskManager(db_file, backend="sqlite")
+    yield manager
+    manager.close()
+
+
+def test_sqlite_store_mapping(db_file):
+    """Le store se comporte comme un dictionnaire ID -> Task"""
+    store = SQLiteTaskStore(db_file)
+    task = Task("Tâche", priority=Priority.HIGH, project="Projet A")
+    store[task.id] = task
+    assert task.id in store
+    assert len(store) == 1
+    assert store[task.id].to_dict() == task.to_dict()
+
+    task.title = "Modifiée"
+    store[task.id] = task
+    assert len(store) == 1
+    assert store[task.id].title == "Modifiée"
+
+    del store[task.id]
+    assert task.id not in store
+    with pytest.raises(KeyError):
+        store[task.id]
+    store.close()
+
+
+def test_sqlite_store_uses_indexes(db_file):
+    """Les filtres s'appuient sur les index SQL"""
+    store = SQLiteTaskStore(db_file)
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM tasks WHERE status = ?", ('todo',)
+    ).fetchall()
+    assert any('idx_tasks_status' in str(row) for row in plan)
+    store.close()
+
+
+def test_sqlite_manager_crud_and_filters(manager, db_file):
+    """Les opérations du gestionnaire fonctionnent avec le backend SQLite"""
+    task1 = Task("Tâche 1", priority=Priority.HIGH, status=Status.TODO, assignee="Alice", project="Projet A")
+    task2 = Task("Tâche 2", priority=Priority.LOW, status=Status.TODO, assignee="Bob")
+    manager.add_task(task1)
+    manager.add_task(task2)
+    with pytest.raises(ValueError):
+        manager.add_task(task1)
+
+    manager.update_task(task2.id, status=Status.COMPLETED, assignee="Alice")
+    assert [t.id for t in manager.get_tasks_by_status(Status.TODO)] == [task1.id]
+    assert [t.id for t in manager.get_tasks_by_assignee("Alice")] == [task1.id, task2.id]
+    assert [t.id for t in manager.get_tasks_by_priority(Priority.LOW)] == [task2.id]
+    assert [t.id for t in manager.get_tasks_by_project("Projet A")] == [task1.id]
+
+    stats = manager.get_statistics()
+    assert stats['total_tasks'] == 2
+    assert stats['by_status']['completed'] == 1
+    assert stats['by_priority'] == {'low': 1, 'medium': 0, 'high': 1, 'urgent': 0}
+    assert stats['by_project'] == {'Projet A': 1}
+    assert stats['by_assignee'] == {'Alice': 2}
+
+    assert manager.delete_task(task1.id)
+    assert not manager.delete_task(task1.id)
+
+    # Les écritures sont validées : une autre connexion les voit
+    other = TaskManager(db_file, backend="sqlite")
+    assert [t.title for t in other.get_all_tasks()] == ["Tâche 2"]
+    assert other.get_task(task2.id).status == Status.COMPLETED
+    other.close()
+
+
+def test_sqlite_batch_rollback(manager, db_file):
+    """Un lot annulé ne laisse aucune écriture dans la base"""
+    kept = Task("Conservée")
+    manager.add_task(kept)
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.add_task(Task("Annulée"))
+            manager.update_task(kept.id, title="Modifiée")
+            raise RuntimeError("échec")
+
+    assert [t.title for t in manager.get_all_tasks()] == ["Conservée"]
+    conn = sqlite3.connect(db_file)
+    assert conn.execute("SELECT title FROM tasks").fetchall() == [("Conservée",)]
+    conn.close()
+
+
+def test_sqlite_import_export_json(manager, tmp_path):
+    """Le format JSON reste disponible pour l'import et l'export"""
+    json_file = str(tmp_path / "export.json")
+    task = Task("Exportée", project="Projet A")
+    manager.add_task(task)
+    manager.save_to_file(json_file)
+    with open(json_file, encoding='utf-8') as f:
+        assert json.load(f) == [task.to_dict()]
+
+    manager.clear_all_tasks()
+    assert len(manager) == 0
+    manager.load_from_file(json_file)
+    assert manager.get_task(task.id).to_dict() == task.to_dict()
+    assert manager.get_statistics()['by_project'] == {'Projet A': 1}
+
+
+def test_invalid_backend_options(db_file):
+    """Les combinaisons d'options invalides sont refusées"""
+    with pytest.raises(ValueError):
+        TaskManager(db_file, backend="mongodb")
+    with pytest.raises(ValueError):
+        TaskManager(db_file, backend="sqlite", journal=True)
+
+
+def test_incomplete_backend_cannot_be_instantiated():
+    """Un backend qui n'implémente pas toute l'interface est refusé dès sa création"""
+    class DictStore(TaskStore):
+        def __init__(self):
+            self._tasks = {}
+
+        def __getitem__(self, task_id):
+            return self._tasks[task_id]
+
+        def __setitem__(self, task_id, task):
+            self._tasks[task_id] = task
+
+        def __delitem__(self, task_id):
+            del self._tasks[task_id]
+
+        def __iter__(self):
+            return iter(self._tasks)
+
+        def __len__(self):
+            return len(self._tasks)
+
+        def select(self, field, value):
+            return [task for task in self.values() if getattr(task, field) == value]
+
+    with pytest.raises(TypeError, match="commit"):
+        DictStore()
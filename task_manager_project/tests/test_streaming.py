@@ -0,0 +1,78 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from task_manager import Task, TaskManager
+from task_manager.streaming import iter_json_array
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 65536])
+def test_iter_json_array_matches_json_load(chunk_size):
+    """Le résultat est identique à json.load quelle que soit la taille des blocs"""
+    data = [
+        {'id': 'a', 'title': 'Réviser la documentation API', 'tags': [1, 2.5, None]},
+        12345,
+        "texte, avec ] et [",
+        [],
+        {},
+    ]
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    assert list(iter_json_array(io.StringIO(text), chunk_size=chunk_size)) == data
+
+
+def test_iter_json_array_empty():
+    """Un tableau vide ne produit aucun élément"""
+    assert list(iter_json_array(io.StringIO("  [ ]  "), chunk_size=2)) == []
+
+
+@pytest.mark.parametrize("text", [
+    '{"invalid": json}',
+    '[{"a": 1} {"b": 2}]',
+    '[{"a": 1},',
+    '[{"a": tru',
+    '[1] 2',
+    '',
+])
+def test_iter_json_array_invalid(text):
+    """Un contenu invalide lève JSONDecodeError"""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO(text), chunk_size=4))
+
+
+def test_iter_json_array_is_lazy():
+    """Les éléments sont produits avant la lecture complète du fichier"""
+    f = io.StringIO('[{"id": 1}, {"id": 2}, ' + ' ' * 100000 + '{"id": 3}]')
+    items = iter_json_array(f, chunk_size=64)
+    assert next(items) == {'id': 1}
+    assert f.tell() < 1000
+
+
+def test_load_reports_invalid_tasks_without_print(tmp_path, capsys):
+    """Les tâches invalides sont consignées dans load_errors, pas affichées"""
+    path = str(tmp_path / "tasks.json")
+    valid = Task("Valide").to_dict()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([valid, {'id': 'x', 'title': 'Invalide', 'priority': 'nope', 'status': 'todo'}, "pas un dict"], f)
+
+    manager = TaskManager(path)
+    assert [t.id for t in manager.get_all_tasks()] == [valid['id']]
+    assert len(manager.load_errors) == 2
+    assert capsys.readouterr().out == ''
+
+
+def test_failed_load_keeps_current_tasks(tmp_path):
+    """Un fichier corrompu ne vide pas les tâches déjà chargées"""
+    manager = TaskManager(str(tmp_path / "tasks.json"))
+    task = Task("Tâche")
+    manager.add_task(task)
+    corrupted = str(tmp_path / "corrupted.json")
+    with open(corrupted, 'w', encoding='utf-8') as f:
+        f.write('[' + json.dumps(Task("Autre").to_dict()) + ', {"broken": ')
+
+    with pytest.raises(ValueError):
+        manager.load_from_file(corrupted)
+    assert manager.get_all_tasks() == [task]
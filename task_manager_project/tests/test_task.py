@@ -5,6 +5,7 @@ Script de test pour vérifier le fonctionnement des classes Task, Priority et St
 
 import sys
 import os
+from unittest.mock import patch
 
 # Ajouter le dossier src au path pour pouvoir importer les modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -180,6 +181,64 @@ def test_task_with_none_values():
     print()
 
 
+def test_task_slots():
+    """Test de la représentation compacte (__slots__ et chaînes internées)"""
+    print("=== Test de la représentation compacte ===")
+    
+    task = Task("Tâche", project="".join(["Projet", " A"]), assignee="".join(["Ali", "ce"]))
+    other = Task("Autre", project="Projet A", assignee="Alice")
+    
+    # Pas de __dict__ par instance, attributs inconnus refusés
+    assert not hasattr(task, '__dict__')
+    try:
+        task.invalid_attr = "valeur"
+        assert False, "AttributeError attendue"
+    except AttributeError:
+        pass
+    
+    # Les valeurs répétées partagent une seule chaîne
+    assert task.project is other.project
+    assert task.assignee is other.assignee
+    
+    # Le contrat de sérialisation est inchangé
+    task.assign_to_project("".join(["Projet", " B"]))
+    assert task.project is Task("X", project="Projet B").project
+    assert Task.from_dict(task.to_dict()).to_dict() == task.to_dict()
+    print("✅ Représentation compacte fonctionne")
+    print()
+
+
+def test_from_dict_fast_path():
+    """Test de la désérialisation directe (sans uuid ni horloge)"""
+    print("=== Test de from_dict ===")
+    
+    data = Task("Tâche", priority=Priority.URGENT, status=Status.REVIEW, project="Projet A").to_dict()
+    
+    with patch('task_manager.task.uuid.uuid4') as uuid4, patch('task_manager.task.datetime') as clock:
+        task = Task.from_dict(data)
+        assert not uuid4.called
+        assert not clock.now.called
+    
+    assert task.to_dict() == data
+    assert task.priority is Priority.URGENT
+    assert task.status is Status.REVIEW
+    
+    # Les valeurs invalides ou manquantes lèvent toujours les mêmes erreurs
+    for field, value in (('priority', 'invalid'), ('status', 'invalid'), ('priority', ['high'])):
+        try:
+            Task.from_dict(dict(data, **{field: value}))
+            assert False, "ValueError attendue"
+        except ValueError:
+            pass
+    try:
+        Task.from_dict({k: v for k, v in data.items() if k != 'created_at'})
+        assert False, "KeyError attendue"
+    except KeyError:
+        pass
+    print("✅ from_dict fonctionne")
+    print()
+
+
 if __name__ == "__main__":
     print("🚀 Démarrage des tests du gestionnaire de tâches\n")
     
@@ -191,5 +250,7 @@ if __name__ == "__main__":
     test_task_all_statuses()
     test_task_all_priorities()
     test_task_with_none_values()
+    test_task_slots()
+    test_from_dict_fast_path()
     
     print("✅ Tous les tests ont été exécutés avec succès!") 
\ No newline at end of file